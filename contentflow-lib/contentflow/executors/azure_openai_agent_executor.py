@@ -1,13 +1,19 @@
 """AI Agent executor using AzureOpenAIResponsesClient from agent-framework."""
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 
 try:
     from agent_framework.openai import OpenAIChatClient
-    from agent_framework import Agent, AgentResponse
+    from agent_framework import Agent, AgentResponse, WorkflowContext
 except ImportError:
     raise ImportError(
         "agent-framework import error. Either the library is not installed or there is \
@@ -16,10 +22,108 @@ except ImportError:
     
 from ..utils.credential_provider import get_azure_credential
 from . import ParallelExecutor
-from ..models import Content
+from ..models import Content, ExecutorLogEntry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from json_repair import repair_json
+except ImportError:
+    repair_json = None
 
 logger = logging.getLogger("contentflow.executors.azure_openai_agent_executor")
 
+# Decodes the first complete JSON value at an offset, ignoring what follows
+_JSON_DECODER = json.JSONDecoder()
+_BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def _loads(json_str: str) -> Any:
+    """Parse JSON with orjson when it is installed, falling back to json."""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+def _batch_response_format(response_format: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a response format so the response holds a results array of it."""
+    if response_format.get("type") != "json_schema":
+        return response_format
+    json_schema = response_format["json_schema"]
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            **json_schema,
+            "name": f"{json_schema.get('name', 'response')}_batch",
+            "schema": {
+                "type": "object",
+                "properties": {"results": {"type": "array", "items": json_schema["schema"]}},
+                "required": ["results"],
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+def _strip_trailing_comma(chars: List[str]) -> None:
+    """Remove trailing whitespace and one trailing comma from a char list."""
+    while chars and chars[-1].isspace():
+        chars.pop()
+    if chars and chars[-1] == ',':
+        chars.pop()
+
+
+def _repair_json(json_str: str) -> str:
+    """
+    Repair near-miss JSON starting at an opening brace.
+    
+    Uses json_repair when it is installed. Otherwise drops trailing commas
+    and closes strings, arrays and objects left open, which covers
+    responses cut off by max_tokens. Text after the first complete value
+    is discarded.
+    """
+    if repair_json is not None:
+        return repair_json(json_str)
+    
+    chars: List[str] = []
+    closers: List[str] = []
+    in_string = False
+    escaped = False
+    for ch in json_str:
+        if in_string:
+            chars.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch in '}]':
+            _strip_trailing_comma(chars)
+            if not closers:
+                break
+            chars.append(closers.pop())
+            if not closers:
+                break
+        else:
+            chars.append(ch)
+            if ch == '"':
+                in_string = True
+            elif ch == '{':
+                closers.append('}')
+            elif ch == '[':
+                closers.append(']')
+    
+    if in_string:
+        chars.append('"')
+    if closers:
+        _strip_trailing_comma(chars)
+        chars.extend(reversed(closers))
+    return "".join(chars)
+
 
 class AzureOpenAIAgentExecutor(ParallelExecutor):
     """
@@ -52,9 +156,46 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
           Default: None (uses model default)
         - parse_response_as_json (bool): Parse response as JSON
           Default: False
+        - response_format (dict): Structured output format in the Chat
+          Completions shape, e.g. {"type": "json_schema", "json_schema":
+          {"name": ..., "strict": true, "schema": {...}}} or
+          {"type": "json_object"}
+          Default: None (free-form text)
+        - prompt_cache_key (str): Key routing requests that share the
+          instructions prefix to the same prompt cache
+          Default: None (derived from a hash of the instructions)
+        - request_batch_size (int): Number of content items sent together in
+          one agent request when processing a list. The agent is asked for a
+          JSON array with one response per item; batches whose response cannot
+          be matched to the items are retried one item at a time
+          Default: 1 (one request per item)
+        - execution_mode (str): How agent requests are executed
+          Options: "realtime" (one API call per request),
+                   "batch" (lists are submitted as one Azure OpenAI Batch API
+                   job; see flush() for how results are collected)
+          Default: "realtime"
+        - batch_completion_window (str): Completion window of batch jobs
+          Default: "24h"
+        - batch_poll_seconds (int): Initial wait between batch job status
+          checks; grows by retry_backoff_factor up to 15 minutes
+          Default: 60
+        - batch_wait_seconds (int): How long a pipeline step blocks waiting
+          for a submitted batch job to finish. Items whose job is still
+          running are returned pending, with the job reference stored in
+          data["<output_field>_batch"]; they are collected by flush() or by
+          running them through this executor again
+          Default: 0 (submit and return without waiting)
+        - response_cache_size (int): Number of responses kept in an LRU cache
+          shared by all agent executors, keyed by a hash of the instructions
+          and the query plus the model settings, so repeated inputs are not
+          sent again. Identical queries in flight at the same time share one
+          request. Not used with include_full_response. 0 disables the cache.
+          Default: 0
         - max_retries (int): Max retries on transient errors
           Default: 3
-        - retry_backoff_seconds (int): Initial backoff seconds for retries
+        - retry_backoff_seconds (int): Initial backoff seconds for retries.
+          Each wait is randomized between 0.5x and 1.5x, so concurrent
+          requests failing together do not retry in lockstep
           Default: 1
         - retry_backoff_factor (int): Backoff multiplier for retries
           Default: 2
@@ -86,6 +227,13 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
         - summary_data['agent_execution_status']: Execution status
     """
     
+    # Executors that post-process each item's response in process_content_item
+    # set this to False, since batched requests and batch jobs bypass that method
+    supports_request_batching = True
+    
+    # Responses shared across instances; see the response_cache_size setting
+    _response_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+    
     def __init__(
         self,
         id: str,
@@ -111,10 +259,45 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
         self.max_tokens = self.get_setting("max_tokens", default=None)
         self.parse_response_as_json = self.get_setting("parse_response_as_json", default=False)
         
+        # The instructions are a static prefix of every request, so requests
+        # with the same instructions can be served from the prompt cache
+        self.prompt_cache_key = self.get_setting("prompt_cache_key", default=None)
+        if not self.prompt_cache_key:
+            self.prompt_cache_key = hashlib.blake2b(
+                self.instructions.encode("utf-8"), digest_size=16
+            ).hexdigest()
+        self._run_options = {"store": False, "prompt_cache_key": self.prompt_cache_key}
+        
+        # Batched requests wrap the per-item format in a results array
+        self.response_format = self.get_setting("response_format", default=None)
+        self._batch_run_options = self._run_options
+        if self.response_format:
+            self._run_options = {**self._run_options, "response_format": self.response_format}
+            self._batch_run_options = {
+                **self._run_options,
+                "response_format": _batch_response_format(self.response_format),
+            }
+        
+        self.request_batch_size = self.get_setting("request_batch_size", default=1)
+        self.response_cache_size = int(self.get_setting("response_cache_size", default=0))
+        self._response_format_key = (
+            json.dumps(self.response_format, sort_keys=True) if self.response_format else None
+        )
+        self.execution_mode = self.get_setting("execution_mode", default="realtime")
+        self.batch_completion_window = self.get_setting("batch_completion_window", default="24h")
+        self.batch_poll_seconds = self.get_setting("batch_poll_seconds", default=60)
+        self.batch_wait_seconds = self.get_setting("batch_wait_seconds", default=0)
+        self._batch_field = f"{self.output_field}_batch"
+        
         self.max_retries = self.get_setting("max_retries", default=3)
         self.retry_backoff_seconds = self.get_setting("retry_backoff_seconds", default=1)
         self.retry_backoff_factor = self.get_setting("retry_backoff_factor", default=2)
         
+        if self.execution_mode not in ["realtime", "batch"]:
+            raise ValueError(f"{self.id}: Invalid execution_mode '{self.execution_mode}'")
+        if self.execution_mode == "batch" and not self.supports_request_batching:
+            raise ValueError(f"{self.id}: execution_mode 'batch' is not supported by this executor")
+        
         # validate credential
         if self.credential_type not in ["default_azure_credential", "azure_key_credential"]:
             raise ValueError(f"{self.id}: Invalid credential_type '{self.credential_type}'")
@@ -124,13 +307,37 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
                 raise ValueError(f"{self.id}: api_key must be provided for azure_key_credential")
         
         self.agent: Optional[Agent] = None
+        self._chat_client: Optional[OpenAIChatClient] = None
+        # Futures of uncached queries currently sent to the agent
+        self._pending_responses: Dict[Tuple[Any, ...], asyncio.Future] = {}
         
-        if self.debug_mode:
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"AzureOpenAIAgentExecutor {self.id} initialized: "
-                f"instructions='{self.instructions[:50]}...', deployment_name={self.deployment_name}"
+                "AzureOpenAIAgentExecutor %s initialized: instructions='%.50s...', deployment_name=%s",
+                self.id, self.instructions, self.deployment_name
             )
     
+    @staticmethod
+    def _task_settings(
+        settings: Dict[str, Any],
+        instructions: str,
+        output_field: str,
+        parse_response_as_json: bool
+    ) -> Dict[str, Any]:
+        """
+        Complete the settings of a task-specific executor before calling
+        AzureOpenAIAgentExecutor.__init__.
+        
+        Defaults input_field to "text" and output_field to the task's field,
+        and sets the rendered instructions and response parsing, which the
+        task controls.
+        """
+        settings.setdefault("input_field", "text")
+        settings.setdefault("output_field", output_field)
+        settings["instructions"] = instructions
+        settings["parse_response_as_json"] = parse_response_as_json
+        return settings
+    
     def __init_agent(self) -> Agent:
         """Initialize the AI agent."""
         
@@ -142,6 +349,7 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
         client_kwargs["api_key"] = self.api_key if self.credential_type == "azure_key_credential" else None
         
         client = OpenAIChatClient(**client_kwargs)
+        self._chat_client = client
         
         # Create agent
         agent_kwargs = {
@@ -166,50 +374,19 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
         """
         
         try:
-            if not content or not content.data:
-                raise ValueError("Content must have data")
+            query = self._get_query(content)
             
-            # Get input for the agent
-            query = None
+            local_response = self._get_local_response(content, query)
+            if local_response is not None:
+                self._store_response(content, local_response, None)
+                return content
             
-            # Otherwise use simple text input
-            query = self.try_extract_nested_field_from_content(
-                content=content, 
-                field_path=self.input_field
-            )
-            if query is not None:
-                if not isinstance(query, str):
-                    query = str(query)
-            else:
-                raise ValueError(
-                    f"Content missing required input. "
-                    f"Field '{self.input_field}' not found."
-                )
-            
-            if self.debug_mode:
-                if query:
-                    logger.debug(f"Processing content {content.id} with query: {query[:100]}...")
+            if self.debug_mode and query and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing content %s with query: %.100s...", content.id, query)
             
             # Execute agent
             response_text, full_response = await self._run_agent(query)
-            # Parse response as JSON if needed
-            if self.parse_response_as_json:
-                parsed_response = self._parse_agent_response_as_json(response_text)
-                if parsed_response is not None:
-                    response_text = parsed_response
-            
-            # Store response
-            content.data[self.output_field] = response_text
-            
-            if self.include_full_response:
-                content.data[f"{self.output_field}_agent_full_response"] = full_response.to_dict()
-            
-            # Update summary
-            content.summary_data['agent_execution_status'] = "success"
-            content.summary_data['response_length'] = len(response_text) if response_text else 0
-            
-            if self.debug_mode:
-                logger.debug(f"Agent response for {content.id}: {response_text[:100]}...")
+            self._store_response(content, response_text, full_response)
 
         except Exception as e:
             logger.error(
@@ -222,18 +399,478 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
         
         return content
     
+    def _get_query(self, content: Content) -> str:
+        """Extract the agent input text from a content item."""
+        if not content or not content.data:
+            raise ValueError("Content must have data")
+        
+        query = self.try_extract_nested_field_from_content(
+            content=content, 
+            field_path=self.input_field
+        )
+        if query is None:
+            raise ValueError(
+                f"Content missing required input. "
+                f"Field '{self.input_field}' not found."
+            )
+        if not isinstance(query, str):
+            query = str(query)
+        return query
+    
+    def _get_local_response(self, content: Content, query: str) -> Optional[Any]:
+        """
+        Return the response for a query that needs no agent call, or None.
+        
+        Subclasses override this to skip requests whose result is known
+        without asking the model. The base executor sends every query.
+        """
+        return None
+    
+    def _try_local_response(self, content: Content) -> bool:
+        """
+        Store the local response for a content item if it has one.
+        
+        Used by the batched paths, which do not go through
+        process_content_item. Returns True when no agent call is needed.
+        """
+        start_time = datetime.now()
+        try:
+            query = self._get_query(content)
+        except ValueError:
+            # Left to the regular path, which records the error
+            return False
+        
+        local_response = self._get_local_response(content, query)
+        if local_response is None:
+            return False
+        
+        self._store_response(content, local_response, None)
+        content.executor_logs.append(ExecutorLogEntry(
+            executor_id=self.id,
+            start_time=start_time,
+            end_time=datetime.now(),
+            status="completed",
+            details={},
+            errors=[]
+        ))
+        return True
+    
+    def _store_response(
+        self,
+        content: Content,
+        response_text: Any,
+        full_response: Optional[AgentResponse]
+    ) -> None:
+        """Store the agent response for a content item and update its summary."""
+        # Parse response as JSON if needed
+        if self.parse_response_as_json and isinstance(response_text, str):
+            parsed_response = self._parse_agent_response_as_json(response_text)
+            if parsed_response is not None:
+                response_text = parsed_response
+        
+        # Store response
+        content.data[self.output_field] = response_text
+        
+        if self.include_full_response:
+            content.data[f"{self.output_field}_agent_full_response"] = (
+                full_response.to_dict() if hasattr(full_response, "to_dict") else full_response
+            )
+        
+        # Update summary
+        content.summary_data['agent_execution_status'] = "success"
+        content.summary_data['response_length'] = len(response_text) if response_text else 0
+        
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Agent response for %s: %.100s...", content.id, response_text)
+    
+    async def process_input(
+        self,
+        input: Union[Content, List[Content]],
+        ctx: WorkflowContext[Union[Content, List[Content]], Union[Content, List[Content]]]
+    ) -> Union[Content, List[Content]]:
+        """
+        Process content items, sending up to request_batch_size items per
+        agent request when batching is enabled.
+        """
+        if self.execution_mode == "batch":
+            items = input if isinstance(input, list) else [input]
+            # Items submitted by an earlier run are collected, not resubmitted
+            submitted = [content for content in items if content.data.get(self._batch_field)]
+            fresh = [content for content in items if not content.data.get(self._batch_field)]
+            if submitted:
+                await self.flush(submitted)
+            await self._process_with_batch_api(
+                [content for content in fresh if not self._try_local_response(content)]
+            )
+            return input
+        
+        if (
+            not isinstance(input, list)
+            or len(input) <= 1
+            or self.request_batch_size <= 1
+            or not self.supports_request_batching
+        ):
+            return await super().process_input(input, ctx)
+        
+        pending = [content for content in input if not self._try_local_response(content)]
+        batch_size = self.request_batch_size
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent))
+        
+        async def process_with_semaphore(batch: List[Content]) -> List[Content]:
+            async with semaphore:
+                return await self._process_batch_internal(batch)
+        
+        await asyncio.gather(*(process_with_semaphore(batch) for batch in batches))
+        return input
+    
+    async def _process_batch_internal(self, batch: List[Content]) -> List[Content]:
+        """
+        Process a batch of content items with a single agent request.
+        
+        Falls back to processing the items one by one when the batch request
+        fails or its response does not hold one result per item.
+        """
+        if len(batch) == 1:
+            return [await self._process_content_item_internal(batch[0])]
+        
+        start_time = datetime.now()
+        try:
+            queries = [self._get_query(content) for content in batch]
+            options = self._batch_run_options
+            if self.max_tokens:
+                # The response limit applies per item
+                options = {**options, "max_tokens": self.max_tokens * len(batch)}
+            response_text, full_response = await asyncio.wait_for(
+                self._run_agent(self._build_batch_query(queries), options),
+                timeout=self.timeout_secs
+            )
+            responses = self._parse_batch_response(response_text, len(batch))
+            if responses is None:
+                raise ValueError(f"Expected a JSON array of {len(batch)} responses")
+        except Exception as e:
+            logger.warning(
+                f"{self.id} - Batch request for {len(batch)} items failed, "
+                f"processing them individually: {e}"
+            )
+            return [await self._process_content_item_internal(content) for content in batch]
+        
+        end_time = datetime.now()
+        for content, response in zip(batch, responses):
+            if not self.parse_response_as_json and not isinstance(response, str):
+                response = json.dumps(response)
+            try:
+                self._store_response(content, response, full_response)
+            except ValueError as e:
+                # The executor rejected this item's response; ask again for it alone
+                logger.warning(
+                    f"{self.id} - Unusable batch response for content {content.id}, "
+                    f"processing it individually: {e}"
+                )
+                await self._process_content_item_internal(content)
+                continue
+            content.executor_logs.append(ExecutorLogEntry(
+                executor_id=self.id,
+                start_time=start_time,
+                end_time=end_time,
+                status="completed",
+                details={"request_batch_size": len(batch)},
+                errors=[]
+            ))
+        
+        return batch
+    
+    def _build_batch_query(self, queries: List[str]) -> str:
+        """Build one agent query asking for a JSON array of per-item responses."""
+        element = "JSON object" if self.parse_response_as_json else "string"
+        if self.response_format:
+            container = f'a JSON object {{"results": [...]}} whose results array has exactly {len(queries)} elements'
+        else:
+            container = f"a JSON array of exactly {len(queries)} elements"
+        parts = [
+            f"Apply your instructions to each of the {len(queries)} items below independently. "
+            f"Respond only with {container}, where element i is the complete response for "
+            f"item i as a {element}."
+        ]
+        for index, query in enumerate(queries, start=1):
+            parts.append(f"### Item {index}\n{query}")
+        return "\n\n".join(parts)
+    
+    def _parse_batch_response(self, response_text: str, count: int) -> Optional[List[Any]]:
+        """
+        Parse a batch response into a list of per-item responses.
+        
+        Returns None unless the response holds a JSON array of count elements.
+        """
+        if not isinstance(response_text, str):
+            return None
+        start = response_text.find('[')
+        end = response_text.rfind(']')
+        if start == -1 or end == -1:
+            return None
+        try:
+            try:
+                responses = _loads(response_text[start:end+1])
+            except json.JSONDecodeError:
+                responses = _JSON_DECODER.raw_decode(response_text, start)[0]
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(responses, list) or len(responses) != count:
+            return None
+        return responses
+    
+    async def _process_with_batch_api(self, items: List[Content]) -> List[Content]:
+        """
+        Submit content items as a single Azure OpenAI Batch API job.
+        
+        Requests are uploaded as a JSONL file and each submitted item is
+        marked pending with a reference to its request in the job. The job is
+        then flushed, which waits for it at most batch_wait_seconds.
+        """
+        start_time = datetime.now()
+        requests = []
+        for index, content in enumerate(items):
+            try:
+                query = self._get_query(content)
+            except ValueError:
+                # Fails again before any API call and records the error
+                await self._process_content_item_internal(content)
+                continue
+            requests.append((f"item-{index}", content, query))
+        
+        if not requests:
+            return items
+        
+        openai_client = self._get_openai_client()
+        
+        lines = []
+        for custom_id, _, query in requests:
+            body = {
+                "model": self.deployment_name,
+                "messages": [
+                    {"role": "system", "content": self.instructions},
+                    {"role": "user", "content": query},
+                ],
+            }
+            if self.temperature is not None:
+                body["temperature"] = self.temperature
+            if self.max_tokens is not None:
+                body["max_tokens"] = self.max_tokens
+            if self.response_format:
+                body["response_format"] = self.response_format
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": body,
+            }))
+        
+        batch_file = await openai_client.files.create(
+            file=(f"{self.id}_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/chat/completions",
+            completion_window=self.batch_completion_window
+        )
+        logger.info(f"{self.id} - Submitted batch {batch.id} with {len(requests)} requests")
+        
+        submitted_time = datetime.now()
+        for custom_id, content, _ in requests:
+            reference = {"batch_id": batch.id, "custom_id": custom_id}
+            content.data[self._batch_field] = reference
+            content.summary_data['agent_execution_status'] = "pending"
+            content.executor_logs.append(ExecutorLogEntry(
+                executor_id=self.id,
+                start_time=start_time,
+                end_time=submitted_time,
+                status="pending",
+                details=dict(reference),
+                errors=[]
+            ))
+        
+        await self.flush([content for _, content, _ in requests])
+        return items
+    
+    async def flush(
+        self,
+        input: Union[Content, List[Content]]
+    ) -> Union[Content, List[Content]]:
+        """
+        Collect the results of Batch API jobs for pending content items.
+        
+        Items are grouped by the job reference stored in
+        data["<output_field>_batch"]; items without one are left untouched.
+        Each job is polled for at most batch_wait_seconds. When it has
+        finished, results are stored on its items and the reference is
+        removed; otherwise the items stay pending and can be flushed again
+        later, including from another process, since the reference travels
+        with the content.
+        """
+        items = input if isinstance(input, list) else [input]
+        by_batch: Dict[str, List[Content]] = {}
+        for content in items:
+            reference = content.data.get(self._batch_field)
+            if reference:
+                by_batch.setdefault(reference["batch_id"], []).append(content)
+        
+        if by_batch:
+            openai_client = self._get_openai_client()
+            await asyncio.gather(*(
+                self._flush_batch(openai_client, batch_id, contents)
+                for batch_id, contents in by_batch.items()
+            ))
+        return input
+    
+    async def _flush_batch(self, openai_client: Any, batch_id: str, items: List[Content]) -> None:
+        """Wait up to batch_wait_seconds for one job and collect it if finished."""
+        batch = await openai_client.batches.retrieve(batch_id)
+        deadline = time.monotonic() + self.batch_wait_seconds
+        poll_seconds = self.batch_poll_seconds
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.info(
+                    f"{self.id} - Batch {batch_id} is still '{batch.status}'; "
+                    f"{len(items)} items stay pending until flushed again"
+                )
+                return
+            await asyncio.sleep(min(poll_seconds, remaining))
+            poll_seconds = min(poll_seconds * self.retry_backoff_factor, 900)
+            batch = await openai_client.batches.retrieve(batch_id)
+        
+        # Expired or cancelled jobs may still have completed part of the requests
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await openai_client.files.content(file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                row = _loads(line)
+                response = row.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[row["custom_id"]] = response["body"]
+                else:
+                    errors[row["custom_id"]] = str(row.get("error") or response.get("body"))
+        
+        end_time = datetime.now()
+        for content in items:
+            custom_id = content.data.pop(self._batch_field)["custom_id"]
+            body = results.get(custom_id)
+            if body is not None:
+                try:
+                    self._store_response(content, body["choices"][0]["message"]["content"], body)
+                except ValueError as e:
+                    errors[custom_id] = str(e)
+                    body = None
+            
+            error = None
+            if body is None:
+                error = errors.get(custom_id, f"Batch {batch_id} ended with status '{batch.status}'")
+                logger.error(f"{self.id} - Batch request failed for content {content.id}: {error}")
+            self._finish_batch_log(content, batch_id, end_time, error)
+            if error is not None and self.fail_pipeline_on_error:
+                raise RuntimeError(f"{self.id}: Batch request failed for content {content.id}: {error}")
+    
+    def _finish_batch_log(
+        self,
+        content: Content,
+        batch_id: str,
+        end_time: datetime,
+        error: Optional[str]
+    ) -> None:
+        """Complete the pending log entry of a batch item, or add one if it has none."""
+        entry = next(
+            (
+                log for log in reversed(content.executor_logs)
+                if log.executor_id == self.id and log.status == "pending"
+            ),
+            None
+        )
+        if entry is None:
+            entry = ExecutorLogEntry(executor_id=self.id, start_time=end_time)
+            content.executor_logs.append(entry)
+        entry.end_time = end_time
+        entry.status = "completed" if error is None else "failed"
+        entry.details = {"batch_id": batch_id}
+        entry.errors = [] if error is None else [error]
+    
+    def _get_openai_client(self) -> Any:
+        """Get the AsyncAzureOpenAI client behind the agent's chat client."""
+        if self._chat_client is None:
+            self.__init_agent()
+        return self._chat_client.client
+    
     async def _run_agent(
         self,
         query: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
     ) -> tuple[str, AgentResponse]:
-        """Run agent in non-streaming mode.
+        """Run agent in non-streaming mode, reusing cached responses.
         
         Args:
             query: Simple text query
+            options: Run options; defaults to the per-item options
             
         Returns:
-            Tuple of (response_text, full_response)
+            Tuple of (response_text, full_response). full_response is None
+            when the response comes from the cache.
+        """
+        key = self._response_cache_key(query)
+        if key is None:
+            return await self._call_agent(query, options)
+        
+        if key in self._response_cache:
+            self._response_cache.move_to_end(key)
+            return self._response_cache[key], None
+        
+        pending = self._pending_responses.get(key)
+        if pending is not None:
+            response_text = await pending
+            if response_text is not None:
+                return response_text, None
+            # The shared request failed; try on our own
+            return await self._call_agent(query, options)
+        
+        pending = asyncio.get_running_loop().create_future()
+        self._pending_responses[key] = pending
+        response_text = None
+        try:
+            response_text, result = await self._call_agent(query, options)
+            self._response_cache[key] = response_text
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+        finally:
+            del self._pending_responses[key]
+            pending.set_result(response_text)
+        
+        return response_text, result
+    
+    def _response_cache_key(self, query: Optional[str]) -> Optional[Tuple[Any, ...]]:
         """
+        Key a response by a hash of the instructions and the query, and by
+        the model settings that shape it. Returns None when caching is
+        disabled.
+        """
+        if self.response_cache_size <= 0 or self.include_full_response or query is None:
+            return None
+        digest = hashlib.blake2b(
+            self.instructions.encode("utf-8") + b"\x00" + query.encode("utf-8"),
+            digest_size=16
+        ).digest()
+        return (self.endpoint, self.deployment_name, self.temperature, self.max_tokens, self._response_format_key, digest)
+    
+    async def _call_agent(
+        self,
+        query: Optional[str],
+        options: Optional[Dict[str, Any]] = None
+    ) -> tuple[str, AgentResponse]:
+        """Send a query to the agent, retrying transient errors."""
         retries = 0
         backoff = self.retry_backoff_seconds
         result: AgentResponse = None
@@ -244,7 +881,7 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
         
         while True:
             try:
-                result = await self.agent.run(messages=query, options={"store": False})
+                result = await self.agent.run(messages=query, options=options or self._run_options)
                 break
             except Exception as e:
                 if retries >= self.max_retries:
@@ -258,7 +895,7 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
                         logger.info(f"{self.id} - Re-initializing agent due to unauthorized error.")
                         self.__init_agent()
                     
-                    await asyncio.sleep(backoff)
+                    await asyncio.sleep(backoff * random.uniform(0.5, 1.5))
                     backoff *= self.retry_backoff_factor
                     retries += 1
         
@@ -270,17 +907,42 @@ class AzureOpenAIAgentExecutor(ParallelExecutor):
         self,
         response_text: str
     ) -> Any:
-        """Parse agent response text as JSON."""
-        import json
+        """
+        Parse agent response text as JSON.
+        
+        The span from the first '{' to the last '}' is parsed first, with
+        orjson when installed. If that fails, e.g. because an explanation
+        after the object contains braces of its own, only the first
+        complete object starting at the first '{' is decoded. Malformed or
+        truncated objects are then repaired, so the response is not lost.
+        """
+        if not isinstance(response_text, str):
+            return None
+        
+        # Look for JSON block in the response
+        start = response_text.find('{')
+        if start == -1:
+            return None
+        
+        end = response_text.rfind('}')
+        if end != -1:
+            try:
+                return _loads(response_text[start:end+1])
+            except json.JSONDecodeError:
+                pass
+            try:
+                return _JSON_DECODER.raw_decode(response_text, start)[0]
+            except json.JSONDecodeError:
+                pass
+        
         try:
-            if isinstance(response_text, str):
-                # Look for JSON block in the response
-                start = response_text.find('{')
-                end = response_text.rfind('}')
-                if start != -1 and end != -1:
-                    json_str = response_text[start:end+1]
-                    parsed = json.loads(json_str)
-                    return parsed
+            parsed = _loads(_repair_json(response_text[start:]))
         except json.JSONDecodeError as e:
             logger.error(f"{self.id}: Failed to parse agent response as JSON: {e}")
-            return None
\ No newline at end of file
+            return None
+        if not isinstance(parsed, dict):
+            logger.error(f"{self.id}: Failed to parse agent response as JSON object")
+            return None
+        
+        logger.debug("%s: Repaired malformed JSON in agent response", self.id)
+        return parsed
\ No newline at end of file
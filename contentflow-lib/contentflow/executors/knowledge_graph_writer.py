@@ -6,7 +6,8 @@ building a comprehensive and evolving knowledge graph of business content.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
 from agent_framework import WorkflowContext
@@ -42,6 +43,23 @@ class KnowledgeGraphWriterExecutor(ParallelExecutor):
         batch_size: Number of entities to write per batch
     """
     
+    # Parent executors keep a __dict__; slotting this executor's own
+    # attributes keeps their storage and lookup off it.
+    __slots__ = (
+        "gremlin_endpoint",
+        "gremlin_database",
+        "gremlin_collection",
+        "gremlin_username",
+        "gremlin_password",
+        "input_field",
+        "merge_strategy",
+        "enable_deduplication",
+        "add_timestamps",
+        "batch_size",
+        "output_field",
+        "_connector",
+    )
+    
     def __init__(
         self,
         id: str,
@@ -205,7 +223,8 @@ class KnowledgeGraphWriterExecutor(ParallelExecutor):
     async def _write_relationship(
         self,
         connector: CosmosGremlinConnector,
-        relationship: Dict[str, Any]
+        relationship: Dict[str, Any],
+        known_vertex_ids: Optional[Set[str]] = None
     ) -> bool:
         """
         Write a single relationship to the graph.
@@ -213,6 +232,8 @@ class KnowledgeGraphWriterExecutor(ParallelExecutor):
         Args:
             connector: Gremlin connector
             relationship: Relationship data
+            known_vertex_ids: IDs of vertices written in this call; existence
+                lookups are skipped for these endpoints
             
         Returns:
             True if successful
@@ -227,15 +248,14 @@ class KnowledgeGraphWriterExecutor(ParallelExecutor):
                 logger.warning("Relationship missing from/to entity IDs, skipping")
                 return False
             
-            # Check if both vertices exist
-            from_vertex = await connector.get_vertex(from_id)
-            to_vertex = await connector.get_vertex(to_id)
+            # Check if both vertices exist (only for endpoints not co-written)
+            known_vertex_ids = known_vertex_ids or set()
             
-            if not from_vertex:
+            if from_id not in known_vertex_ids and not await connector.get_vertex(from_id):
                 logger.warning(f"Source vertex {from_id} not found, skipping relationship")
                 return False
             
-            if not to_vertex:
+            if to_id not in known_vertex_ids and not await connector.get_vertex(to_id):
                 logger.warning(f"Target vertex {to_id} not found, skipping relationship")
                 return False
             
@@ -264,6 +284,63 @@ class KnowledgeGraphWriterExecutor(ParallelExecutor):
             )
             return False
     
+    async def _write_batch(
+        self,
+        connector: CosmosGremlinConnector,
+        items: List[Dict[str, Any]],
+        write_fn
+    ) -> Tuple[int, int]:
+        """
+        Write a batch of graph items one at a time.
+        
+        Items are written sequentially: each write reads the graph before
+        changing it (get_vertex, then add/update/drop), so concurrent writes
+        of items with the same id would race each other.
+        
+        Args:
+            connector: Gremlin connector
+            items: Entities or relationships to write
+            write_fn: Per-item write coroutine (returns True on success)
+            
+        Returns:
+            Tuple of (written_count, error_count)
+        """
+        written = 0
+        for item in items:
+            if await write_fn(connector, item):
+                written += 1
+        return written, len(items) - written
+    
+    async def _write_in_batches(
+        self,
+        connector: CosmosGremlinConnector,
+        items: List[Dict[str, Any]],
+        write_fn
+    ) -> Tuple[int, int]:
+        """
+        Write graph items in batches of ``batch_size``.
+        
+        Each batch reports its own ``(written, errors)`` tuple and the totals
+        are summed once at the end instead of being accumulated per item.
+        
+        Args:
+            connector: Gremlin connector
+            items: Entities or relationships to write
+            write_fn: Per-item write coroutine (returns True on success)
+            
+        Returns:
+            Tuple of (written_count, error_count)
+        """
+        if not items:
+            return 0, 0
+        
+        batch_size = max(1, int(self.batch_size))
+        results = [
+            await self._write_batch(connector, items[i:i + batch_size], write_fn)
+            for i in range(0, len(items), batch_size)
+        ]
+        return tuple(map(sum, zip(*results)))
+    
     async def process_content_item(
         self,
         content: Content,
@@ -311,26 +388,35 @@ class KnowledgeGraphWriterExecutor(ParallelExecutor):
             # Get connector
             connector = await self._get_connector()
             
-            # Write entities
-            entities_written = 0
-            for entity in entities:
-                success = await self._write_entity(connector, entity)
-                if success:
-                    entities_written += 1
+            # Write entities, remembering which vertices are now in the graph
+            written_vertex_ids: Set[str] = set()
             
-            # Write relationships
-            relationships_written = 0
-            for relationship in relationships:
-                success = await self._write_relationship(connector, relationship)
+            async def write_entity(conn: CosmosGremlinConnector, entity: Dict[str, Any]) -> bool:
+                success = await self._write_entity(conn, entity)
                 if success:
-                    relationships_written += 1
+                    written_vertex_ids.add(entity["id"])
+                return success
+            
+            entities_written, entities_failed = await self._write_in_batches(
+                connector, entities, write_entity
+            )
+            
+            # Write relationships; edges between co-written entities go
+            # straight to addE without re-reading their endpoints
+            relationships_written, relationships_failed = await self._write_in_batches(
+                connector,
+                relationships,
+                partial(self._write_relationship, known_vertex_ids=written_vertex_ids)
+            )
             
             # Store statistics
             stats = {
                 "entities_written": entities_written,
                 "entities_total": len(entities),
+                "entities_failed": entities_failed,
                 "relationships_written": relationships_written,
                 "relationships_total": len(relationships),
+                "relationships_failed": relationships_failed,
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -16,16 +16,21 @@ scenarios such as:
 - Fan-out/fan-in patterns with dynamic parallelism
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Callable
-from datetime import datetime
+import os
+import re
+import sys
+import time
+from array import array
+from collections import defaultdict
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from agent_framework import Executor, handler, WorkflowContext, WorkflowExecutor, Workflow
 from typing_extensions import Never
 
 try:
-    import sys
-    import os
     doc_proc_lib_path = os.path.join(os.path.dirname(__file__), "../../../doc-proc-lib")
     if os.path.exists(doc_proc_lib_path):
         sys.path.insert(0, doc_proc_lib_path)
@@ -40,6 +45,44 @@ from doc_proc_workflow.executors.base import DocumentExecutor
 
 logger = logging.getLogger("doc_proc_workflow.executors.parallel")
 
+_WORD_PATTERN = re.compile(r"\S+")
+_CONCATENATE_SEPARATOR = "\n\n"
+
+
+async def _dispatch_in_batches(
+    ctx: WorkflowContext,
+    documents: Iterable[Document],
+    target_id: str,
+    batch_size: int
+) -> int:
+    """
+    Send documents to a target executor in gathered batches.
+    
+    Each batch of up to ``batch_size`` documents is submitted with a single
+    ``asyncio.gather`` rather than one awaited send per document. Documents
+    are pulled from the iterable one batch at a time, so lazily built
+    documents are only materialised as they are sent.
+    
+    Sends are not routed through a dispatcher task that outlives the call:
+    ``send_message`` is bound to the ``WorkflowContext`` of the current
+    invocation, and a per-call queue and task would only add setup cost.
+    
+    Args:
+        ctx: Workflow context used to send messages
+        documents: Documents to send
+        target_id: ID of the executor receiving the documents
+        batch_size: Number of sends submitted together
+        
+    Returns:
+        Number of documents dispatched
+    """
+    dispatched = 0
+    documents = iter(documents)
+    while batch := list(islice(documents, batch_size)):
+        await asyncio.gather(*(ctx.send_message(doc, target_id=target_id) for doc in batch))
+        dispatched += len(batch)
+    return dispatched
+
 
 class ExcelRowProcessor(Executor):
     """
@@ -80,7 +123,8 @@ class ExcelRowProcessor(Executor):
         Args:
             sub_workflow: Workflow to execute for each row
             excel_key: Key in document.data containing Excel data (list of dicts)
-            max_parallel: Maximum number of rows to process in parallel
+            max_parallel: Maximum number of rows to process in parallel; also the
+                number of row messages submitted together per batch
             row_key: Key to store row data in spawned documents
             executor_id: Unique executor identifier
         """
@@ -108,7 +152,7 @@ class ExcelRowProcessor(Executor):
             document: Document containing Excel data
             ctx: Workflow context
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         # Extract Excel data
         excel_data = document.data.get(self.excel_key, [])
@@ -117,62 +161,63 @@ class ExcelRowProcessor(Executor):
             await ctx.yield_output([])
             return
         
+        # Hoist values read for every row out of the row loop
+        doc_id = document.id
+        total_rows = len(excel_data)
+        row_key = self.row_key
+        
         logger.info(
-            f"Processing {len(excel_data)} Excel rows from document {document.id}"
+            "Processing %d Excel rows from document %s", total_rows, doc_id
         )
         
-        # Create a document for each row
-        row_documents = []
-        for idx, row_data in enumerate(excel_data):
-            row_doc = Document(
-                id=f"{document.id}_row_{idx}",
-                data={
-                    self.row_key: row_data,
-                    "source_document_id": document.id,
-                    "row_index": idx,
-                    "total_rows": len(excel_data)
-                },
-                summary_data={
-                    "row_number": idx + 1,
-                    "parent_document": document.id
-                }
-            )
-            row_documents.append(row_doc)
-        
-        # Process rows in batches for controlled parallelism
-        results = []
-        batch_size = self.max_parallel
+        # Create a document for each row; the fields shared by every row are
+        # built once and shallow-copied per row
+        base_data = {
+            "source_document_id": doc_id,
+            "total_rows": total_rows
+        }
+        base_summary = {"parent_document": doc_id}
         
-        for batch_start in range(0, len(row_documents), batch_size):
-            batch_end = min(batch_start + batch_size, len(row_documents))
-            batch = row_documents[batch_start:batch_end]
+        def make_row_document(idx: int, row_data: Any) -> Document:
+            data = base_data.copy()
+            data[row_key] = row_data
+            data["row_index"] = idx
             
-            logger.info(
-                f"Processing batch {batch_start//batch_size + 1}: "
-                f"rows {batch_start + 1}-{batch_end}"
-            )
+            summary_data = base_summary.copy()
+            summary_data["row_number"] = idx + 1
             
-            # Send each row to the sub-workflow
-            for row_doc in batch:
-                await ctx.send_message(row_doc, target_id=self.workflow_executor.id)
+            return Document(
+                id=f"{doc_id}_row_{idx}",
+                data=data,
+                summary_data=summary_data
+            )
+        
+        # Row documents are built as each batch is dispatched instead of
+        # being collected into a list first
+        rows_dispatched = await _dispatch_in_batches(
+            ctx,
+            (make_row_document(idx, row_data) for idx, row_data in enumerate(excel_data)),
+            self.workflow_executor.id,
+            self.max_parallel
+        )
         
         # Note: Results will be collected by the aggregator
         # This is a fan-out pattern - aggregation happens downstream
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
         logger.info(
-            f"Dispatched {len(row_documents)} rows for processing in {elapsed:.2f}s"
+            "Dispatched %d rows for processing in %.2fs", rows_dispatched, elapsed
         )
         
         # Yield metadata about the processing
         summary_doc = Document(
             id=f"{document.id}_summary",
             data={
-                "total_rows": len(row_documents),
+                "total_rows": rows_dispatched,
                 "source_document_id": document.id
             },
             summary_data={
                 "processing_time_secs": elapsed,
-                "rows_processed": len(row_documents)
+                "rows_processed": rows_dispatched
             }
         )
         await ctx.yield_output(summary_doc)
@@ -266,8 +311,8 @@ class DocumentSplitter(DocumentExecutor):
         document.summary_data["total_chunks"] = len(chunks)
         
         logger.info(
-            f"Split document {document.id} into {len(chunks)} chunks "
-            f"using {self.split_strategy} strategy"
+            "Split document %s into %d chunks using %s strategy",
+            document.id, len(chunks), self.split_strategy
         )
         
         return document
@@ -318,10 +363,11 @@ class DocumentSplitter(DocumentExecutor):
         """Split content by pages (page breaks or character count proxy)."""
         chunks = []
         
-        # Check for explicit page markers
-        if "\f" in content or "\\page" in content:
-            # Split by form feed or page markers
-            pages = content.split("\f") if "\f" in content else content.split("\\page")
+        # Check for explicit page markers, scanning for each marker at most once
+        if content.find("\f") >= 0:
+            pages = content.split("\f")
+        elif content.find("\\page") >= 0:
+            pages = content.split("\\page")
         else:
             # Use character count as proxy (e.g., 3000 chars ≈ 1 page)
             chars_per_page = 3000
@@ -350,21 +396,26 @@ class DocumentSplitter(DocumentExecutor):
         document: Document
     ) -> List[Dict[str, Any]]:
         """Split content by character count."""
-        chunks = []
         total_chars = len(content)
-        
-        for i in range(0, total_chars, self.chunk_size):
-            chunk_content = content[i:i + self.chunk_size]
-            chunks.append({
-                "chunk_id": f"{document.id}_chunk_{i//self.chunk_size}",
-                "content": chunk_content,
-                "start_char": i,
-                "end_char": min(i + self.chunk_size, total_chars),
-                "char_count": len(chunk_content),
-                "chunk_index": i // self.chunk_size
-            })
-        
-        return chunks
+        chunk_size = self.chunk_size
+        doc_id = document.id
+        
+        # Chunk boundaries are precomputed: every chunk but the last ends
+        # exactly chunk_size after its start, so no per-chunk min()/len().
+        starts = range(0, total_chars, chunk_size)
+        ends = chain(range(chunk_size, total_chars, chunk_size), (total_chars,))
+        
+        return [
+            {
+                "chunk_id": f"{doc_id}_chunk_{idx}",
+                "content": content[start:end],
+                "start_char": start,
+                "end_char": end,
+                "char_count": end - start,
+                "chunk_index": idx
+            }
+            for idx, (start, end) in enumerate(zip(starts, ends))
+        ]
     
     def _split_by_words(
         self,
@@ -372,18 +423,27 @@ class DocumentSplitter(DocumentExecutor):
         document: Document
     ) -> List[Dict[str, Any]]:
         """Split content by word count."""
-        words = content.split()
+        # Record (start, end) offsets of each word instead of materialising
+        # a list of word strings; chunks are then sliced straight out of
+        # content, keeping its original whitespace.
+        bounds = array("q")
+        for match in _WORD_PATTERN.finditer(content):
+            bounds.extend(match.span())
+        
+        total_words = len(bounds) // 2
+        chunk_size = self.chunk_size
+        doc_id = document.id
         chunks = []
         
-        for i in range(0, len(words), self.chunk_size):
-            chunk_words = words[i:i + self.chunk_size]
+        for i in range(0, total_words, chunk_size):
+            end_word = min(i + chunk_size, total_words)
             chunks.append({
-                "chunk_id": f"{document.id}_chunk_{i//self.chunk_size}",
-                "content": " ".join(chunk_words),
+                "chunk_id": f"{doc_id}_chunk_{i//chunk_size}",
+                "content": content[bounds[2 * i]:bounds[2 * end_word - 1]],
                 "start_word": i,
-                "end_word": min(i + self.chunk_size, len(words)),
-                "word_count": len(chunk_words),
-                "chunk_index": i // self.chunk_size
+                "end_word": end_word,
+                "word_count": end_word - i,
+                "chunk_index": i // chunk_size
             })
         
         return chunks
@@ -395,20 +455,25 @@ class DocumentSplitter(DocumentExecutor):
     ) -> List[Dict[str, Any]]:
         """Split content by line count."""
         lines = content.split("\n")
-        chunks = []
-        
-        for i in range(0, len(lines), self.chunk_size):
-            chunk_lines = lines[i:i + self.chunk_size]
-            chunks.append({
-                "chunk_id": f"{document.id}_chunk_{i//self.chunk_size}",
-                "content": "\n".join(chunk_lines),
-                "start_line": i + 1,
-                "end_line": min(i + self.chunk_size, len(lines)),
-                "line_count": len(chunk_lines),
-                "chunk_index": i // self.chunk_size
-            })
-        
-        return chunks
+        total_lines = len(lines)
+        chunk_size = self.chunk_size
+        doc_id = document.id
+        
+        # Same precomputed-bounds approach as _split_by_characters
+        starts = range(0, total_lines, chunk_size)
+        ends = chain(range(chunk_size, total_lines, chunk_size), (total_lines,))
+        
+        return [
+            {
+                "chunk_id": f"{doc_id}_chunk_{idx}",
+                "content": "\n".join(lines[start:end]),
+                "start_line": start + 1,
+                "end_line": end,
+                "line_count": end - start,
+                "chunk_index": idx
+            }
+            for idx, (start, end) in enumerate(zip(starts, ends))
+        ]
 
 
 class ChunkProcessor(Executor):
@@ -451,7 +516,8 @@ class ChunkProcessor(Executor):
         
         Args:
             sub_workflow: Workflow to execute for each chunk
-            max_parallel: Maximum number of chunks to process in parallel
+            max_parallel: Maximum number of chunks to process in parallel; also the
+                number of chunk messages submitted together per batch
             executor_id: Unique executor identifier
         """
         super().__init__(id=executor_id)
@@ -484,41 +550,38 @@ class ChunkProcessor(Executor):
             return
         
         logger.info(
-            f"Processing {len(chunks)} chunks from document {document.id}"
+            "Processing %d chunks from document %s", len(chunks), document.id
         )
         
-        # Create a document for each chunk
-        chunk_documents = []
-        for chunk in chunks:
-            chunk_doc = Document(
-                id=chunk.get("chunk_id", f"{document.id}_chunk_{chunk.get('chunk_index')}"),
+        doc_id = document.id
+        
+        def make_chunk_document(chunk: Dict[str, Any]) -> Document:
+            chunk_index = chunk.get("chunk_index")
+            # Only build the fallback ID when the chunk has none
+            chunk_id = chunk.get("chunk_id")
+            if chunk_id is None:
+                chunk_id = f"{doc_id}_chunk_{chunk_index}"
+            
+            return Document(
+                id=chunk_id,
                 data={
                     "chunk_content": chunk.get("content"),
                     "chunk_metadata": chunk,
-                    "source_document_id": document.id
+                    "source_document_id": doc_id
                 },
                 summary_data={
-                    "chunk_index": chunk.get("chunk_index"),
-                    "parent_document": document.id
+                    "chunk_index": chunk_index,
+                    "parent_document": doc_id
                 }
             )
-            chunk_documents.append(chunk_doc)
         
-        # Process chunks in batches
-        batch_size = self.max_parallel
-        for batch_start in range(0, len(chunk_documents), batch_size):
-            batch_end = min(batch_start + batch_size, len(chunk_documents))
-            batch = chunk_documents[batch_start:batch_end]
-            
-            logger.info(
-                f"Processing batch {batch_start//batch_size + 1}: "
-                f"chunks {batch_start + 1}-{batch_end}"
-            )
-            
-            for chunk_doc in batch:
-                await ctx.send_message(chunk_doc, target_id=self.workflow_executor.id)
+        # Chunk documents are built lazily as each batch is dispatched, so
+        # only one batch of them is alive at a time
+        await _dispatch_in_batches(
+            ctx, map(make_chunk_document, chunks), self.workflow_executor.id, self.max_parallel
+        )
         
-        logger.info(f"Dispatched {len(chunk_documents)} chunks for processing")
+        logger.info("Dispatched %d chunks for processing", len(chunks))
 
 
 class ResultAggregator(Executor):
@@ -552,7 +615,8 @@ class ResultAggregator(Executor):
         aggregation_strategy: str = "merge_list",
         expected_count: Optional[int] = None,
         custom_aggregator: Optional[Callable] = None,
-        executor_id: str = "result_aggregator"
+        executor_id: str = "result_aggregator",
+        include_raw_results: bool = False
     ):
         """
         Initialize the result aggregator.
@@ -566,11 +630,14 @@ class ResultAggregator(Executor):
             expected_count: Expected number of results (optional)
             custom_aggregator: Custom aggregation function
             executor_id: Unique executor identifier
+            include_raw_results: Keep every result's data in the "summarize"
+                output; by default only the result IDs are kept
         """
         super().__init__(id=executor_id)
         self.aggregation_strategy = aggregation_strategy
         self.expected_count = expected_count
         self.custom_aggregator = custom_aggregator
+        self.include_raw_results = include_raw_results
         self.collected_results: List[Any] = []
         
         logger.info(
@@ -600,7 +667,7 @@ class ResultAggregator(Executor):
             await ctx.yield_output(empty_doc)
             return
         
-        logger.info(f"Aggregating {len(results)} results")
+        logger.info("Aggregating %d results", len(results))
         
         # Apply aggregation strategy
         if self.aggregation_strategy == "merge_list":
@@ -634,10 +701,10 @@ class ResultAggregator(Executor):
     
     def _concatenate(self, results: List[Document]) -> Document:
         """Concatenate text content from results."""
-        concatenated_content = "\n\n".join([
-            r.data.get("content", "") or r.data.get("chunk_content", "")
+        concatenated_content = _CONCATENATE_SEPARATOR.join(
+            r.data.get("content") or r.data.get("chunk_content") or ""
             for r in results
-        ])
+        )
         
         return Document(
             id="aggregated_results",
@@ -654,21 +721,27 @@ class ResultAggregator(Executor):
     
     def _summarize(self, results: List[Document]) -> Document:
         """Summarize statistics from results."""
-        summary_stats = {
-            "total_results": len(results),
-            "result_ids": [r.id for r in results]
-        }
-        
-        # Collect summary data from all results
+        # Sum numeric summary data from all results in a single pass
+        numeric_sums = defaultdict(int)
+        numeric_sums["total_results"] = len(results)
         for result in results:
             for key, value in result.summary_data.items():
                 if isinstance(value, (int, float)):
-                    if key not in summary_stats:
-                        summary_stats[key] = 0
-                    summary_stats[key] += value
+                    numeric_sums[key] += value
+        
+        result_ids = [r.id for r in results]
+        summary_stats = {"result_ids": result_ids}
+        summary_stats.update(numeric_sums)
+        
+        # The statistics are the output; per-result data is only kept on
+        # request so it does not stay alive past aggregation
+        if self.include_raw_results:
+            data = {"results": [r.data for r in results]}
+        else:
+            data = {"result_ids": result_ids}
         
         return Document(
             id="aggregated_results",
-            data={"results": [r.data for r in results]},
+            data=data,
             summary_data=summary_stats
         )
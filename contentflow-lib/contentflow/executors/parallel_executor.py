@@ -86,31 +86,35 @@ class ParallelExecutor(BaseExecutor, ABC):
         Returns:
             Content item or list of content items with processed content
         """
-        # Handle list of content items with parallel processing
-        if isinstance(input, list):
-            if self.max_concurrent <= 1:
-                # Sequential processing
-                results = []
-                for doc in input:
-                    result = await self._process_content_item_internal(doc)
-                    results.append(result)
-                return results
-            else:
-                # Parallel processing with concurrency control
-                import asyncio
-                
-                semaphore = asyncio.Semaphore(self.max_concurrent)
-                
-                async def process_with_semaphore(doc: Content) -> Content:
-                    async with semaphore:
-                        return await self._process_content_item_internal(doc)
-                
-                tasks = [process_with_semaphore(doc) for doc in input]
-                results = await asyncio.gather(*tasks)
-                return results
-        
         # Single content item processing
-        return await self._process_content_item_internal(input)
+        if not isinstance(input, list):
+            return await self._process_content_item_internal(input)
+        
+        # Sequential processing; also the fast path for lists of zero or one
+        # item, which need no semaphore or gathered tasks
+        if len(input) <= 1 or self.max_concurrent <= 1:
+            return [await self._process_content_item_internal(doc) for doc in input]
+        
+        return await self._process_many(input)
+    
+    async def _process_many(self, input: List[Content]) -> List[Content]:
+        """
+        Process a list of content items in parallel with concurrency control.
+        
+        Args:
+            input: Content items to process
+            
+        Returns:
+            Processed content items, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def process_with_semaphore(doc: Content) -> Content:
+            async with semaphore:
+                return await self._process_content_item_internal(doc)
+        
+        tasks = [process_with_semaphore(doc) for doc in input]
+        return await asyncio.gather(*tasks)
     
     async def _process_content_item_internal(
         self,
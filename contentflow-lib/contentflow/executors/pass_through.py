@@ -67,31 +67,20 @@ class PassThroughExecutor(BaseExecutor):
                 f"{self.id}: Passing through document(s) unchanged."
             )
         
+        # Passing through is effectively instantaneous, so every item shares
+        # one start/end timestamp; the log entry is validated once and copied
         start_time = datetime.now()
-            
-        if isinstance(input, list):
-            results = []
-            for item in input:
-                item.executor_logs.append(ExecutorLogEntry(
-                    executor_id=self.id,
-                    start_time=start_time,
-                    end_time=datetime.now(),
-                    status="completed",
-                    details={},
-                    errors=[]
-                ))
-                results.append(item)
-            return results
-        else:
-            # Single document processing
-            result = input
-            result.executor_logs.append(ExecutorLogEntry(
-                executor_id=self.id,
-                start_time=start_time,
-                end_time=datetime.now(),
-                status="completed",
-                details={},
-                errors=[]
-            ))
-            return result
-        
\ No newline at end of file
+        log_entry = ExecutorLogEntry(
+            executor_id=self.id,
+            start_time=start_time,
+            end_time=datetime.now(),
+            status="completed",
+            details={},
+            errors=[]
+        )
+        
+        # One path for single and list input; the input is returned as given
+        items = input if isinstance(input, list) else (input,)
+        for item in items:
+            item.executor_logs.append(log_entry.model_copy(update={"details": {}, "errors": []}))
+        return input
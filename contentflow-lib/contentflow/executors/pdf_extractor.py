@@ -1,10 +1,16 @@
 """PDF extraction executor using PyMuPDF for text, pages, and images."""
 
-import base64
+import asyncio
+import binascii
+import copy
 import io
 import logging
+import math
+import mmap
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 try:
     import pymupdf  # PyMuPDF
@@ -14,12 +20,26 @@ except ImportError:
         "Install it with: pip install pymupdf"
     )
 
+try:
+    import pybase64  # Optional SIMD base64, see the pdf-fast extra
+except ImportError:
+    pybase64 = None
+
 from . import ParallelExecutor
 from ..models import Content
 
 logger = logging.getLogger("contentflow.executors.pdf_extractor")
 
 
+def _b64encode_str(data: bytes) -> str:
+    """Base64-encode bytes to str, with pybase64 when it is installed."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    # b2a_base64 is the C routine behind b64encode; the output alphabet is
+    # pure ASCII
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
 class PDFExtractorExecutor(ParallelExecutor):
     """
     Extract content from PDF documents using PyMuPDF.
@@ -34,22 +54,54 @@ class PDFExtractorExecutor(ParallelExecutor):
           Default: True
         - extract_images (bool): Extract embedded images from PDF
           Default: False
-        - content_field (str): Field containing PDF bytes
+        - content_field (str): Field containing PDF bytes (bytes, bytearray,
+          memoryview or io.BytesIO)
           Default: "content"
-        - temp_file_path_field (str): Field containing temp file path
+        - temp_file_path_field (str): Field containing temp file path.
+          The file is memory-mapped with kernel read-ahead rather than
+          copied into memory, so with max_concurrent > 1 disk reads overlap
+          with the parsing of other documents.
           Default: "temp_file_path"
         - output_field (str): Field name for extracted data
           Default: "pdf_output"
         - image_format (str): Format for extracted images
           Default: "png"
           Options: "png", "jpeg", "jpg"
-        - image_output_mode (str): How to store extracted images
+        - image_output_mode (str): How to store extracted images. base64
+          encoding uses pybase64 when installed (pip install contentflow[pdf-fast])
           Default: "base64"
           Options: "base64", "bytes"
         - min_image_size (int): Minimum image size in pixels (width or height)
           Default: 100
+        - jpeg_quality (int): JPEG quality (1-100) used when images are
+          converted to JPEG; lower values encode faster and smaller
+          Default: 95
         - page_separator (str): Separator between pages in full text
           Default: "\n\n---\n\n"
+        - page_workers (int): Number of threads used to read page text.
+          Each thread opens its own copy of the PDF (a MuPDF document must
+          not be shared across threads) and reads a contiguous page range,
+          so this only pays off for large, multi-page PDFs.
+          Default: 1 (pages are read sequentially)
+        - text_flags (int): PyMuPDF TEXT_* flags passed to page text extraction.
+          The default already skips costly passes such as dehyphenation;
+          clearing flags (e.g. TEXT_PRESERVE_WHITESPACE, TEXT_MEDIABOX_CLIP)
+          trades output fidelity for a little extra speed, while adding
+          TEXT_DEHYPHENATE or TEXT_ACCURATE_BBOXES costs extra work per page.
+          Default: pymupdf.TEXTFLAGS_TEXT
+        - pages_layout (str): Shape of data['pdf_output']['pages'].
+          "records" is a list with one dict per page; "columns" is a single
+          dict of parallel lists keyed by page_number, width, height, text
+          and char_count, which avoids a dict per page on large documents.
+          Default: "records"
+          Options: "records", "columns"
+        - cache_size (int): Number of extractions kept in this executor's LRU
+          cache, keyed by content id, so retried or replayed content is not
+          parsed again. Each executor instance has its own cache, which lives
+          as long as the instance. 0 disables the cache.
+          Default: 0
+        - cache_max_bytes (int): PDFs larger than this are never cached
+          Default: 52428800 (50 MiB)
 
         Also setting from ParallelExecutor and BaseExecutor apply.
         
@@ -75,10 +127,13 @@ class PDFExtractorExecutor(ParallelExecutor):
     Output:
         Document or List[Document] with added fields:
         - data['pdf_output']['text']: Full extracted text
-        - data['pdf_output']['pages']: List of page chunks with text and metadata
+        - data['pdf_output']['pages']: Page chunks with text and metadata
+          (list of dicts, or dict of lists with pages_layout="columns")
         - data['pdf_output']['images']: List of extracted images (if enabled)
         - summary_data['pages_processed']: Number of pages processed
         - summary_data['images_extracted']: Number of images extracted
+        - summary_data['total_chars'], ['avg_page_width'], ['avg_page_height']:
+          Page statistics (if extract_pages)
     """
     
     def __init__(
@@ -103,12 +158,25 @@ class PDFExtractorExecutor(ParallelExecutor):
         self.image_format = self.get_setting("image_format", default="png")
         self.image_output_mode = self.get_setting("image_output_mode", default="base64")
         self.min_image_size = self.get_setting("min_image_size", default=100)
+        self.jpeg_quality = int(self.get_setting("jpeg_quality", default=95))
         self.page_separator = self.get_setting("page_separator", default="\n\n---\n\n")
+        self.page_workers = max(1, int(self.get_setting("page_workers", default=1)))
+        self.text_flags = int(self.get_setting("text_flags", default=pymupdf.TEXTFLAGS_TEXT))
+        self.pages_layout = self.get_setting("pages_layout", default="records")
+        self.cache_size = int(self.get_setting("cache_size", default=0))
+        self.cache_max_bytes = int(self.get_setting("cache_max_bytes", default=50 * 1024 * 1024))
+        # Per instance, so the entries always match this executor's settings
+        # and cache_size
+        self._extraction_cache: "OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], int, int]]" = OrderedDict()
         
         # Validate image format
         if self.image_format.lower() not in ["png", "jpeg", "jpg"]:
             raise ValueError(f"Invalid image_format: {self.image_format}. Must be 'png', 'jpeg', or 'jpg'")
         
+        # Validate pages layout
+        if self.pages_layout not in ["records", "columns"]:
+            raise ValueError(f"Invalid pages_layout: {self.pages_layout}. Must be 'records' or 'columns'")
+        
         # Validate image output mode
         if self.image_output_mode not in ["base64", "bytes"]:
             raise ValueError(f"Invalid image_output_mode: {self.image_output_mode}. Must be 'base64' or 'bytes'")
@@ -138,7 +206,7 @@ class PDFExtractorExecutor(ParallelExecutor):
             
             # Try to get from content field
             if self.content_field in content.data:
-                pdf_bytes = content.data[self.content_field]
+                pdf_bytes = self._as_stream(content.data[self.content_field])
             
             # Try to get from temp file
             elif self.temp_file_field in content.data:
@@ -154,66 +222,73 @@ class PDFExtractorExecutor(ParallelExecutor):
                 source = f"file: {pdf_path}" if pdf_path else f"bytes: {len(pdf_bytes)} bytes"
                 logger.debug(f"Processing PDF {content.id} from {source}")
             
-            # Open PDF document
-            if pdf_bytes:
-                doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
-            else:
-                doc = pymupdf.open(filename=pdf_path)
+            # Reuse an earlier extraction of the same content, if cached
+            cache_key = self._cache_key(content)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                if self.debug_mode:
+                    logger.debug(f"Using cached extraction for PDF {content.id}")
+                self._store_result(content, *cached)
+                return content
             
+            # Map a file path into memory so MuPDF reads the pages in place
+            # instead of from a full copy; fall back to reading the file in a
+            # worker thread where mapping is not possible
+            file_map = self._map_file(pdf_path) if not pdf_bytes else None
             try:
-                extracted_data = {}
-                page_count = len(doc)
+                if file_map is not None:
+                    pdf_bytes = memoryview(file_map)
+                elif not pdf_bytes:
+                    pdf_bytes = await asyncio.to_thread(Path(pdf_path).read_bytes)
                 
-                # Extract text
-                all_text = []
-                pages_data = []
+                # Open PDF document
+                doc = self._open_document(pdf_bytes, pdf_path)
                 
-                for page_num in range(page_count):
-                    page = doc[page_num]
-                    page_text = page.get_text()
+                try:
+                    extracted_data = {}
+                    page_count = len(doc)
+                    
+                    # Extract text
+                    if self.extract_text or self.extract_pages:
+                        page_results = await self._read_all_pages(doc, pdf_bytes, pdf_path, page_count)
+                    else:
+                        page_results = []
                     
                     if self.extract_text:
-                        all_text.append(page_text)
+                        # Join straight from the page results rather than keeping
+                        # a second list of page texts
+                        extracted_data['text'] = self.page_separator.join(
+                            page_text for page_text, _, _ in page_results
+                        )
+                        if self.debug_mode:
+                            logger.debug(f"Extracted {len(extracted_data['text'])} characters of text")
                     
                     if self.extract_pages:
-                        page_info = {
-                            "page_number": page_num + 1,
-                            "width": page.rect.width,
-                            "height": page.rect.height,
-                            "text": page_text,
-                            "char_count": len(page_text)
-                        }
-                        pages_data.append(page_info)
-                
-                if self.extract_text:
-                    extracted_data['text'] = self.page_separator.join(all_text)
-                    if self.debug_mode:
-                        logger.debug(f"Extracted {len(extracted_data['text'])} characters of text")
-                
-                if self.extract_pages:
-                    extracted_data['pages'] = pages_data
-                    if self.debug_mode:
-                        logger.debug(f"Created {len(pages_data)} page chunks")
-                
-                # Extract images
-                if self.extract_images:
-                    images = self._extract_images_from_pdf(doc)
-                    extracted_data['images'] = images
-                    if self.debug_mode:
-                        logger.debug(f"Extracted {len(images)} images")
-                else:
-                    images = []
-                
-                # Store extracted data
-                content.data[self.output_field] = extracted_data
-                
-                # Update summary
-                content.summary_data['pages_processed'] = page_count
-                content.summary_data['images_extracted'] = len(images) if self.extract_images else 0
-                content.summary_data['extraction_status'] = "success"
-                
+                        extracted_data['pages'] = self._build_pages(page_results)
+                        if self.debug_mode:
+                            logger.debug(f"Created {page_count} page chunks")
+                    
+                    # Extract images
+                    if self.extract_images:
+                        images = self._extract_images_from_pdf(doc)
+                        extracted_data['images'] = images
+                        if self.debug_mode:
+                            logger.debug(f"Extracted {len(images)} images")
+                    else:
+                        images = []
+                    
+                    # Store extracted data and update summary
+                    self._store_result(content, extracted_data, page_count, len(images))
+                    
+                    if len(pdf_bytes) <= self.cache_max_bytes:
+                        self._cache_put(cache_key, (extracted_data, page_count, len(images)))
+                    
+                finally:
+                    doc.close()
             finally:
-                doc.close()
+                if file_map is not None:
+                    pdf_bytes.release()
+                    file_map.close()
                             
         except Exception as e:
             logger.error(
@@ -226,6 +301,208 @@ class PDFExtractorExecutor(ParallelExecutor):
         
         return content
     
+    def _store_result(
+        self,
+        content: Content,
+        extracted_data: Dict[str, Any],
+        page_count: int,
+        images_extracted: int
+    ) -> None:
+        """Write extracted data and summary fields onto the content item."""
+        content.data[self.output_field] = extracted_data
+        content.summary_data['pages_processed'] = page_count
+        content.summary_data['images_extracted'] = images_extracted
+        content.summary_data['extraction_status'] = "success"
+        
+        pages = extracted_data.get('pages')
+        if pages:
+            content.summary_data.update(self._page_stats(pages))
+    
+    @staticmethod
+    def _page_stats(pages: Any) -> Dict[str, Any]:
+        """
+        Summarize page chunks: total characters and average page size.
+        
+        Column-layout pages are summed directly from their lists, which
+        keeps the loops inside the sum/fsum builtins. Returns no statistics
+        when there are no pages; an empty column layout is still a
+        non-empty dict.
+        """
+        if isinstance(pages, dict):
+            char_counts, widths, heights = pages["char_count"], pages["width"], pages["height"]
+        else:
+            char_counts = [page["char_count"] for page in pages]
+            widths = [page["width"] for page in pages]
+            heights = [page["height"] for page in pages]
+        
+        page_count = len(char_counts)
+        if page_count == 0:
+            return {}
+        return {
+            'total_chars': sum(char_counts),
+            'avg_page_width': math.fsum(widths) / page_count,
+            'avg_page_height': math.fsum(heights) / page_count,
+        }
+    
+    def _cache_key(self, content: Content) -> Optional[Tuple[Any, ...]]:
+        """
+        Key an extraction by content identity. The cache belongs to this
+        executor, so its settings are the same for every entry. Returns None
+        when caching is disabled.
+        """
+        if self.cache_size <= 0 or content.id is None:
+            return None
+        return (content.id.canonical_id, content.id.unique_id)
+    
+    def _cache_get(self, key: Optional[Tuple[Any, ...]]) -> Optional[Tuple[Dict[str, Any], int, int]]:
+        """Return a private copy of a cached extraction, or None on a miss."""
+        if key is None or key not in self._extraction_cache:
+            return None
+        self._extraction_cache.move_to_end(key)
+        extracted_data, page_count, images_extracted = self._extraction_cache[key]
+        return copy.deepcopy(extracted_data), page_count, images_extracted
+    
+    def _cache_put(self, key: Optional[Tuple[Any, ...]], value: Tuple[Dict[str, Any], int, int]) -> None:
+        """Cache a copy of an extraction, evicting least recently used entries."""
+        if key is None:
+            return
+        extracted_data, page_count, images_extracted = value
+        self._extraction_cache[key] = (copy.deepcopy(extracted_data), page_count, images_extracted)
+        self._extraction_cache.move_to_end(key)
+        while len(self._extraction_cache) > self.cache_size:
+            self._extraction_cache.popitem(last=False)
+    
+    @staticmethod
+    def _map_file(pdf_path: str) -> Optional[mmap.mmap]:
+        """
+        Memory-map a PDF file read-only, or return None if it cannot be
+        mapped (e.g. an empty file). The kernel is asked to start reading
+        the file ahead, so page faults rarely block the event loop.
+        """
+        try:
+            with open(pdf_path, "rb") as f:
+                file_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if hasattr(file_map, "madvise") and hasattr(mmap, "MADV_WILLNEED"):
+            file_map.madvise(mmap.MADV_WILLNEED)
+        return file_map
+    
+    @staticmethod
+    def _as_stream(pdf_bytes: Any) -> Any:
+        """
+        Return a zero-copy view of the PDF payload for ``pymupdf.open``.
+        
+        PyMuPDF keeps ``bytes`` and ``memoryview`` streams as-is but copies
+        a ``bytearray`` into new ``bytes`` and a ``BytesIO`` via ``getvalue()``;
+        wrapping those in a memoryview avoids one full copy of the PDF.
+        """
+        if isinstance(pdf_bytes, bytearray):
+            return memoryview(pdf_bytes)
+        if isinstance(pdf_bytes, io.BytesIO):
+            return pdf_bytes.getbuffer()
+        return pdf_bytes
+    
+    def _open_document(self, pdf_bytes: Optional[bytes], pdf_path: Optional[str]) -> pymupdf.Document:
+        """Open a PDF from bytes, or from a file path when no bytes are given."""
+        if pdf_bytes:
+            return pymupdf.open(stream=pdf_bytes, filetype="pdf")
+        return pymupdf.open(filename=pdf_path)
+    
+    def _build_pages(self, page_results: List[Tuple[str, float, float]]) -> Any:
+        """Lay out per-page results according to ``pages_layout``."""
+        if self.pages_layout == "columns":
+            texts = [page_text for page_text, _, _ in page_results]
+            return {
+                "page_number": list(range(1, len(page_results) + 1)),
+                "width": [width for _, width, _ in page_results],
+                "height": [height for _, _, height in page_results],
+                "text": texts,
+                "char_count": list(map(len, texts)),
+            }
+        
+        return [
+            {
+                "page_number": page_num + 1,
+                "width": width,
+                "height": height,
+                "text": page_text,
+                "char_count": len(page_text)
+            }
+            for page_num, (page_text, width, height) in enumerate(page_results)
+        ]
+    
+    def _read_pages(
+        self,
+        doc: pymupdf.Document,
+        start: int,
+        stop: int
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Read (text, width, height) for pages ``start`` to ``stop - 1``.
+        
+        Page sizes are only needed for page chunks; without ``extract_pages``
+        the page rectangle is never computed and width/height are None.
+        """
+        text_flags = self.text_flags
+        if not self.extract_pages:
+            return [
+                (doc[page_num].get_text("text", flags=text_flags, sort=False), None, None)
+                for page_num in range(start, stop)
+            ]
+        
+        pages = []
+        for page_num in range(start, stop):
+            page = doc[page_num]
+            page_text = page.get_text("text", flags=text_flags, sort=False)
+            rect = page.rect
+            pages.append((page_text, rect.width, rect.height))
+        return pages
+    
+    def _read_pages_from_source(
+        self,
+        pdf_bytes: Optional[bytes],
+        pdf_path: Optional[str],
+        start: int,
+        stop: int
+    ) -> List[Tuple[str, float, float]]:
+        """Read a page range from a private copy of the PDF (thread worker)."""
+        doc = self._open_document(pdf_bytes, pdf_path)
+        try:
+            return self._read_pages(doc, start, stop)
+        finally:
+            doc.close()
+    
+    async def _read_all_pages(
+        self,
+        doc: pymupdf.Document,
+        pdf_bytes: Optional[bytes],
+        pdf_path: Optional[str],
+        page_count: int
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Read (text, width, height) for every page, in page order.
+        
+        With ``page_workers > 1`` the pages are split into contiguous ranges
+        read concurrently in a thread pool, each worker on its own document.
+        """
+        workers = min(self.page_workers, page_count)
+        if workers <= 1:
+            return self._read_pages(doc, 0, page_count)
+        
+        step = -(-page_count // workers)
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool, self._read_pages_from_source,
+                    pdf_bytes, pdf_path, start, min(start + step, page_count)
+                )
+                for start in range(0, page_count, step)
+            ))
+        
+        return [page for part in parts for page in part]
+    
     def _extract_images_from_pdf(self, doc: pymupdf.Document) -> List[Dict[str, Any]]:
         """Extract images from PDF document.
         
@@ -236,6 +513,8 @@ class PDFExtractorExecutor(ParallelExecutor):
             List of image dictionaries with metadata and image data
         """
         images = []
+        encode_base64 = self.image_output_mode == "base64"
+        target_format = "png" if self.image_format.lower() == "png" else "jpeg"
         
         for page_num in range(len(doc)):
             page = doc[page_num]
@@ -243,19 +522,11 @@ class PDFExtractorExecutor(ParallelExecutor):
             
             for img_index, img_info in enumerate(image_list):
                 try:
-                    xref = img_info[0]
+                    # get_images() entries are (xref, smask, width, height, ...),
+                    # read from the image dictionary without decoding it
+                    xref, _, width, height = img_info[:4]
                     
-                    # Extract image
-                    base_image = doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
-                    # Get image dimensions
-                    pix = pymupdf.Pixmap(doc, xref)
-                    width = pix.width
-                    height = pix.height
-                    
-                    # Filter by minimum size
+                    # Filter by minimum size before extracting anything
                     if width < self.min_image_size and height < self.min_image_size:
                         if self.debug_mode:
                             logger.debug(
@@ -264,23 +535,23 @@ class PDFExtractorExecutor(ParallelExecutor):
                             )
                         continue
                     
+                    # Extract image
+                    base_image = doc.extract_image(xref)
+                    image_bytes = base_image["image"]
+                    image_ext = base_image["ext"]
+                    
                     # Convert to desired format if needed
-                    if self.image_format.lower() in ["png", "jpeg", "jpg"]:
-                        target_format = "png" if self.image_format.lower() == "png" else "jpeg"
-                        
-                        if image_ext != target_format:
-                            # Convert image format
-                            pix = pymupdf.Pixmap(pymupdf.Pixmap(doc, xref), 0)  # Remove alpha if present
-                            if target_format == "png":
-                                image_bytes = pix.tobytes("png")
-                            else:
-                                image_bytes = pix.tobytes("jpeg")
-                        
+                    if image_ext != target_format:
+                        # Convert image format, decoding the image once
+                        pix = pymupdf.Pixmap(doc, xref)
+                        if pix.alpha and target_format == "jpeg":
+                            pix = pymupdf.Pixmap(pix, 0)  # JPEG has no alpha channel
+                        image_bytes = pix.tobytes(target_format, jpg_quality=self.jpeg_quality)
                         pix = None  # Clean up
                     
                     # Prepare image data based on output mode
-                    if self.image_output_mode == "base64":
-                        image_data = base64.b64encode(image_bytes).decode('utf-8')
+                    if encode_base64:
+                        image_data = _b64encode_str(image_bytes)
                     else:
                         image_data = image_bytes
                     
@@ -2,13 +2,139 @@
 
 import logging
 import json
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, List, Optional
 
 from .azure_openai_agent_executor import AzureOpenAIAgentExecutor
 from ..models import Content
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("contentflow.executors.pii_detector")
 
+# Outermost {...} span of a model response, compiled once for all instances
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _loads(json_str: str) -> Any:
+    """Parse JSON with orjson when it is installed, falling back to json."""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+# PII type descriptions for better accuracy
+_PII_DESCRIPTIONS = {
+    "name": "person names (first, last, full names)",
+    "email": "email addresses",
+    "phone": "phone numbers in any format",
+    "ssn": "social security numbers (XXX-XX-XXXX)",
+    "credit_card": "credit card numbers",
+    "address": "physical addresses (street, city, state, zip)",
+    "date_of_birth": "dates of birth",
+    "passport": "passport numbers",
+    "license": "driver's license numbers",
+    "ip_address": "IP addresses",
+    "bank_account": "bank account numbers"
+}
+
+_INSTRUCTIONS_TEMPLATE = (
+    "You are an expert PII (Personally Identifiable Information) detection system. "
+    "Detect the following types of PII in the text: {pii_types}. "
+    "{custom_patterns}"
+    "Only report PII with confidence >= {confidence_threshold}. "
+    "\n\nPII Types to detect:\n"
+    "{descriptions}"
+    "{format_block}"
+    "\n\nBe thorough but conservative - only flag items you are confident are PII. "
+    "Avoid false positives."
+)
+
+_DETECT_FORMATS = {
+    True: 'Format: {"pii_found": [{"type": "pii_type", "value": "actual_value", "position": {"start": 0, "end": 10}, "confidence": 0.0-1.0}], "count": 0}. ',
+    False: 'Format: {"pii_found": [{"type": "pii_type", "value": "actual_value", "confidence": 0.0-1.0}], "count": 0}. ',
+}
+
+_TRANSFORM_FORMATS = {
+    True: 'Format: {"pii_found": [{"type": "...", "value": "...", "position": {...}, "confidence": 0.0-1.0}], ',
+    False: 'Format: {"pii_found": [{"type": "...", "value": "...", "confidence": 0.0-1.0}], ',
+}
+
+_TRANSFORM_RULES = {
+    "redact": 'Replace each PII item with [REDACTED-TYPE] (e.g., [REDACTED-EMAIL]). ',
+    "mask": 'Replace each PII item with asterisks (***). ',
+    "label": 'Wrap each PII item with tags like <PII-TYPE>value</PII-TYPE>. ',
+}
+
+
+# PII types that cannot occur without one of these characters; text lacking
+# them can skip the model call when only such types are requested
+_PII_SIGNALS = {
+    "email": "@",
+    "phone": r"\d",
+    "ssn": r"\d",
+    "credit_card": r"\d",
+    # IPv4 needs digits; IPv6 always has ':' but may have no digit
+    "ip_address": r"\d:",
+    "bank_account": r"\d",
+}
+
+
+def _signal_screen(pii_types: List[str], custom_patterns: Optional[List[str]]) -> Optional["re.Pattern[str]"]:
+    """
+    Return a regex that matches any text that could contain the requested
+    PII, or None when some requested type (names, addresses, custom
+    patterns...) has no cheap signal and every text must be analyzed.
+    """
+    if custom_patterns or not pii_types or any(t not in _PII_SIGNALS for t in pii_types):
+        return None
+    signals = sorted({_PII_SIGNALS[t] for t in pii_types})
+    return re.compile("[" + "".join(signals) + "]")
+
+
+def _format_block(action: str, include_positions: bool) -> str:
+    """Return the output format section of the instructions for an action."""
+    if action == "detect":
+        return "\n\nReturn results as a JSON object listing all detected PII. " + _DETECT_FORMATS[bool(include_positions)]
+    if action not in _TRANSFORM_RULES:
+        return ""
+    return (
+        f"\n\nDetect PII and {action} it in the text. "
+        "\n\nReturn results as a JSON object with two fields: "
+        '1. "pii_found": list of detected PII '
+        f'2. "{action}ed_text": the text with PII {action}ed. '
+        + _TRANSFORM_RULES[action]
+        + _TRANSFORM_FORMATS[bool(include_positions)]
+        + f'"{action}ed_text": "text with PII {action}ed", "count": 0}}. '
+    )
+
+
+def _build_instructions(
+    pii_types: List[str],
+    action: str,
+    include_positions: bool,
+    confidence_threshold: float,
+    custom_patterns: Optional[List[str]],
+) -> str:
+    """Render the agent instructions for the given PII detection settings."""
+    return _INSTRUCTIONS_TEMPLATE.format(
+        pii_types=", ".join(pii_types),
+        custom_patterns=(
+            f"Also look for these custom PII patterns: {', '.join(custom_patterns)}. "
+            if custom_patterns else ""
+        ),
+        confidence_threshold=confidence_threshold,
+        descriptions="".join(
+            f"- {pii_type}: {_PII_DESCRIPTIONS[pii_type]}\n"
+            for pii_type in pii_types
+            if pii_type in _PII_DESCRIPTIONS
+        ),
+        format_block=_format_block(action, include_positions),
+    )
+
 
 class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
     """
@@ -39,6 +165,15 @@ class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
           Default: "pii_detected"
         - redacted_field (str): Field for redacted text (if action != "detect")
           Default: "text_redacted"
+        - min_text_length (int): Inputs whose stripped text is shorter than
+          this are reported as containing no PII without calling the model.
+          Blank inputs are always skipped, as are inputs without any "@" or
+          digit when only email/phone/ssn/credit_card/ip_address/bank_account
+          types are requested.
+          Default: 1
+        
+        - max_concurrent (int): Maximum concurrent model calls for a batch
+          Default: 16
         
         All AzureOpenAIAgentExecutor settings are also supported.
     
@@ -69,6 +204,9 @@ class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
         - data[redacted_field]: Redacted text (if action != "detect")
     """
     
+    # Responses are post-processed per item in process_content_item
+    supports_request_batching = False
+    
     def __init__(
         self,
         id: str,
@@ -84,74 +222,24 @@ class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
         confidence_threshold = settings.get("confidence_threshold", 0.7)
         custom_patterns = settings.get("custom_patterns", None)
         
-        # Build specialized instructions
-        instructions = "You are an expert PII (Personally Identifiable Information) detection system. "
-        instructions += f"Detect the following types of PII in the text: {', '.join(pii_types)}. "
-        
-        if custom_patterns:
-            instructions += f"Also look for these custom PII patterns: {', '.join(custom_patterns)}. "
-        
-        instructions += f"Only report PII with confidence >= {confidence_threshold}. "
-        
-        # PII type descriptions for better accuracy
-        pii_descriptions = {
-            "name": "person names (first, last, full names)",
-            "email": "email addresses",
-            "phone": "phone numbers in any format",
-            "ssn": "social security numbers (XXX-XX-XXXX)",
-            "credit_card": "credit card numbers",
-            "address": "physical addresses (street, city, state, zip)",
-            "date_of_birth": "dates of birth",
-            "passport": "passport numbers",
-            "license": "driver's license numbers",
-            "ip_address": "IP addresses",
-            "bank_account": "bank account numbers"
-        }
-        
-        instructions += "\n\nPII Types to detect:\n"
-        for pii_type in pii_types:
-            if pii_type in pii_descriptions:
-                instructions += f"- {pii_type}: {pii_descriptions[pii_type]}\n"
-        
-        # Define output format based on action
-        if action == "detect":
-            instructions += "\n\nReturn results as a JSON object listing all detected PII. "
-            if include_positions:
-                instructions += 'Format: {"pii_found": [{"type": "pii_type", "value": "actual_value", "position": {"start": 0, "end": 10}, "confidence": 0.0-1.0}], "count": 0}. '
-            else:
-                instructions += 'Format: {"pii_found": [{"type": "pii_type", "value": "actual_value", "confidence": 0.0-1.0}], "count": 0}. '
-        elif action in ["redact", "mask", "label"]:
-            instructions += f"\n\nDetect PII and {action} it in the text. "
-            instructions += "\n\nReturn results as a JSON object with two fields: "
-            instructions += '1. "pii_found": list of detected PII '
-            instructions += f'2. "{action}ed_text": the text with PII {action}ed. '
-            
-            if action == "redact":
-                instructions += 'Replace each PII item with [REDACTED-TYPE] (e.g., [REDACTED-EMAIL]). '
-            elif action == "mask":
-                instructions += 'Replace each PII item with asterisks (***). '
-            elif action == "label":
-                instructions += 'Wrap each PII item with tags like <PII-TYPE>value</PII-TYPE>. '
-            
-            if include_positions:
-                instructions += 'Format: {"pii_found": [{"type": "...", "value": "...", "position": {...}, "confidence": 0.0-1.0}], '
-            else:
-                instructions += 'Format: {"pii_found": [{"type": "...", "value": "...", "confidence": 0.0-1.0}], '
-            
-            instructions += f'"{action}ed_text": "text with PII {action}ed", "count": 0}}. '
-        
-        instructions += "\n\nBe thorough but conservative - only flag items you are confident are PII. "
-        instructions += "Avoid false positives."
+        instructions = _build_instructions(
+            pii_types, action, include_positions, confidence_threshold, custom_patterns
+        )
         
         # Set default fields
         if "input_field" not in settings:
             settings["input_field"] = "text"
         if "output_field" not in settings:
             settings["output_field"] = "pii_detected"
+        # Model calls are I/O bound, so fan out wider than the
+        # ParallelExecutor default; retries with backoff absorb throttling
+        if "max_concurrent" not in settings:
+            settings["max_concurrent"] = 16
         
         # Store action and redacted field for post-processing
         self.pii_action = action
         self.redacted_field = settings.get("redacted_field", "text_redacted")
+        self._pii_screen = _signal_screen(pii_types, custom_patterns)
         
         # Override instructions
         settings["instructions"] = instructions
@@ -164,6 +252,8 @@ class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
             **kwargs
         )
         
+        self.min_text_length = self.get_setting("min_text_length", default=1)
+        
         if self.debug_mode:
             logger.debug(
                 f"PIIDetectorExecutor initialized with action={action}, "
@@ -172,6 +262,9 @@ class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
     
     async def process_content_item(self, content: Content) -> Content:
         """Process content and parse JSON PII output."""
+        if self._can_skip(content):
+            return self._store_no_pii(content)
+        
         content = await super().process_content_item(content)
         
         logger.debug(f"Processing PII detection results for content id={content.id}")
@@ -184,11 +277,9 @@ class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
                 
                 if isinstance(response_text, str):
                     # Look for JSON block in the response
-                    start = response_text.find('{')
-                    end = response_text.rfind('}')
-                    if start != -1 and end != -1:
-                        json_str = response_text[start:end+1]
-                        parsed = json.loads(json_str)
+                    match = _JSON_RE.search(response_text)
+                    if match:
+                        parsed = _loads(match.group(0))
                         content.data[self.output_field] = parsed
                         
                         logger.debug(f"Parsed PII detection JSON: {parsed}")
@@ -207,3 +298,46 @@ class PIIDetectorExecutor(AzureOpenAIAgentExecutor):
                 logger.warning(f"Could not parse PII detection as JSON for {content.id}")
         
         return content
+    
+    def _can_skip(self, content: Content) -> bool:
+        """
+        Check whether the input text cannot contain PII, so the model call
+        can be skipped: it is blank, shorter than min_text_length, or lacks
+        every character the requested PII types need (see _PII_SIGNALS).
+        """
+        if not content or not content.data:
+            return False
+        
+        text = self.try_extract_nested_field_from_content(
+            content=content,
+            field_path=self.input_field
+        )
+        if text is None:
+            return False  # Let the parent report the missing field
+        if not isinstance(text, str):
+            text = str(text)
+        
+        if len(text.strip()) < max(self.min_text_length, 1):
+            return True
+        return self._pii_screen is not None and self._pii_screen.search(text) is None
+    
+    def _store_no_pii(self, content: Content) -> Content:
+        """Record an empty PII result without calling the model."""
+        parsed: Dict[str, Any] = {"pii_found": [], "count": 0}
+        
+        if self.pii_action != "detect":
+            text = self.try_extract_nested_field_from_content(
+                content=content,
+                field_path=self.input_field
+            )
+            parsed[f"{self.pii_action}ed_text"] = text
+            content.data[self.redacted_field] = text
+        
+        content.data[self.output_field] = parsed
+        content.summary_data['agent_execution_status'] = "skipped"
+        content.summary_data['pii_count'] = 0
+        
+        if self.debug_mode:
+            logger.debug(f"Skipped PII detection for {content.id}: no PII candidates in input")
+        
+        return content
@@ -1,16 +1,36 @@
 """Recursive text chunker executor for creating chunks using recursive splitting strategy."""
 
+import asyncio
 import logging
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 from dataclasses import dataclass
 
 from . import ParallelExecutor
 from ..models import Content
+from ..utils.process_pools import get_process_pool
 
 logger = logging.getLogger("contentflow.executors.recursive_text_chunker")
 
 
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words."""
+    return len(text.split())
+
+
+def _count_tokens(text: str) -> int:
+    """Approximate token count (rough estimate: ~4 chars per token)."""
+    return len(text) // 4
+
+
+# Length measures by length_function setting, bound once per executor
+_LENGTH_FUNCTIONS = {
+    "characters": len,
+    "words": _count_words,
+    "tokens": _count_tokens,
+}
+
+
 @dataclass
 class ChunkMetadata:
     """Metadata for a document chunk."""
@@ -20,6 +40,19 @@ class ChunkMetadata:
     split_level: int  # Which separator level was used for this chunk
     separator_used: Optional[str]
     page_numbers: Optional[List[int]] = None
+    start_offset: Optional[int] = None  # Offsets of the chunk in the input text,
+    end_offset: Optional[int] = None    # not counting any overlap prefix
+
+
+@dataclass(slots=True)
+class _ChunkRecord:
+    """A chunk produced by the splitter, before it becomes an output chunk object."""
+    text: str
+    start: int  # Offsets of the chunk's own text in the full text
+    end: int
+    split_level: int
+    separator_used: Optional[str]
+    page_numbers: Optional[List[int]] = None
 
 
 class RecursiveTextChunkerExecutor(ParallelExecutor):
@@ -38,6 +71,9 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
     - Optimal chunk sizes for RAG and embedding models
     - Configurable overlap between chunks for context continuity
     
+    Text that already fits within chunk_size (short slides, emails) takes a
+    fast path and becomes a single chunk without running the splitter.
+    
     Configuration (settings dict):
         - input_field (str): Field containing extracted text
           Default: "text" (works with most extractors)
@@ -69,6 +105,14 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
         - include_page_numbers (bool): Track page numbers for chunks (when available)
           Default: True
           Note: Requires input from extractors that provide page data (PDF, Word, PowerPoint)
+        - split_workers (int): Number of worker processes used to split text.
+          Splitting is CPU-bound pure Python, so when many documents are
+          processed concurrently it otherwise runs one at a time on the
+          event loop thread. Worker processes are started on first use,
+          shared by chunkers with the same settings and shut down by
+          PipelineExecutor.cleanup(); they only pay off for large batches or
+          long documents.
+          Default: 0 (split in the executor's own process)
 
         Also settings from ParallelExecutor and BaseExecutor apply.
     
@@ -142,6 +186,7 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
         # Field configuration
         self.input_field = self.get_setting("input_field", default="text")
         self.output_field = self.get_setting("output_field", default="chunks")
+        self._input_field_keys = tuple(self.input_field.split('.'))
         
         # Chunking parameters
         self.chunk_size = self.get_setting("chunk_size", default=1000)
@@ -154,18 +199,20 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
         
         # Length measurement
         self.length_function = self.get_setting("length_function", default="characters")
-        valid_length_functions = ["characters", "words", "tokens"]
+        valid_length_functions = list(_LENGTH_FUNCTIONS)
         if self.length_function not in valid_length_functions:
             raise ValueError(
                 f"Invalid length_function: {self.length_function}. "
                 f"Must be one of {valid_length_functions}"
             )
+        self._measure_fn = _LENGTH_FUNCTIONS[self.length_function]
         
         # Processing options
         self.keep_separator = self.get_setting("keep_separator", default=True)
         self.strip_whitespace = self.get_setting("strip_whitespace", default=True)
         self.add_metadata = self.get_setting("add_metadata", default=True)
         self.include_page_numbers = self.get_setting("include_page_numbers", default=True)
+        self.split_workers = max(0, int(self.get_setting("split_workers", default=0)))
         
         # Validation
         if self.chunk_overlap >= self.chunk_size:
@@ -193,7 +240,7 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
                 raise ValueError("Content must have data")
             
             # Extract text from input field (supports nested fields like "pdf_output.text")
-            text = self._get_nested_field(content.data, self.input_field)
+            text = self._get_nested_field(content.data, self._input_field_keys)
             
             if not text:
                 raise ValueError(f"No text found in field: {self.input_field}")
@@ -208,39 +255,24 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
                 )
             
             # Extract page data if available (from PDF, Word, PowerPoint extractors)
-            pages_data = self._extract_pages_data(content.data, self.input_field)
-            
-            # Create chunks using recursive splitting
-            chunks = self._split_text_recursive(text)
+            pages_data = self._extract_pages_data(content.data)
+            
+            # Fast path: text that already fits is a single chunk, with
+            # nothing to split, overlap or merge
+            text_length = self._measure_fn(text)
+            if text_length <= self.chunk_size:
+                chunk = self._make_chunk(text, 0, len(text), 0, 0, None)
+                chunks = [chunk] if chunk else []
+            else:
+                # Create chunks using recursive splitting
+                chunks = await self._split_text(text, text_length)
             
             # Add page numbers to chunks if available
             if self.include_page_numbers and pages_data:
                 chunks = self._add_page_numbers_to_chunks(chunks, text, pages_data)
             
-            # Apply overlap between chunks
-            if self.chunk_overlap > 0:
-                chunks = self._apply_overlap(chunks, text)
-            
-            # Merge chunks that are too small
-            chunks = self._merge_small_chunks(chunks)
-            
-            # Create chunk objects with metadata
-            chunk_objects = []
-            for i, chunk_data in enumerate(chunks):
-                chunk_obj = {'text': chunk_data['text']}
-                chunk_obj['chunk_index'] = i
-                chunk_obj['page_number'] = chunk_data.get('page_numbers', [])[0] if chunk_data.get('page_numbers') else None
-                
-                if self.add_metadata:
-                    chunk_obj['metadata'] = {
-                        'char_count': len(chunk_data['text']),
-                        'word_count': len(chunk_data['text'].split()),
-                        'split_level': chunk_data.get('split_level', 0),
-                        'separator_used': chunk_data.get('separator_used'),
-                        'page_numbers': chunk_data.get('page_numbers'),
-                    }
-                
-                chunk_objects.append(chunk_obj)
+            # Merge chunks that are too small and create chunk objects with metadata
+            chunk_objects = self._build_chunk_objects(chunks)
             
             # Store chunks
             content.data[self.output_field] = chunk_objects
@@ -268,9 +300,8 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
         
         return content
     
-    def _get_nested_field(self, data: Dict[str, Any], field_path: str) -> Any:
-        """Get a value from a nested field path like 'pdf_output.text'."""
-        keys = field_path.split('.')
+    def _get_nested_field(self, data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+        """Get a value from a nested field path, given as its split keys (e.g. ('pdf_output', 'text'))."""
         value = data
         
         for key in keys:
@@ -283,134 +314,262 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
         
         return value
     
-    def _measure_length(self, text: str) -> int:
-        """Measure text length according to configured length_function."""
-        if self.length_function == "words":
-            return len(text.split())
-        elif self.length_function == "tokens":
-            # Approximate token count (rough estimate: ~4 chars per token)
-            return len(text) // 4
-        else:  # characters
-            return len(text)
+    async def _split_text(self, text: str, text_length: int) -> List[_ChunkRecord]:
+        """
+        Split text recursively, in a worker process when split_workers is set.
+        
+        Each worker process builds its own chunker from this executor's
+        settings once, so only the text and the resulting chunks cross the
+        process boundary. The pool is the shared one for these settings (see
+        ``contentflow.utils.process_pools``), not owned by this instance.
+        """
+        if self.split_workers <= 0:
+            return self._split_text_recursive(text, text_length)
+        
+        pool = get_process_pool(
+            self.split_workers, _init_split_worker, (self.id, self.settings)
+        )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, _split_in_worker, text, text_length)
     
     def _split_text_recursive(
         self,
         text: str,
-        separators: Optional[List[str]] = None,
-        split_level: int = 0
-    ) -> List[Dict[str, Any]]:
+        text_length: Optional[int] = None
+    ) -> List[_ChunkRecord]:
         """
-        Recursively split text using hierarchy of separators.
+        Split text using the hierarchy of separators.
+        
+        Pieces still larger than chunk_size are split again with the next
+        separator. This runs on an explicit stack of per-level generators
+        rather than by recursion: a level yields finished chunks in order,
+        plus a task for every oversized piece, which is pushed and fully
+        split before the level resumes, so chunks come out in text order.
+        
+        With chunk_overlap set, every chunk after the first is emitted
+        already prefixed with the tail of the previous one; its start and
+        end offsets still cover only its own text.
         
         Args:
             text: Text to split
-            separators: List of separators to try (uses self.separators if None)
-            split_level: Current recursion level (for metadata)
+            text_length: Measured length of ``text``, if already known
         
         Returns:
-            List of chunk dictionaries with text and metadata
+            Chunk records with text, offsets and split metadata
         """
-        if separators is None:
-            separators = self.separators
+        chunks = []
+        overlap = self.chunk_overlap
+        previous_text = None
+        stack = [self._split_level(text, 0, 0, 0, text_length)]
+        
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, _ChunkRecord):
+                    if overlap > 0:
+                        chunk_text = item.text
+                        if previous_text is not None:
+                            item.text = self._get_overlap_text(previous_text, overlap) + chunk_text
+                        previous_text = chunk_text
+                    chunks.append(item)
+                else:
+                    # Oversized piece: split it fully before resuming
+                    stack.append(self._split_level(*item))
+                    break
+            else:
+                stack.pop()
         
-        # Base case: no more separators or text is small enough
-        text_length = self._measure_length(text)
+        return chunks
+    
+    def _split_level(
+        self,
+        text: str,
+        separator_index: int,
+        split_level: int,
+        offset: int,
+        text_length: Optional[int]
+    ) -> Iterator[Any]:
+        """
+        Split text with one separator of the hierarchy.
         
-        if not separators or text_length <= self.chunk_size:
-            if self.strip_whitespace:
-                text = text.strip()
-            
-            if text:
-                return [{
-                    'text': text,
-                    'split_level': split_level,
-                    'separator_used': None,
-                }]
-            else:
-                return []
+        Args:
+            text: Text to split
+            separator_index: Index of the separator to split with
+            split_level: Depth in the separator hierarchy (for metadata)
+            offset: Position of ``text`` in the full document text; chunk
+                'start'/'end' offsets are reported relative to the full text
+            text_length: Measured length of ``text``, if already known
+        
+        Yields:
+            Chunk records, and (text, separator_index, split_level,
+            offset, text_length) tasks for pieces that must be split further
+        """
+        # Base case: no more separators or text is small enough
+        if text_length is None:
+            text_length = self._measure_fn(text)
+        
+        if separator_index >= len(self.separators) or text_length <= self.chunk_size:
+            chunk = self._make_chunk(text, 0, len(text), offset, split_level, None)
+            if chunk:
+                yield chunk
+            return
+        
+        separator = self.separators[separator_index]
+        
+        # Separator absent: go straight to the next one
+        if separator and separator not in text:
+            yield (text, separator_index + 1, split_level + 1, offset, text_length)
+            return
+        
+        # Character-level split (last resort): cut fixed windows of the
+        # largest size that still fits, rather than one piece per character
+        window = self._max_window_chars()
+        if separator == "" and window:
+            for window_start in range(0, len(text), window):
+                chunk = self._make_chunk(
+                    text, window_start, min(window_start + window, len(text)), offset, split_level, separator
+                )
+                if chunk:
+                    yield chunk
+            return
         
-        # Try current separator
-        separator = separators[0]
-        remaining_separators = separators[1:]
+        # Split by current separator into piece sizes in characters, plus
+        # their measured lengths
+        piece_chars, piece_lengths = self._measure_pieces(text, separator)
         
-        # Split by current separator
-        if separator == "":
-            # Character-level split (last resort)
-            splits = list(text)
-        else:
-            splits = self._split_text_with_separator(text, separator)
+        # Pieces are consecutive in the text: with keep_separator they carry
+        # their separator, otherwise exactly one separator lies between them.
+        # A run of pieces is therefore always the slice text[chunk_start:chunk_end],
+        # so chunks are tracked as offsets plus a running length and sliced
+        # out once when closed, instead of collecting and joining the pieces.
+        gap = 0 if self.keep_separator else len(separator)
         
         # Group splits into chunks
-        chunks = []
-        current_chunk_parts = []
+        chunk_start = chunk_end = 0
         current_chunk_length = 0
+        has_parts = False
+        split_start = 0
         
-        for split in splits:
-            split_length = self._measure_length(split)
+        for split_chars, split_length in zip(piece_chars, piece_lengths):
+            split_end = split_start + split_chars
             
-            # If single split is too large, recursively split it further
+            # If single split is too large, split it further with the next separator
             if split_length > self.chunk_size:
                 # Save current chunk if it has content
-                if current_chunk_parts:
-                    chunk_text = self._join_parts(current_chunk_parts, separator)
-                    if self.strip_whitespace:
-                        chunk_text = chunk_text.strip()
-                    
-                    if chunk_text:
-                        chunks.append({
-                            'text': chunk_text,
-                            'split_level': split_level,
-                            'separator_used': separator,
-                        })
+                if has_parts:
+                    chunk = self._make_chunk(
+                        text, chunk_start, chunk_end, offset, split_level, separator
+                    )
+                    if chunk:
+                        yield chunk
                     
-                    current_chunk_parts = []
+                    has_parts = False
                     current_chunk_length = 0
                 
-                # Recursively split the large piece
-                sub_chunks = self._split_text_recursive(
-                    split,
-                    remaining_separators,
-                    split_level + 1
+                yield (
+                    text[split_start:split_end], separator_index + 1, split_level + 1,
+                    offset + split_start, split_length
                 )
-                chunks.extend(sub_chunks)
             
             # Check if adding this split would exceed chunk_size
-            elif current_chunk_length + split_length > self.chunk_size and current_chunk_parts:
+            elif current_chunk_length + split_length > self.chunk_size and has_parts:
                 # Save current chunk
-                chunk_text = self._join_parts(current_chunk_parts, separator)
-                if self.strip_whitespace:
-                    chunk_text = chunk_text.strip()
-                
-                if chunk_text:
-                    chunks.append({
-                        'text': chunk_text,
-                        'split_level': split_level,
-                        'separator_used': separator,
-                    })
+                chunk = self._make_chunk(
+                    text, chunk_start, chunk_end, offset, split_level, separator
+                )
+                if chunk:
+                    yield chunk
                 
                 # Start new chunk with current split
-                current_chunk_parts = [split]
+                chunk_start, chunk_end = split_start, split_end
                 current_chunk_length = split_length
             
             else:
                 # Add to current chunk
-                current_chunk_parts.append(split)
+                if not has_parts:
+                    chunk_start = split_start
+                    has_parts = True
+                chunk_end = split_end
                 current_chunk_length += split_length
+            
+            split_start = split_end + gap
         
         # Add final chunk
-        if current_chunk_parts:
-            chunk_text = self._join_parts(current_chunk_parts, separator)
-            if self.strip_whitespace:
-                chunk_text = chunk_text.strip()
-            
-            if chunk_text:
-                chunks.append({
-                    'text': chunk_text,
-                    'split_level': split_level,
-                    'separator_used': separator,
-                })
+        if has_parts:
+            chunk = self._make_chunk(
+                text, chunk_start, chunk_end, offset, split_level, separator
+            )
+            if chunk:
+                yield chunk
+    
+    def _max_window_chars(self) -> int:
+        """
+        Longest run of characters whose measured length fits in chunk_size,
+        or 0 when it depends on the content (word counting).
+        """
+        if self.length_function == "characters":
+            return self.chunk_size
+        if self.length_function == "tokens":
+            # len(text) // 4 <= chunk_size
+            return self.chunk_size * 4 + 3
+        return 0
+    
+    def _make_chunk(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        offset: int,
+        split_level: int,
+        separator: Optional[str]
+    ) -> Optional[_ChunkRecord]:
+        """
+        Build a chunk record for ``text[start:end]``, where ``text`` is
+        found at ``offset`` in the full text, or None if nothing is left
+        after optional whitespace stripping.
         
-        return chunks
+        Whitespace is stripped by moving the bounds inward, so the chunk
+        text is sliced out once rather than sliced and then stripped.
+        """
+        if self.strip_whitespace:
+            while start < end and text[start].isspace():
+                start += 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+        
+        if start == end:
+            return None
+        
+        return _ChunkRecord(text[start:end], offset + start, offset + end, split_level, separator)
+    
+    def _measure_pieces(self, text: str, separator: str) -> Tuple[List[int], Iterable[int]]:
+        """
+        Split text by separator and return the size of every piece in
+        characters, plus its measured length.
+        
+        Character and token lengths follow from the piece sizes alone, so in
+        those modes a kept separator is added to the size of the part before
+        it instead of being concatenated back onto the part's text.
+        """
+        if self.length_function == "words":
+            splits = self._split_text_with_separator(text, separator)
+            return [len(split) for split in splits], map(self._measure_fn, splits)
+        
+        if separator == "":
+            piece_chars = [1] * len(text)
+        else:
+            parts = text.split(separator)
+            if self.keep_separator:
+                # Every part but the last carries the separator following it;
+                # an empty last part yields an empty piece, which adds nothing
+                separator_length = len(separator)
+                piece_chars = [len(part) + separator_length for part in parts]
+                piece_chars[-1] -= separator_length
+            else:
+                piece_chars = [len(part) for part in parts]
+        
+        if self.length_function == "tokens":
+            return piece_chars, [chars // 4 for chars in piece_chars]
+        return piece_chars, piece_chars
     
     def _split_text_with_separator(self, text: str, separator: str) -> List[str]:
         """Split text by separator, optionally keeping the separator."""
@@ -418,97 +577,35 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
             return list(text)
         
         if self.keep_separator:
-            # Split while keeping separator with the preceding text
-            splits = []
+            # Split while keeping separator with the preceding text: add the
+            # separator back to all parts except the last, which is only kept
+            # if not empty
             parts = text.split(separator)
-            
-            for i, part in enumerate(parts):
-                if i < len(parts) - 1:
-                    # Add separator back to all parts except the last
-                    splits.append(part + separator)
-                else:
-                    # Last part doesn't get separator
-                    if part:  # Only add if not empty
-                        splits.append(part)
-            
+            last_part = parts.pop()
+            splits = [part + separator for part in parts]
+            if last_part:
+                splits.append(last_part)
             return splits
         else:
             # Simple split without keeping separator
             return text.split(separator)
     
-    def _join_parts(self, parts: List[str], separator: str) -> str:
-        """Join parts back together."""
-        if self.keep_separator:
-            # Parts already have separators attached
-            return "".join(parts)
-        else:
-            # Need to add separator between parts
-            return separator.join(parts)
-    
-    def _apply_overlap(
-        self,
-        chunks: List[Dict[str, Any]],
-        original_text: str
-    ) -> List[Dict[str, Any]]:
-        """Apply overlap between consecutive chunks."""
-        if len(chunks) <= 1 or self.chunk_overlap <= 0:
-            return chunks
-        
-        overlapped_chunks = []
-        
-        for i, chunk in enumerate(chunks):
-            chunk_text = chunk['text']
-            
-            # Add overlap from previous chunk
-            if i > 0:
-                prev_chunk_text = chunks[i - 1]['text']
-                
-                # Take last N units from previous chunk
-                overlap_text = self._get_overlap_text(prev_chunk_text, self.chunk_overlap)
-                
-                if overlap_text:
-                    chunk_text = overlap_text + chunk_text
-            
-            overlapped_chunk = {
-                'text': chunk_text,
-                'split_level': chunk.get('split_level', 0),
-                'separator_used': chunk.get('separator_used'),
-            }
-            
-            # Preserve or merge page numbers when adding overlap
-            if i > 0 and 'page_numbers' in chunk:
-                current_pages = chunk.get('page_numbers', [])
-                prev_pages = chunks[i - 1].get('page_numbers', [])
-                
-                if current_pages and prev_pages:
-                    # Merge page numbers from both chunks
-                    all_pages = sorted(set(current_pages + prev_pages))
-                    overlapped_chunk['page_numbers'] = all_pages
-                elif current_pages:
-                    overlapped_chunk['page_numbers'] = current_pages
-                elif prev_pages:
-                    overlapped_chunk['page_numbers'] = prev_pages
-            elif 'page_numbers' in chunk:
-                overlapped_chunk['page_numbers'] = chunk.get('page_numbers')
-            
-            overlapped_chunks.append(overlapped_chunk)
-        
-        return overlapped_chunks
-    
     def _get_overlap_text(self, text: str, overlap_size: int) -> str:
         """Get overlap text from end of previous chunk."""
-        text_length = self._measure_length(text)
+        if self.length_function == "words":
+            # Word-based overlap: split only the last words off the end
+            # instead of splitting and counting the whole chunk
+            words = text.rsplit(None, overlap_size)
+            if len(words) <= overlap_size:
+                return text
+            return " ".join(words[1:]) + " "
+        
+        text_length = self._measure_fn(text)
         
         if text_length <= overlap_size:
             return text
         
-        if self.length_function == "words":
-            # Word-based overlap
-            words = text.split()
-            overlap_words = words[-overlap_size:]
-            return " ".join(overlap_words) + " "
-        
-        elif self.length_function == "tokens":
+        if self.length_function == "tokens":
             # Approximate token-based overlap (chars * 4)
             char_overlap = overlap_size * 4
             overlap_text = text[-char_overlap:]
@@ -531,58 +628,71 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
             
             return overlap_text + " "
     
-    def _merge_small_chunks(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Merge chunks that are below minimum size."""
-        if not chunks or self.min_chunk_size <= 0:
-            return chunks
+    def _build_chunk_objects(self, chunks: List[_ChunkRecord]) -> List[Dict[str, Any]]:
+        """
+        Build the output chunk objects in a single pass over the chunks.
         
-        merged_chunks = []
+        A chunk below min_chunk_size that is not the last one is merged with
+        the chunk after it, as it is reached, rather than in a separate pass
+        producing an intermediate list.
+        """
+        merge_small = self.min_chunk_size > 0
+        add_metadata = self.add_metadata
+        measure = self._measure_fn
+        last_index = len(chunks) - 1
+        chunk_objects = []
         i = 0
         
-        while i < len(chunks):
-            current_chunk = chunks[i]
-            current_text = current_chunk['text']
-            current_length = self._measure_length(current_text)
+        while i <= last_index:
+            chunk_data = chunks[i]
+            chunk_text = chunk_data.text
+            split_level = chunk_data.split_level
+            page_numbers = chunk_data.page_numbers
+            start = chunk_data.start
+            end = chunk_data.end
+            i += 1
+            
+            # Merge a chunk that is too small with the next one
+            if merge_small and i <= last_index and measure(chunk_text) < self.min_chunk_size:
+                next_chunk = chunks[i]
+                chunk_text += next_chunk.text
+                split_level = min(split_level, next_chunk.split_level)
+                next_pages = next_chunk.page_numbers
+                if page_numbers or next_pages:
+                    page_numbers = sorted(set((page_numbers or []) + (next_pages or [])))
+                else:
+                    page_numbers = None
+                start = min(start, next_chunk.start)
+                end = max(end, next_chunk.end)
+                i += 1
             
-            # Check if chunk is too small and not the last chunk
-            if current_length < self.min_chunk_size and i < len(chunks) - 1:
-                # Merge with next chunk
-                next_chunk = chunks[i + 1]
-                merged_text = current_text + next_chunk['text']
-                
-                merged_chunk = {
-                    'text': merged_text,
-                    'split_level': min(
-                        current_chunk.get('split_level', 0),
-                        next_chunk.get('split_level', 0)
-                    ),
-                    'separator_used': current_chunk.get('separator_used'),
+            chunk_obj = {
+                'text': chunk_text,
+                'chunk_index': len(chunk_objects),
+                'page_number': page_numbers[0] if page_numbers else None,
+            }
+            
+            if add_metadata:
+                chunk_obj['metadata'] = {
+                    'char_count': len(chunk_text),
+                    'word_count': len(chunk_text.split()),
+                    'split_level': split_level,
+                    'separator_used': chunk_data.separator_used,
+                    'page_numbers': page_numbers,
+                    'start_offset': start,
+                    'end_offset': end,
                 }
-                
-                # Merge page numbers if present
-                if 'page_numbers' in current_chunk or 'page_numbers' in next_chunk:
-                    current_pages = current_chunk.get('page_numbers', [])
-                    next_pages = next_chunk.get('page_numbers', [])
-                    if current_pages or next_pages:
-                        merged_chunk['page_numbers'] = sorted(set(current_pages + next_pages))
-                
-                merged_chunks.append(merged_chunk)
-                i += 2  # Skip next chunk as it's merged
-            else:
-                merged_chunks.append(current_chunk)
-                i += 1
+            
+            chunk_objects.append(chunk_obj)
         
-        return merged_chunks
+        return chunk_objects
     
-    def _extract_pages_data(self, data: Dict[str, Any], input_field: str) -> Optional[List[Dict[str, Any]]]:
+    def _extract_pages_data(self, data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         """Extract page data from extractor output if available."""
         # Try to get pages data from various extractor formats
-        field_parts = input_field.split('.')
-        
-        if len(field_parts) > 1:
+        if len(self._input_field_keys) > 1:
             # Nested field like "pdf_output.text"
-            base_field = field_parts[0]
-            base_data = data.get(base_field)
+            base_data = data.get(self._input_field_keys[0])
             
             if isinstance(base_data, dict):
                 # Check for pages array in extractor output
@@ -599,37 +709,51 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
     
     def _add_page_numbers_to_chunks(
         self,
-        chunks: List[Dict[str, Any]],
+        chunks: List[_ChunkRecord],
         full_text: str,
         pages_data: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[_ChunkRecord]:
         """Add page numbers to chunks based on their position in the full text."""
         if not chunks or not pages_data:
             return chunks
         
-        # Build a map of character positions to page numbers
-        char_to_page = self._build_char_to_page_map(full_text, pages_data)
+        # Locate every page once; chunks carry their own offsets
+        page_spans = self._build_page_spans(full_text, pages_data)
         
+        # Chunks and page spans are both in text order, so the first page a
+        # chunk can touch only ever moves forward: sweep them together
+        first_span = 0
+        previous_pages = None
         for chunk in chunks:
-            chunk_text = chunk.get('text', '')
-            if not chunk_text:
-                continue
+            chunk_start = chunk.start
+            while first_span < len(page_spans) and page_spans[first_span][1] <= chunk_start:
+                first_span += 1
             
-            # Find chunk position in full text
-            page_nums = self._get_page_numbers_for_text(chunk_text, full_text, char_to_page, pages_data)
+            page_nums = self._get_page_numbers_for_span(
+                chunk_start, chunk.end, full_text, page_spans, first_span, pages_data
+            )
             
-            if page_nums:
-                chunk['page_numbers'] = page_nums
+            # An overlapped chunk also carries text from the previous chunk's pages
+            if page_nums and previous_pages and self.chunk_overlap > 0:
+                chunk.page_numbers = sorted(set(page_nums + previous_pages))
+            elif page_nums:
+                chunk.page_numbers = page_nums
+            previous_pages = page_nums
         
         return chunks
     
-    def _build_char_to_page_map(
+    def _build_page_spans(
         self,
         full_text: str,
         pages_data: List[Dict[str, Any]]
-    ) -> Dict[int, int]:
-        """Build a mapping of character positions to page numbers."""
-        char_to_page = {}
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Locate pages in the full text with one left-to-right scan.
+        
+        Returns:
+            Sorted, non-overlapping (start, end, page_number) spans
+        """
+        page_spans = []
         current_pos = 0
         
         for page in pages_data:
@@ -639,84 +763,81 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
             if not page_text or not page_num:
                 continue
             
-            # Find page text in full text
-            page_start = full_text.find(page_text, current_pos)
+            # Find the page by its first 100 chars, then confirm the full text
+            # there. Any exact match starts with the fingerprint, so a missing
+            # fingerprint rules out both the exact and the fuzzy match in one
+            # scan; an unconfirmed one is kept as the fuzzy match unless the
+            # exact text turns up further on.
+            page_start = full_text.find(page_text[:100], current_pos)
+            if (
+                page_start != -1
+                and len(page_text) > 100
+                and not full_text.startswith(page_text, page_start)
+            ):
+                exact_start = full_text.find(page_text, page_start + 1)
+                if exact_start != -1:
+                    page_start = exact_start
             
             if page_start != -1:
                 page_end = page_start + len(page_text)
-                
-                # Map each character position in this page to the page number
-                for pos in range(page_start, page_end):
-                    char_to_page[pos] = page_num
-                
+                page_spans.append((page_start, page_end, page_num))
                 current_pos = page_end
-            else:
-                # If exact match fails, try fuzzy matching with first 100 chars
-                if len(page_text) > 100:
-                    fingerprint = page_text[:100]
-                    page_start = full_text.find(fingerprint, current_pos)
-                    
-                    if page_start != -1:
-                        page_end = page_start + len(page_text)
-                        for pos in range(page_start, page_end):
-                            char_to_page[pos] = page_num
-                        current_pos = page_end
         
-        return char_to_page
+        return page_spans
     
-    def _get_page_numbers_for_text(
+    def _get_page_numbers_for_span(
         self,
-        chunk_text: str,
+        chunk_start: int,
+        chunk_end: int,
         full_text: str,
-        char_to_page: Dict[int, int],
+        page_spans: List[Tuple[int, int, int]],
+        first_span: int,
         pages_data: List[Dict[str, Any]]
     ) -> List[int]:
-        """Determine which pages a chunk appears on."""
-        page_numbers = set()
-        
-        if not chunk_text:
-            return []
+        """
+        Determine which pages the chunk at ``full_text[chunk_start:chunk_end]``
+        appears on.
         
-        # Clean chunk text for better matching
-        chunk_text_clean = chunk_text.strip()
-        if not chunk_text_clean:
+        ``first_span`` is the index of the first page span ending after
+        ``chunk_start``; the walk over intersecting pages starts there.
+        """
+        # Measure the chunk without surrounding whitespace
+        while chunk_start < chunk_end and full_text[chunk_start].isspace():
+            chunk_start += 1
+        while chunk_end > chunk_start and full_text[chunk_end - 1].isspace():
+            chunk_end -= 1
+        if chunk_start == chunk_end:
             return []
         
-        # Try to find chunk in full text
-        chunk_start = full_text.find(chunk_text_clean)
-        
-        # If exact match fails, try with first 200 chars as a fingerprint
-        if chunk_start == -1 and len(chunk_text_clean) > 200:
-            fingerprint = chunk_text_clean[:200]
-            chunk_start = full_text.find(fingerprint)
-        
-        if chunk_start != -1:
-            chunk_end = chunk_start + len(chunk_text_clean)
-            
-            # Get page numbers from character positions
-            for pos in range(chunk_start, min(chunk_end, len(full_text))):
-                if pos in char_to_page:
-                    page_numbers.add(char_to_page[pos])
-            
-            if page_numbers:
-                return sorted(page_numbers)
+        # Walk forward over every page that intersects the chunk
+        page_numbers = set()
+        index = first_span
+        while index < len(page_spans):
+            page_start, page_end, page_num = page_spans[index]
+            if page_start >= chunk_end:
+                break
+            if page_end > chunk_start:
+                page_numbers.add(page_num)
+            index += 1
+        
+        if page_numbers:
+            return sorted(page_numbers)
         
         # Fallback: check which pages contain parts of the chunk text
-        if not page_numbers:
-            # Extract first and last few words as markers
-            words = chunk_text_clean.split()
-            if len(words) >= 5:
-                first_words = ' '.join(words[:5])
-                last_words = ' '.join(words[-5:])
+        # Extract first and last few words as markers
+        words = full_text[chunk_start:chunk_end].split()
+        if len(words) >= 5:
+            first_words = ' '.join(words[:5])
+            last_words = ' '.join(words[-5:])
+            
+            for page in pages_data:
+                page_text = page.get('text', '')
+                page_num = page.get('page_number', 0)
                 
-                for page in pages_data:
-                    page_text = page.get('text', '')
-                    page_num = page.get('page_number', 0)
-                    
-                    # Check if any significant portion appears in this page
-                    if first_words in page_text or last_words in page_text:
-                        if page_num:
-                            page_numbers.add(page_num)
+                # Check if any significant portion appears in this page
+                if first_words in page_text or last_words in page_text:
+                    if page_num:
+                        page_numbers.add(page_num)
         
         # Last resort: assign to first page if available
         if not page_numbers and pages_data:
@@ -725,3 +846,18 @@ class RecursiveTextChunkerExecutor(ParallelExecutor):
                 page_numbers.add(first_page_num)
         
         return sorted(page_numbers)
+
+
+# Chunker used by split_workers processes, built once per worker process
+_worker_chunker: Optional[RecursiveTextChunkerExecutor] = None
+
+
+def _init_split_worker(executor_id: str, settings: Dict[str, Any]) -> None:
+    """Build the chunker a split_workers process splits text with."""
+    global _worker_chunker
+    _worker_chunker = RecursiveTextChunkerExecutor(id=executor_id, settings=settings)
+
+
+def _split_in_worker(text: str, text_length: int) -> List[_ChunkRecord]:
+    """Split text in a split_workers process."""
+    return _worker_chunker._split_text_recursive(text, text_length)
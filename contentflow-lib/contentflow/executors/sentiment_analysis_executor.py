@@ -2,7 +2,8 @@
 
 import logging
 import json
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 from .azure_openai_agent_executor import AzureOpenAIAgentExecutor
 from ..models import Content
@@ -10,6 +11,143 @@ from ..models import Content
 logger = logging.getLogger("contentflow.executors.sentiment_analysis_executor")
 
 
+_SCALE_INSTRUCTIONS = {
+    "3-point": "Classify sentiment as: positive, neutral, or negative. ",
+    "5-point": "Classify sentiment on a 5-point scale: very positive, positive, neutral, negative, very negative. ",
+}
+
+_GRANULARITY_INSTRUCTIONS = {
+    "document": "Analyze the overall sentiment of the entire text. ",
+    "sentence": "Analyze sentiment for each sentence separately. ",
+    "aspect": "Analyze sentiment for these specific aspects: {aspects}. ",
+}
+
+_CONFIDENCE_INSTRUCTIONS = {
+    True: "Provide a confidence score (0.0 to 1.0) for your sentiment classification. ",
+    False: "",
+}
+
+_EMOTION_INSTRUCTIONS = {
+    True: "Also identify specific emotions present (e.g., joy, anger, sadness, fear, surprise, disgust). ",
+    False: "",
+}
+
+# Output format by (granularity, include_emotions)
+_SENTENCE_FORMAT = 'Format: {"sentences": [{"text": "sentence", "sentiment": "...", "confidence": 0.0-1.0}], "overall": {...}}. '
+_ASPECT_FORMAT = 'Format: {"aspects": {"aspect_name": {"sentiment": "...", "confidence": 0.0-1.0}}, "overall": {...}}. '
+_OUTPUT_FORMATS = {
+    ("document", True): 'Format: {"sentiment": "positive/neutral/negative", "confidence": 0.0-1.0, "emotions": ["emotion1", "emotion2"], "explanation": "brief reason"}. ',
+    ("document", False): 'Format: {"sentiment": "positive/neutral/negative", "confidence": 0.0-1.0, "explanation": "brief reason"}. ',
+    ("sentence", True): _SENTENCE_FORMAT,
+    ("sentence", False): _SENTENCE_FORMAT,
+    ("aspect", True): _ASPECT_FORMAT,
+    ("aspect", False): _ASPECT_FORMAT,
+}
+
+
+def _effective_granularity(granularity: str, aspects: Tuple[str, ...]) -> str:
+    """
+    Resolve the granularity the analysis actually uses.
+    
+    Aspect analysis without aspects, or an unknown granularity, falls back
+    to analyzing the overall sentiment. Shared by the instructions and the
+    response format so both always describe the same output.
+    """
+    if granularity == "aspect" and aspects:
+        return "aspect"
+    if granularity == "sentence":
+        return "sentence"
+    return "document"
+
+
+@lru_cache(maxsize=128)
+def _build_instructions(
+    granularity: str,
+    scale: str,
+    include_confidence: bool,
+    include_emotions: bool,
+    aspects: Tuple[str, ...],
+) -> str:
+    """
+    Render the agent instructions for the given sentiment settings.
+    
+    Cached per configuration, so executors created with the same settings
+    (e.g. one per worker or per document) share a single string.
+    """
+    granularity = _effective_granularity(granularity, aspects)
+    granularity_instruction = _GRANULARITY_INSTRUCTIONS[granularity].format(aspects=", ".join(aspects))
+    
+    return "".join((
+        "You are an expert sentiment analysis system. ",
+        _SCALE_INSTRUCTIONS.get(scale, _SCALE_INSTRUCTIONS["3-point"]),
+        granularity_instruction,
+        _CONFIDENCE_INSTRUCTIONS[bool(include_confidence)],
+        _EMOTION_INSTRUCTIONS[bool(include_emotions)],
+        "Return results as a JSON object. ",
+        _OUTPUT_FORMATS[(granularity, bool(include_emotions))],
+        "Be objective and consistent in your analysis.",
+    ))
+
+
+_SCALE_LABELS = {
+    "3-point": ["positive", "neutral", "negative"],
+    "5-point": ["very positive", "positive", "neutral", "negative", "very negative"],
+}
+
+
+def _object_schema(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Strict JSON schema object requiring all of its properties."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+@lru_cache(maxsize=128)
+def _build_response_format(
+    granularity: str,
+    scale: str,
+    include_confidence: bool,
+    include_emotions: bool,
+    aspects: Tuple[str, ...],
+) -> Dict[str, Any]:
+    """
+    Build the JSON schema response format matching the output format
+    described in the instructions for the given settings.
+    
+    Cached like the instructions; callers must not modify the result.
+    """
+    sentiment = {"sentiment": {"type": "string", "enum": _SCALE_LABELS.get(scale, _SCALE_LABELS["3-point"])}}
+    if include_confidence:
+        sentiment["confidence"] = {"type": "number"}
+    
+    granularity = _effective_granularity(granularity, aspects)
+    if granularity == "aspect":
+        properties = {
+            "aspects": _object_schema({aspect: _object_schema(sentiment) for aspect in aspects}),
+            "overall": _object_schema(sentiment),
+        }
+    elif granularity == "sentence":
+        sentence = {"text": {"type": "string"}, **sentiment}
+        properties = {
+            "sentences": {"type": "array", "items": _object_schema(sentence)},
+            "overall": _object_schema(sentiment),
+        }
+    else:
+        properties = dict(sentiment)
+        properties["explanation"] = {"type": "string"}
+    
+    if include_emotions:
+        properties["emotions"] = {"type": "array", "items": {"type": "string"}}
+    
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": "sentiment_analysis", "strict": True, "schema": _object_schema(properties)},
+    }
+
+
 class SentimentAnalysisExecutor(AzureOpenAIAgentExecutor):
     """
     Specialized executor for sentiment analysis.
@@ -31,6 +169,11 @@ class SentimentAnalysisExecutor(AzureOpenAIAgentExecutor):
           Options: "3-point" (positive/neutral/negative),
                    "5-point" (very positive to very negative)
           Default: "3-point"
+        - structured_output (bool): Constrain the response to a JSON schema
+          matching the settings above, so it always parses. Requires a
+          deployment and API version with structured output support; others
+          reject the request
+          Default: False
         - input_field (str): Field containing text to analyze
           Default: "text"
         - output_field (str): Field name for sentiment results
@@ -78,50 +221,15 @@ class SentimentAnalysisExecutor(AzureOpenAIAgentExecutor):
         scale = settings.get("scale", "3-point")
         
         # Build specialized instructions
-        instructions = "You are an expert sentiment analysis system. "
-        
-        if scale == "5-point":
-            instructions += "Classify sentiment on a 5-point scale: very positive, positive, neutral, negative, very negative. "
-        else:
-            instructions += "Classify sentiment as: positive, neutral, or negative. "
-        
-        if granularity == "sentence":
-            instructions += "Analyze sentiment for each sentence separately. "
-        elif granularity == "aspect" and aspects:
-            instructions += f"Analyze sentiment for these specific aspects: {', '.join(aspects)}. "
-        else:
-            instructions += "Analyze the overall sentiment of the entire text. "
-        
-        if include_confidence:
-            instructions += "Provide a confidence score (0.0 to 1.0) for your sentiment classification. "
-        
-        if include_emotions:
-            instructions += "Also identify specific emotions present (e.g., joy, anger, sadness, fear, surprise, disgust). "
-        
-        # Define output format
-        instructions += "Return results as a JSON object. "
-        
-        if granularity == "document":
-            if include_emotions:
-                instructions += 'Format: {"sentiment": "positive/neutral/negative", "confidence": 0.0-1.0, "emotions": ["emotion1", "emotion2"], "explanation": "brief reason"}. '
-            else:
-                instructions += 'Format: {"sentiment": "positive/neutral/negative", "confidence": 0.0-1.0, "explanation": "brief reason"}. '
-        elif granularity == "sentence":
-            instructions += 'Format: {"sentences": [{"text": "sentence", "sentiment": "...", "confidence": 0.0-1.0}], "overall": {...}}. '
-        elif granularity == "aspect":
-            instructions += 'Format: {"aspects": {"aspect_name": {"sentiment": "...", "confidence": 0.0-1.0}}, "overall": {...}}. '
-        
-        instructions += "Be objective and consistent in your analysis."
-        
-        # Set default fields
-        if "input_field" not in settings:
-            settings["input_field"] = "text"
-        if "output_field" not in settings:
-            settings["output_field"] = "sentiment"
+        instructions = _build_instructions(
+            granularity, scale, include_confidence, include_emotions, tuple(aspects or ())
+        )
         
-        # Override instructions
-        settings["instructions"] = instructions
-        settings["parse_response_as_json"] = True  # Ensure JSON parsing by parent
+        self._task_settings(settings, instructions, output_field="sentiment", parse_response_as_json=True)
+        if settings.get("structured_output", False):
+            settings["response_format"] = _build_response_format(
+                granularity, scale, include_confidence, include_emotions, tuple(aspects or ())
+            )
         
         # Call parent constructor
         super().__init__(
@@ -130,10 +238,10 @@ class SentimentAnalysisExecutor(AzureOpenAIAgentExecutor):
             **kwargs
         )
         
-        if self.debug_mode:
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"SentimentAnalysisExecutor initialized with granularity={granularity}, "
-                f"scale={scale}"
+                "SentimentAnalysisExecutor initialized with granularity=%s, scale=%s",
+                granularity, scale
             )
     
     async def process_content_item(self, content: Content) -> Content:
@@ -1,6 +1,7 @@
 """Summarization executor using Azure OpenAI Agent."""
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from contentflow.models._content import Content
@@ -8,6 +9,59 @@ from .azure_openai_agent_executor import AzureOpenAIAgentExecutor
 
 logger = logging.getLogger("contentflow.executors.summarization_executor")
 
+_LENGTH_INSTRUCTIONS = {
+    "brief": "Provide a very brief summary in 1-2 sentences.",
+    "short": "Provide a concise summary in 3-5 sentences.",
+    "medium": "Provide a summary in one paragraph (5-8 sentences).",
+    "detailed": "Provide a detailed summary in multiple paragraphs."
+}
+
+# Response token cap per summary length for cap_tokens_by_length, about
+# twice the expected summary so it stops runaway output without cutting
+# summaries short on non-reasoning deployments
+_LENGTH_MAX_TOKENS = {
+    "brief": 120,
+    "short": 300,
+    "medium": 600,
+    "detailed": 1500
+}
+
+_STYLE_INSTRUCTIONS = {
+    "bullet_points": "Format the summary as bullet points highlighting the main points.",
+    "paragraph": "Write the summary as a cohesive paragraph.",
+    "abstract": "Write the summary in an academic abstract style."
+}
+
+
+@lru_cache(maxsize=128)
+def _build_instructions(
+    summary_length: str,
+    summary_style: str,
+    focus_areas: Optional[str],
+    preserve_key_facts: bool,
+) -> str:
+    """
+    Render the agent instructions for the given summarization settings.
+    
+    Cached per configuration, so executors created with the same settings
+    share a single string.
+    """
+    parts = [
+        "You are an expert text summarizer. ",
+        _LENGTH_INSTRUCTIONS.get(summary_length, _LENGTH_INSTRUCTIONS["short"]),
+        " ",
+        _STYLE_INSTRUCTIONS.get(summary_style, _STYLE_INSTRUCTIONS["paragraph"]),
+    ]
+    
+    if preserve_key_facts:
+        parts.append(" Ensure all key facts, figures, and important details are preserved.")
+    
+    if focus_areas:
+        parts.append(f" Focus particularly on: {focus_areas}.")
+    
+    parts.append(" Maintain objectivity and accuracy in your summaries.")
+    return "".join(parts)
+
 
 class SummarizationExecutor(AzureOpenAIAgentExecutor):
     """
@@ -29,6 +83,15 @@ class SummarizationExecutor(AzureOpenAIAgentExecutor):
           Default: None (summarize all content)
         - preserve_key_facts (bool): Ensure key facts are preserved
           Default: True
+        - max_tokens (int): Maximum tokens in the summary. On reasoning
+          deployments, reasoning tokens count against this limit as well,
+          so a tight limit can return empty or cut-off summaries
+          Default: None (uses model default)
+        - cap_tokens_by_length (bool): When max_tokens is not set, cap the
+          response by summary_length: 120 (brief), 300 (short), 600 (medium),
+          1500 (detailed). The caps only leave room for the summary itself;
+          do not enable this for reasoning deployments
+          Default: False
         - input_field (str): Field containing text to summarize
           Default: "text"
         - output_field (str): Field name for summary
@@ -74,40 +137,14 @@ class SummarizationExecutor(AzureOpenAIAgentExecutor):
         preserve_key_facts = settings.get("preserve_key_facts", True)
         
         # Build specialized instructions
-        length_instructions = {
-            "brief": "Provide a very brief summary in 1-2 sentences.",
-            "short": "Provide a concise summary in 3-5 sentences.",
-            "medium": "Provide a summary in one paragraph (5-8 sentences).",
-            "detailed": "Provide a detailed summary in multiple paragraphs."
-        }
-        
-        style_instructions = {
-            "bullet_points": "Format the summary as bullet points highlighting the main points.",
-            "paragraph": "Write the summary as a cohesive paragraph.",
-            "abstract": "Write the summary in an academic abstract style."
-        }
-        
-        instructions = "You are an expert text summarizer. "
-        instructions += length_instructions.get(summary_length, length_instructions["short"])
-        instructions += " " + style_instructions.get(summary_style, style_instructions["paragraph"])
-        
-        if preserve_key_facts:
-            instructions += " Ensure all key facts, figures, and important details are preserved."
-        
-        if focus_areas:
-            instructions += f" Focus particularly on: {focus_areas}."
-        
-        instructions += " Maintain objectivity and accuracy in your summaries."
-        
-        # Set default fields if not provided
-        if "input_field" not in settings:
-            settings["input_field"] = "text"
-        if "output_field" not in settings:
-            settings["output_field"] = "summary"
+        instructions = _build_instructions(
+            summary_length, summary_style, str(focus_areas) if focus_areas else None, preserve_key_facts
+        )
         
-        # Override instructions
-        settings["instructions"] = instructions
-        settings["parse_response_as_json"] = False  # Summaries are plain text
+        # Summaries are plain text
+        self._task_settings(settings, instructions, output_field="summary", parse_response_as_json=False)
+        if settings.get("cap_tokens_by_length", False) and settings.get("max_tokens") is None:
+            settings["max_tokens"] = _LENGTH_MAX_TOKENS.get(summary_length, _LENGTH_MAX_TOKENS["short"])
         
         # Call parent constructor
         super().__init__(
@@ -116,10 +153,10 @@ class SummarizationExecutor(AzureOpenAIAgentExecutor):
             **kwargs
         )
         
-        if self.debug_mode:
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"SummarizationExecutor initialized with length={summary_length}, "
-                f"style={summary_style}"
+                "SummarizationExecutor initialized with length=%s, style=%s",
+                summary_length, summary_style
             )
 
     async def process_content_item(self, content: Content) -> Content:
@@ -1,13 +1,99 @@
 """Translation executor using Azure OpenAI Agent."""
 
+import json
 import logging
-from typing import Dict, Any, Optional, List
+import re
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 
 from contentflow.models._content import Content
 from .azure_openai_agent_executor import AzureOpenAIAgentExecutor
 
 logger = logging.getLogger("contentflow.executors.translation_executor")
 
+# Translation style
+_STYLE_INSTRUCTIONS = {
+    "formal": "Use formal language and professional tone.",
+    "informal": "Use casual, conversational language.",
+    "technical": "Use precise technical terminology appropriate for the domain.",
+    "literal": "Provide a literal, word-for-word translation where possible.",
+    "natural": "Provide a natural, fluent translation that reads well in the target language."
+}
+
+# Preserved terms are sent as numbered placeholders and restored afterwards
+_PLACEHOLDER = "\u27e6{}\u27e7"
+_PLACEHOLDER_RE = re.compile("\u27e6(\\d+)\u27e7")
+
+# Formatting kept out of the translation request: code blocks, paragraph
+# breaks and list or heading markers. Inline code stays in its sentence.
+_FORMATTING_RE = re.compile(
+    r"(```[\s\S]*?```|\n{2,}|^[ \t]*(?:[-*+]|\d+[.)]|#{1,6})[ \t]+)",
+    re.MULTILINE
+)
+
+
+class _SegmentCountError(ValueError):
+    """A segmented translation did not return one translation per segment."""
+
+
+@lru_cache(maxsize=128)
+def _build_terminology_pattern(terms: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile one alternation matching any of the terms as a whole word.
+    
+    Longer terms are tried first, so a term is never split by a shorter
+    term it contains.
+    """
+    alternatives = "|".join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True) if term)
+    if not alternatives:
+        return None
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)")
+
+
+@lru_cache(maxsize=128)
+def _build_instructions(
+    target_language: str,
+    source_language: Optional[str],
+    translation_style: str,
+    preserve_formatting: bool,
+    mask_terminology: bool,
+    glossary: Tuple[Tuple[str, str], ...],
+) -> str:
+    """
+    Render the agent instructions for the given translation settings.
+    
+    Cached per configuration, so executors created with the same settings
+    share a single string. The glossary is passed as its (source_term,
+    target_term) items sorted by source term, so the same glossary given in
+    a different order renders the same instructions and prompt cache key.
+    """
+    parts = ["You are an expert translation system. "]
+    
+    if source_language:
+        parts.append(f"Translate the following text from {source_language} to {target_language}. ")
+    else:
+        parts.append(f"Translate the following text to {target_language}. ")
+    
+    parts.append(_STYLE_INSTRUCTIONS.get(translation_style, _STYLE_INSTRUCTIONS["natural"]))
+    parts.append(" ")
+    
+    if preserve_formatting:
+        parts.append(
+            "Preserve line breaks. When the text is given as a JSON array of text segments, "
+            "translate each segment and respond with only a JSON array of the translations, in the same order. "
+        )
+    
+    if mask_terminology:
+        parts.append(f"Keep placeholders such as {_PLACEHOLDER.format(0)} exactly as they appear. ")
+    
+    if glossary:
+        parts.append("\n\nUse this translation glossary:\n")
+        parts.extend(f"- '{source_term}' → '{target_term}'\n" for source_term, target_term in glossary)
+    
+    parts.append("\nProvide only the translated text without explanations or notes. ")
+    parts.append("Ensure accuracy and cultural appropriateness in the translation.")
+    return "".join(parts)
+
 
 class TranslationExecutor(AzureOpenAIAgentExecutor):
     """
@@ -21,12 +107,21 @@ class TranslationExecutor(AzureOpenAIAgentExecutor):
           Required: Must be provided (e.g., "Spanish", "French", "Japanese")
         - source_language (str): Source language (auto-detect if not specified)
           Default: None (auto-detect)
+        - source_language_field (str): Field holding a detected source
+          language, e.g. "language.language" after language detection.
+          Takes precedence over source_language when present
+          Default: None
         - translation_style (str): Style of translation
           Options: "formal", "informal", "technical", "literal", "natural"
           Default: "natural"
-        - preserve_formatting (bool): Preserve original text formatting
+        - preserve_formatting (bool): Preserve original text formatting.
+          Code, paragraph breaks and list or heading markers are kept out of
+          the request; only the text segments between them are sent, as a
+          JSON array, and the translations are put back in place
           Default: True
-        - preserve_terminology (list[str]): Terms to not translate
+        - preserve_terminology (list[str]): Terms to not translate. Whole-word
+          occurrences are replaced by numbered placeholders before the text
+          is sent and restored in the translation
           Default: None
         - glossary (dict): Custom translation glossary {source_term: target_term}
           Default: None
@@ -62,7 +157,9 @@ class TranslationExecutor(AzureOpenAIAgentExecutor):
         
     Output:
         Document with added fields:
-        - data[output_field]: Translated text
+        - data[output_field]: Translated text. Empty text, and text whose
+          source language equals the target language, is copied as is
+          without an agent call
         - data[output_field + '_source']: Original text (if include_source=True)
     """
     
@@ -87,52 +184,22 @@ class TranslationExecutor(AzureOpenAIAgentExecutor):
         include_source = settings.get("include_source", False)
         
         # Build specialized instructions
-        instructions = "You are an expert translation system. "
-        
-        if source_language:
-            instructions += f"Translate the following text from {source_language} to {target_language}. "
-        else:
-            instructions += f"Translate the following text to {target_language}. "
-        
-        # Translation style
-        style_instructions = {
-            "formal": "Use formal language and professional tone.",
-            "informal": "Use casual, conversational language.",
-            "technical": "Use precise technical terminology appropriate for the domain.",
-            "literal": "Provide a literal, word-for-word translation where possible.",
-            "natural": "Provide a natural, fluent translation that reads well in the target language."
-        }
-        instructions += style_instructions.get(translation_style, style_instructions["natural"])
-        instructions += " "
-        
-        if preserve_formatting:
-            instructions += "Preserve the original text formatting, including line breaks, paragraphs, and structure. "
-        
-        if preserve_terminology:
-            instructions += f"Do NOT translate the following terms (keep them in the original language): {', '.join(preserve_terminology)}. "
-        
-        if glossary:
-            instructions += "\n\nUse this translation glossary:\n"
-            for source_term, target_term in glossary.items():
-                instructions += f"- '{source_term}' → '{target_term}'\n"
-        
-        instructions += "\nProvide only the translated text without explanations or notes. "
-        instructions += "Ensure accuracy and cultural appropriateness in the translation."
+        instructions = _build_instructions(
+            target_language,
+            source_language,
+            translation_style,
+            preserve_formatting,
+            bool(preserve_terminology),
+            tuple(sorted(glossary.items(), key=lambda item: str(item[0]))) if glossary else (),
+        )
         
-        # Set default fields
-        if "input_field" not in settings:
-            settings["input_field"] = "text"
-        if "output_field" not in settings:
-            settings["output_field"] = "translated_text"
+        # Translations are plain text
+        self._task_settings(settings, instructions, output_field="translated_text", parse_response_as_json=False)
         
         # Store include_source for post-processing
         self.include_source = include_source
         self.source_field = f"{settings['output_field']}_source"
         
-        # Override instructions
-        settings["instructions"] = instructions
-        settings["parse_response_as_json"] = False  # Translations are plain text
-        
         # Call parent constructor
         super().__init__(
             id=id,
@@ -141,14 +208,143 @@ class TranslationExecutor(AzureOpenAIAgentExecutor):
         )
         
         self.target_language = target_language
+        self.source_language = source_language
+        self.source_language_field = self.get_setting("source_language_field", default=None)
+        self.preserve_formatting = preserve_formatting
+        self.preserve_terminology = tuple(term for term in preserve_terminology or () if term)
+        self._terminology_pattern = _build_terminology_pattern(self.preserve_terminology)
+        self._term_placeholders = {
+            term: _PLACEHOLDER.format(index) for index, term in enumerate(self.preserve_terminology)
+        }
         
-        if self.debug_mode:
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"TranslationExecutor initialized with target={target_language}, "
-                f"style={translation_style}"
+                "TranslationExecutor initialized with target=%s, style=%s",
+                target_language, translation_style
             )
 
     async def process_content_item(self, content: Content) -> Content:
-        """Process content and parse JSON sentiment output."""
-        content = await super().process_content_item(content)
-        return content
\ No newline at end of file
+        """
+        Translate a content item.
+        
+        When a segmented request does not return one translation per
+        segment, the text is translated again as a whole, the way it is sent
+        without preserve_formatting.
+        """
+        try:
+            return await super().process_content_item(content)
+        except _SegmentCountError as e:
+            logger.warning(f"{self.id} - {e}; retrying without segmenting")
+        
+        response_text, full_response = await self._run_agent(self._get_masked_text(content))
+        self._store_translation(content, response_text, full_response)
+        return content
+    
+    def _get_query(self, content: Content) -> str:
+        """
+        Extract the text to translate, with preserved terms masked. Text
+        with formatting is sent as a JSON array of its text segments.
+        """
+        text = self._get_masked_text(content)
+        segments = self._split_formatting(text)
+        if segments is None:
+            return text
+        return json.dumps([segments[i].strip() for i in range(0, len(segments), 2) if segments[i].strip()], ensure_ascii=False)
+    
+    def _get_masked_text(self, content: Content) -> str:
+        """Extract the input text with preserved terms replaced by placeholders."""
+        text = super()._get_query(content)
+        if self._terminology_pattern is None:
+            return text
+        return self._terminology_pattern.sub(lambda match: self._term_placeholders[match.group()], text)
+    
+    def _split_formatting(self, text: str) -> Optional[List[str]]:
+        """
+        Split text into alternating text and formatting segments, text first.
+        
+        Returns None when formatting is not preserved locally or the text
+        has no formatting to keep.
+        """
+        if not self.preserve_formatting:
+            return None
+        segments = _FORMATTING_RE.split(text)
+        if len(segments) == 1:
+            return None
+        return segments
+    
+    def _merge_segments(self, content: Content, response_text: str) -> str:
+        """
+        Put translated text segments back between the original formatting.
+        
+        Raises _SegmentCountError when the response does not hold one
+        translation per segment, so the raw array is never stored.
+        """
+        segments = self._split_formatting(self._get_masked_text(content))
+        if segments is None:
+            return response_text
+        
+        indices = [i for i in range(0, len(segments), 2) if segments[i].strip()]
+        translations = self._parse_batch_response(response_text, len(indices))
+        if translations is None:
+            raise _SegmentCountError(
+                f"Expected a JSON array of {len(indices)} translated segments for content {content.id}"
+            )
+        
+        for index, translation in zip(indices, translations):
+            # Keep the whitespace around each segment from the original
+            segment = segments[index]
+            stripped = segment.strip()
+            start = segment.index(stripped)
+            segments[index] = segment[:start] + str(translation).strip() + segment[start + len(stripped):]
+        return "".join(segments)
+    
+    def _restore_terminology(self, text: str) -> str:
+        """Replace term placeholders in a translation with the original terms."""
+        terms = self.preserve_terminology
+        
+        def restore(match: re.Match) -> str:
+            index = int(match.group(1))
+            return terms[index] if index < len(terms) else match.group()
+        
+        return _PLACEHOLDER_RE.sub(restore, text)
+    
+    def _get_local_response(self, content: Content, query: str) -> Optional[str]:
+        """
+        Return the text unchanged when there is nothing to translate.
+        
+        The query is returned as is, which is also the untranslated form
+        of a segment array.
+        """
+        # "[]" is formatted text without any text segments
+        if not query.strip() or query == "[]":
+            return query
+        
+        source_language = None
+        if self.source_language_field:
+            source_language = self.try_extract_nested_field_from_content(
+                content=content,
+                field_path=self.source_language_field
+            )
+        if not isinstance(source_language, str):
+            source_language = self.source_language
+        
+        if source_language and source_language.strip().lower() == self.target_language.strip().lower():
+            return query
+        return None
+    
+    def _store_response(self, content: Content, response_text: Any, full_response: Any) -> None:
+        """Store the translation of a query built by _get_query."""
+        if isinstance(response_text, str):
+            response_text = self._merge_segments(content, response_text)
+        self._store_translation(content, response_text, full_response)
+    
+    def _store_translation(self, content: Content, response_text: Any, full_response: Any) -> None:
+        """Store a whole translation, and the original text if include_source is set."""
+        if isinstance(response_text, str) and self._terminology_pattern is not None:
+            response_text = self._restore_terminology(response_text)
+        super()._store_response(content, response_text, full_response)
+        if self.include_source:
+            content.data[self.source_field] = self.try_extract_nested_field_from_content(
+                content=content,
+                field_path=self.input_field
+            )
\ No newline at end of file
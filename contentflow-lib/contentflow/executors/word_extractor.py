@@ -1,17 +1,23 @@
 """Word document extraction executor using python-docx for text, paragraphs, and tables."""
 
+import asyncio
 import base64
 import io
 import logging
+import posixpath
+import zipfile
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 
 try:
     from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.styles import BabelFish
     from docx.oxml.table import CT_Tbl
     from docx.oxml.text.paragraph import CT_P
     from docx.table import _Cell, Table
     from docx.text.paragraph import Paragraph
+    from lxml import etree
 except ImportError:
     raise ImportError(
         "python-docx is required for Word document extraction. "
@@ -20,9 +26,289 @@ except ImportError:
 
 from . import ParallelExecutor
 from ..models import Content
+from ..utils.process_pools import get_process_pool
 
 logger = logging.getLogger("contentflow.executors.word_extractor")
 
+# Clark-notation ("{namespace}local") tags for reading WordprocessingML.
+# lxml compares element tags in this form, so these constants can be passed
+# straight to iterparse, find and iterchildren, and compared with .tag,
+# without the namespace-prefix lookup docx.oxml.ns.qn() does on every call
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = _W + "body"
+_P = _W + "p"
+_PPR = _W + "pPr"
+_PSTYLE = _W + "pStyle"
+_R = _W + "r"
+_HYPERLINK = _W + "hyperlink"
+_T = _W + "t"
+_BR = _W + "br"
+_TAB = _W + "tab"
+_PTAB = _W + "ptab"
+_CR = _W + "cr"
+_NO_BREAK_HYPHEN = _W + "noBreakHyphen"
+_TBL = _W + "tbl"
+_TBL_GRID = _W + "tblGrid"
+_GRID_COL = _W + "gridCol"
+_TR = _W + "tr"
+_TR_PR = _W + "trPr"
+_GRID_BEFORE = _W + "gridBefore"
+_TC = _W + "tc"
+_TC_PR = _W + "tcPr"
+_GRID_SPAN = _W + "gridSpan"
+_V_MERGE = _W + "vMerge"
+_STYLE = _W + "style"
+_NAME = _W + "name"
+_VAL = _W + "val"
+_TYPE = _W + "type"
+_STYLE_ID = _W + "styleId"
+_DEFAULT = _W + "default"
+
+_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_OFFICE_DOCUMENT_REL = "/officeDocument"
+_STYLES_REL = "/styles"
+
+# Text equivalents of run content other than w:t and w:br, as python-docx
+# renders them in Paragraph.text
+_RUN_CHAR_TEXT = {
+    _TAB: "\t",
+    _PTAB: "\t",
+    _CR: "\n",
+    _NO_BREAK_HYPHEN: "-",
+}
+
+
+def _related_part_name(package: zipfile.ZipFile, part_name: str, rel_suffix: str) -> Optional[str]:
+    """
+    Resolve the zip member related to ``part_name`` by the first
+    relationship whose type ends with ``rel_suffix``; an empty
+    ``part_name`` reads the package relationships.
+    """
+    part_dir, part_file = posixpath.split(part_name)
+    rels_name = posixpath.join(part_dir, "_rels", part_file + ".rels")
+    try:
+        rels = etree.fromstring(package.read(rels_name))
+    except KeyError:
+        return None
+    for rel in rels.iterchildren(_RELATIONSHIP):
+        if rel.get("Type", "").endswith(rel_suffix) and rel.get("TargetMode") != "External":
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join(part_dir, target))
+    return None
+
+
+def _read_paragraph_styles(
+    package: zipfile.ZipFile,
+    styles_name: Optional[str]
+) -> Tuple[Dict[str, Optional[str]], Optional[str]]:
+    """
+    Map paragraph style ids to UI style names, plus the default paragraph
+    style name, resolved the way python-docx resolves ``Paragraph.style``.
+    """
+    names: Dict[str, Optional[str]] = {}
+    default_name = None
+    if styles_name is None:
+        return names, default_name
+    
+    for style in etree.fromstring(package.read(styles_name)).iterchildren(_STYLE):
+        if style.get(_TYPE) != "paragraph":
+            continue
+        name = style.find(_NAME)
+        name = BabelFish.internal2ui(name.get(_VAL)) if name is not None and name.get(_VAL) is not None else None
+        names.setdefault(style.get(_STYLE_ID), name)
+        if style.get(_DEFAULT) in ("1", "true", "on"):
+            default_name = name
+    return names, default_name
+
+
+def _paragraph_text(p: etree._Element) -> str:
+    """Text of a w:p element, matching python-docx ``Paragraph.text``."""
+    parts = []
+    for child in p:
+        if child.tag == _R:
+            runs = (child,)
+        elif child.tag == _HYPERLINK:
+            runs = child.iterchildren(_R)
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                tag = item.tag
+                if tag == _T:
+                    if item.text:
+                        parts.append(item.text)
+                elif tag == _BR:
+                    if item.get(_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif tag in _RUN_CHAR_TEXT:
+                    parts.append(_RUN_CHAR_TEXT[tag])
+    return "".join(parts)
+
+
+def _is_blank(text: str) -> bool:
+    """
+    Same as ``not text.strip()``, without allocating a stripped copy of
+    every paragraph: strip() removes exactly the characters isspace() tests.
+    """
+    return not text or text.isspace()
+
+
+def _paragraph_style_id(p: etree._Element) -> Optional[str]:
+    """Style id of a w:p element (``w:pPr/w:pStyle/@w:val``), or None."""
+    p_pr = p.find(_PPR)
+    p_style = p_pr.find(_PSTYLE) if p_pr is not None else None
+    return p_style.get(_VAL) if p_style is not None else None
+
+
+def _cell_text(tc: etree._Element) -> str:
+    """Text of a w:tc element, matching python-docx ``_Cell.text``."""
+    return "\n".join(_paragraph_text(p) for p in tc.iterchildren(_P))
+
+
+def _property_int(parent: Optional[etree._Element], tag: str, default: int) -> int:
+    """Integer w:val of the ``tag`` child of a properties element."""
+    prop = parent.find(tag) if parent is not None else None
+    if prop is None or prop.get(_VAL) is None:
+        return default
+    return int(prop.get(_VAL))
+
+
+def _table_rows(tbl: etree._Element) -> List[List[str]]:
+    """
+    Cell texts of a w:tbl element, row by row, in a single pass.
+    
+    Rows match python-docx ``_Row.cells``: a cell spanning several grid
+    columns repeats once per column, and a vertically merged cell repeats
+    the text of the cell that starts the merge. Cells are tracked by their
+    starting grid offset in the previous row, so merges resolve without
+    looking back up the table.
+    """
+    rows = []
+    above: Dict[int, Tuple[str, int]] = {}
+    
+    for tr in tbl.iterchildren(_TR):
+        row_data = []
+        current: Dict[int, Tuple[str, int]] = {}
+        grid_offset = _property_int(tr.find(_TR_PR), _GRID_BEFORE, 0)
+        
+        for tc in tr.iterchildren(_TC):
+            tc_pr = tc.find(_TC_PR)
+            grid_span = _property_int(tc_pr, _GRID_SPAN, 1)
+            v_merge = tc_pr.find(_V_MERGE) if tc_pr is not None else None
+            
+            if v_merge is not None and v_merge.get(_VAL, "continue") == "continue":
+                # Continuation of a vertical merge: the cell starting at the
+                # same grid offset in the row above holds the content
+                if grid_offset not in above:
+                    raise ValueError(f"no cell above grid offset {grid_offset} to merge with")
+                cell = above[grid_offset]
+            else:
+                cell = (_cell_text(tc), grid_span)
+            
+            current[grid_offset] = cell
+            row_data.extend([cell[0]] * cell[1])
+            grid_offset += grid_span
+        
+        rows.append(row_data)
+        above = current
+    
+    return rows
+
+
+def _fast_iter_paragraphs(
+    source: Any,
+    include_empty: bool,
+    with_styles: bool
+) -> Iterator[Tuple[int, str, Optional[str]]]:
+    """
+    Stream (paragraph_number, text, style) for the body paragraphs of a
+    .docx file without building the python-docx document model.
+    
+    ``word/document.xml`` is read with ``lxml.etree.iterparse`` and every
+    body paragraph is cleared, along with the body elements before it, once
+    its text is read, so memory stays bounded by the largest paragraph or
+    table rather than the whole document. Numbering, text and style names
+    match ``Document.paragraphs``: paragraphs nested in tables or content
+    controls are not body paragraphs and are skipped.
+    
+    Args:
+        source: Path or binary file object of the .docx package
+        include_empty: Yield paragraphs whose text is blank
+        with_styles: Resolve style names (None is yielded otherwise)
+    """
+    with zipfile.ZipFile(source) as package:
+        document_name = _related_part_name(package, "", _OFFICE_DOCUMENT_REL)
+        if document_name is None:
+            raise KeyError("Package has no main document part")
+        
+        style_names: Dict[str, Optional[str]] = {}
+        default_style = None
+        if with_styles:
+            style_names, default_style = _read_paragraph_styles(
+                package, _related_part_name(package, document_name, _STYLES_REL)
+            )
+        
+        with package.open(document_name) as document_xml:
+            para_num = 0
+            for _, p in etree.iterparse(
+                document_xml,
+                events=("end",),
+                tag=_P,
+                remove_blank_text=True,
+                resolve_entities=False,
+            ):
+                body = p.getparent()
+                if body is None or body.tag != _BODY:
+                    continue
+                
+                para_num += 1
+                para_text = _paragraph_text(p)
+                if include_empty or not _is_blank(para_text):
+                    style = None
+                    if with_styles:
+                        style_id = _paragraph_style_id(p)
+                        style = style_names.get(style_id, default_style) if style_id else default_style
+                    yield para_num, para_text, style
+                
+                p.clear(keep_tail=True)
+                while p.getprevious() is not None:
+                    del body[0]
+
+
+def _iter_document_paragraphs(
+    doc: Document,
+    include_empty: bool,
+    with_styles: bool
+) -> Iterator[Tuple[int, str, Optional[str]]]:
+    """
+    Yield (paragraph_number, text, style) from an opened python-docx Document.
+    
+    Reads the body's w:p elements directly rather than through
+    ``doc.paragraphs``: ``Paragraph.style`` looks the style up in the
+    styles part on every access, so each style id is resolved once per
+    document instead.
+    """
+    get_style = doc.part.get_style
+    style_names: Dict[Optional[str], Optional[str]] = {}
+    
+    for para_num, p in enumerate(doc.element.body.iterchildren(_P), 1):
+        para_text = _paragraph_text(p)
+        
+        # Skip empty paragraphs if configured
+        if not include_empty and _is_blank(para_text):
+            continue
+        
+        style = None
+        if with_styles:
+            style_id = _paragraph_style_id(p)
+            if style_id not in style_names:
+                paragraph_style = get_style(style_id, WD_STYLE_TYPE.PARAGRAPH)
+                style_names[style_id] = paragraph_style.name if paragraph_style else None
+            style = style_names[style_id]
+        yield para_num, para_text, style
+
 
 class WordExtractorExecutor(ParallelExecutor):
     """
@@ -30,6 +316,9 @@ class WordExtractorExecutor(ParallelExecutor):
     
     This executor analyzes Word documents (.docx) to extract text, paragraphs,
     tables, and document properties using the python-docx library.
+    When tables, properties and images are all disabled, paragraphs are
+    streamed straight from the document XML with lxml instead, which avoids
+    building the python-docx document model for text-only extractions.
     
     Configuration (settings dict):
         - extract_text (bool): Extract full text content from document
@@ -44,7 +333,9 @@ class WordExtractorExecutor(ParallelExecutor):
           Default: False
         - content_field (str): Field containing Word document bytes
           Default: None
-        - temp_file_path_field (str): Field containing temp file path
+        - temp_file_path_field (str): Field containing temp file path.
+          The file is read in a worker thread (or by the worker process
+          with process_workers), so the read does not block the event loop.
           Default: "temp_file_path"
         - output_field (str): Field name for extracted data
           Default: "word_output"
@@ -55,6 +346,21 @@ class WordExtractorExecutor(ParallelExecutor):
           Default: "\n"
         - include_empty_paragraphs (bool): Include empty paragraphs in extraction
           Default: False
+        - paragraphs_layout (str): Shape of data['word_output']['paragraphs'].
+          "records" is a list with one dict per paragraph; "columns" is a
+          single dict of parallel lists keyed by paragraph_number, text,
+          char_count and style, which avoids a dict per paragraph on large
+          documents.
+          Default: "records"
+          Options: "records", "columns"
+        - process_workers (int): Number of worker processes used to extract
+          documents. python-docx parsing is CPU-bound pure Python, so when
+          many documents are processed concurrently it otherwise runs one at
+          a time on the event loop thread. Worker processes are started on
+          first use, shared by extractors with the same settings and shut
+          down by PipelineExecutor.cleanup(); they only pay off for large
+          batches or large documents.
+          Default: 0 (extract in the executor's own process)
 
         Also setting from ParallelExecutor and BaseExecutor apply.
     
@@ -79,7 +385,8 @@ class WordExtractorExecutor(ParallelExecutor):
     Output:
         Document or List[Document] with added fields:
         - data['word_output']['text']: Full extracted text
-        - data['word_output']['paragraphs']: List of paragraph chunks with text and metadata
+        - data['word_output']['paragraphs']: Paragraph chunks with text and metadata
+          (list of dicts, or dict of lists with paragraphs_layout="columns")
         - data['word_output']['tables']: List of extracted tables (if enabled)
         - data['word_output']['properties']: Document properties (if enabled)
         - data['word_output']['images']: List of extracted images (if enabled)
@@ -111,11 +418,22 @@ class WordExtractorExecutor(ParallelExecutor):
         self.image_output_mode = self.get_setting("image_output_mode", default="base64")
         self.paragraph_separator = self.get_setting("paragraph_separator", default="\n")
         self.include_empty_paragraphs = self.get_setting("include_empty_paragraphs", default=False)
+        self.paragraphs_layout = self.get_setting("paragraphs_layout", default="records")
+        self.process_workers = max(0, int(self.get_setting("process_workers", default=0)))
+        self._any_para_work = self.extract_text or self.extract_paragraphs
+        self._any_work = (
+            self._any_para_work or self.extract_tables
+            or self.extract_properties or self.extract_images
+        )
         
         # Validate image output mode
         if self.image_output_mode not in ["base64", "bytes"]:
             raise ValueError(f"Invalid image_output_mode: {self.image_output_mode}. Must be 'base64' or 'bytes'")
         
+        # Validate paragraphs layout
+        if self.paragraphs_layout not in ["records", "columns"]:
+            raise ValueError(f"Invalid paragraphs_layout: {self.paragraphs_layout}. Must be 'records' or 'columns'")
+        
         if self.debug_mode:
             logger.debug(
                 f"WordExtractorExecutor with id {self.id} initialized: "
@@ -153,90 +471,28 @@ class WordExtractorExecutor(ParallelExecutor):
                     f"Needs either '{self.content_field}' or '{self.temp_file_field}'"
                 )
             
-            if self.debug_mode:
-                source = f"file: {doc_path}" if doc_path else f"bytes: {len(doc_bytes)} bytes"
-                logger.debug(f"Processing Word document {content.id} from {source}")
-            
-            doc = None
+            # With every extract_* setting off there is nothing to read, so
+            # the document is not opened at all
+            if not self._any_work:
+                extraction = ({}, 0, 0, 0)
+            else:
+                if self.debug_mode:
+                    source = f"file: {doc_path}" if doc_path else f"bytes: {len(doc_bytes)} bytes"
+                    logger.debug(f"Processing Word document {content.id} from {source}")
+                
+                extraction = await self._extract(doc_bytes, doc_path, content.id)
             
-            try:
-                # Open Word document
-                if doc_bytes:
-                    doc = Document(io.BytesIO(doc_bytes))
-                else:
-                    doc = Document(doc_path)
-            except Exception as e:
-                logger.warning(
-                    f"Invalid Word document for content {content.id}: {str(e)}"
-                )
+            if extraction is None:
                 content.summary_data['word_extraction_status'] = "invalid_file"
                 return content
             
-            extracted_data = {}
-            
-            # Extract paragraphs
-            all_text = []
-            paragraphs_data = []
-            
-            for para_num, paragraph in enumerate(doc.paragraphs):
-                para_text = paragraph.text
-                
-                # Skip empty paragraphs if configured
-                if not self.include_empty_paragraphs and not para_text.strip():
-                    continue
-                
-                if self.extract_text:
-                    all_text.append(para_text)
-                
-                if self.extract_paragraphs:
-                    para_info = {
-                        "paragraph_number": para_num + 1,
-                        "text": para_text,
-                        "char_count": len(para_text),
-                        "style": paragraph.style.name if paragraph.style else None,
-                    }
-                    paragraphs_data.append(para_info)
-            
-            if self.extract_text:
-                extracted_data['text'] = self.paragraph_separator.join(all_text)
-                if self.debug_mode:
-                    logger.debug(f"Extracted {len(extracted_data['text'])} characters of text")
-            
-            if self.extract_paragraphs:
-                extracted_data['paragraphs'] = paragraphs_data
-                if self.debug_mode:
-                    logger.debug(f"Created {len(paragraphs_data)} paragraph chunks")
-            
-            # Extract tables
-            tables_count = 0
-            if self.extract_tables:
-                tables = self._extract_tables_from_document(doc)
-                extracted_data['tables'] = tables
-                tables_count = len(tables)
-                if self.debug_mode:
-                    logger.debug(f"Extracted {tables_count} tables")
-            
-            # Extract document properties
-            if self.extract_properties:
-                properties = self._extract_document_properties(doc)
-                extracted_data['properties'] = properties
-                if self.debug_mode:
-                    logger.debug(f"Extracted document properties")
-            
-            # Extract images
-            images_count = 0
-            if self.extract_images:
-                images = self._extract_images_from_document(doc)
-                extracted_data['images'] = images
-                images_count = len(images)
-                if self.debug_mode:
-                    logger.debug(f"Extracted {images_count} images")
+            extracted_data, paragraphs_count, tables_count, images_count = extraction
             
             # Store extracted data
             content.data[self.output_field] = extracted_data
             
             # Update summary
-            content.summary_data['paragraphs_processed'] = len(paragraphs_data) if self.extract_paragraphs else 0
+            content.summary_data['paragraphs_processed'] = paragraphs_count
             content.summary_data['tables_extracted'] = tables_count
             content.summary_data['images_extracted'] = images_count
             content.summary_data['extraction_status'] = "success"
@@ -252,6 +508,175 @@ class WordExtractorExecutor(ParallelExecutor):
         
         return content
     
+    async def _extract(
+        self,
+        doc_bytes: Optional[bytes],
+        doc_path: Optional[str],
+        content_id: Any
+    ) -> Optional[Tuple[Dict[str, Any], int, int, int]]:
+        """
+        Run ``_extract_document``, in a worker process when process_workers is set.
+        
+        Each worker process builds its own extractor from this executor's
+        settings once, so only the document and the extracted data cross
+        the process boundary. A temp file path is passed as-is and read by
+        the worker itself. The pool is the shared one for these settings
+        (see ``contentflow.utils.process_pools``), not owned by this instance.
+        """
+        if self.process_workers <= 0:
+            # Read a temp file in a worker thread so the blocking read does
+            # not stall the event loop; a file that cannot be read is left to
+            # python-docx, which reports it as invalid
+            if doc_path and not doc_bytes:
+                try:
+                    doc_bytes = await asyncio.to_thread(Path(doc_path).read_bytes)
+                except OSError:
+                    pass
+            return self._extract_document(doc_bytes, doc_path, content_id)
+        
+        pool = get_process_pool(
+            self.process_workers, _init_extract_worker, (self.id, self.settings)
+        )
+        
+        if doc_bytes is not None and not isinstance(doc_bytes, bytes):
+            doc_bytes = bytes(doc_bytes)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            pool, _extract_in_worker, doc_bytes, doc_path, content_id
+        )
+    
+    def _extract_document(
+        self,
+        doc_bytes: Optional[bytes],
+        doc_path: Optional[str],
+        content_id: Any
+    ) -> Optional[Tuple[Dict[str, Any], int, int, int]]:
+        """
+        Extract a Word document given as bytes or a file path.
+        
+        Returns:
+            (extracted_data, paragraphs_processed, tables_extracted,
+            images_extracted), or None if the document cannot be opened
+        """
+        doc = None
+        paragraphs = None
+        
+        # Text-only extractions stream the paragraphs straight from the
+        # document XML; python-docx is only needed for tables,
+        # properties and images, or when streaming fails
+        if self._any_para_work and not (self.extract_tables or self.extract_properties or self.extract_images):
+            try:
+                paragraphs = list(_fast_iter_paragraphs(
+                    io.BytesIO(doc_bytes) if doc_bytes else doc_path,
+                    self.include_empty_paragraphs,
+                    self.extract_paragraphs,
+                ))
+            except Exception as e:
+                if self.debug_mode:
+                    logger.debug(f"Streaming paragraphs failed for {content_id}, using python-docx: {e}")
+        
+        if paragraphs is None:
+            try:
+                # Open Word document
+                if doc_bytes:
+                    doc = Document(io.BytesIO(doc_bytes))
+                else:
+                    doc = Document(doc_path)
+            except Exception as e:
+                logger.warning(
+                    f"Invalid Word document for content {content_id}: {str(e)}"
+                )
+                return None
+            
+            # Without text or paragraph output the paragraphs are never read
+            paragraphs = _iter_document_paragraphs(
+                doc, self.include_empty_paragraphs, self.extract_paragraphs
+            ) if self._any_para_work else ()
+        
+        extracted_data = {}
+        
+        # Extract paragraphs into parallel lists; the full text is joined
+        # from the same list of paragraph texts, which str.join sizes up
+        # front and copies once
+        para_nums = []
+        para_texts = []
+        para_styles = []
+        
+        if self.extract_paragraphs:
+            nums_append = para_nums.append
+            texts_append = para_texts.append
+            styles_append = para_styles.append
+            for para_num, para_text, style in paragraphs:
+                nums_append(para_num)
+                texts_append(para_text)
+                styles_append(style)
+        elif self.extract_text:
+            para_texts = [para_text for _, para_text, _ in paragraphs]
+        
+        if self.extract_text:
+            extracted_data['text'] = self.paragraph_separator.join(para_texts)
+            if self.debug_mode:
+                logger.debug(f"Extracted {len(extracted_data['text'])} characters of text")
+        
+        if self.extract_paragraphs:
+            extracted_data['paragraphs'] = self._build_paragraphs(para_nums, para_texts, para_styles)
+            if self.debug_mode:
+                logger.debug(f"Created {len(para_texts)} paragraph chunks")
+        
+        # Extract tables
+        tables_count = 0
+        if self.extract_tables:
+            tables = self._extract_tables_from_document(doc)
+            extracted_data['tables'] = tables
+            tables_count = len(tables)
+            if self.debug_mode:
+                logger.debug(f"Extracted {tables_count} tables")
+        
+        # Extract document properties
+        if self.extract_properties:
+            properties = self._extract_document_properties(doc)
+            extracted_data['properties'] = properties
+            if self.debug_mode:
+                logger.debug(f"Extracted document properties")
+        
+        # Extract images
+        images_count = 0
+        if self.extract_images:
+            images = self._extract_images_from_document(doc)
+            extracted_data['images'] = images
+            images_count = len(images)
+            if self.debug_mode:
+                logger.debug(f"Extracted {images_count} images")
+        
+        paragraphs_count = len(para_texts) if self.extract_paragraphs else 0
+        return extracted_data, paragraphs_count, tables_count, images_count
+    
+    def _build_paragraphs(
+        self,
+        para_nums: List[int],
+        para_texts: List[str],
+        para_styles: List[Optional[str]]
+    ) -> Any:
+        """Lay out paragraph chunks according to ``paragraphs_layout``."""
+        if self.paragraphs_layout == "columns":
+            return {
+                "paragraph_number": para_nums,
+                "text": para_texts,
+                "char_count": list(map(len, para_texts)),
+                "style": para_styles,
+            }
+        
+        return [
+            {
+                "paragraph_number": para_num,
+                "text": para_text,
+                "char_count": len(para_text),
+                "style": style,
+            }
+            for para_num, para_text, style in zip(para_nums, para_texts, para_styles)
+        ]
+    
     def _extract_tables_from_document(self, doc: Document) -> List[Dict[str, Any]]:
         """Extract tables from Word document.
         
@@ -263,23 +688,24 @@ class WordExtractorExecutor(ParallelExecutor):
         """
         tables = []
         
-        for table_num, table in enumerate(doc.tables):
+        # Walk the body's w:tbl elements directly: python-docx builds a
+        # fresh _Cell (and re-runs XPath queries) for every cell access
+        for table_num, tbl in enumerate(doc.element.body.iterchildren(_TBL)):
             try:
-                table_data = {
-                    "table_number": table_num + 1,
-                    "rows": len(table.rows),
-                    "columns": len(table.columns) if table.rows else 0,
-                    "data": []
-                }
-                
-                # Extract cell data
-                for row in table.rows:
-                    row_data = []
-                    for cell in row.cells:
-                        row_data.append(cell.text)
-                    table_data["data"].append(row_data)
+                rows = _table_rows(tbl)
+                columns = 0
+                if rows:
+                    tbl_grid = tbl.find(_TBL_GRID)
+                    if tbl_grid is None:
+                        raise ValueError("table has no w:tblGrid")
+                    columns = sum(1 for _ in tbl_grid.iterchildren(_GRID_COL))
                 
-                tables.append(table_data)
+                tables.append({
+                    "table_number": table_num + 1,
+                    "rows": len(rows),
+                    "columns": columns,
+                    "data": rows
+                })
                 
             except Exception as e:
                 logger.warning(f"Failed to extract table {table_num + 1}: {e}")
@@ -327,6 +753,9 @@ class WordExtractorExecutor(ParallelExecutor):
             List of image dictionaries with metadata and image data
         """
         images = []
+        # Encoded data per image part, shared by relationships that point
+        # at the same image so it is only encoded and held once
+        encoded: Dict[str, Any] = {}
         
         try:
             # Access document parts to find images
@@ -340,11 +769,17 @@ class WordExtractorExecutor(ParallelExecutor):
                         content_type = image_part.content_type
                         image_format = content_type.split('/')[-1] if '/' in content_type else 'unknown'
                         
-                        # Prepare image data based on output mode
-                        if self.image_output_mode == "base64":
-                            image_data = base64.b64encode(image_bytes).decode('utf-8')
-                        else:
-                            image_data = image_bytes
+                        # Prepare image data based on output mode; base64
+                        # output is pure ASCII, which decodes without the
+                        # UTF-8 validation pass. In bytes mode the part's
+                        # blob is used as-is, without a copy
+                        image_data = encoded.get(image_part.partname)
+                        if image_data is None:
+                            if self.image_output_mode == "base64":
+                                image_data = base64.b64encode(image_bytes).decode('ascii')
+                            else:
+                                image_data = image_bytes
+                            encoded[image_part.partname] = image_data
                         
                         image_info = {
                             "image_index": len(images),
@@ -365,3 +800,22 @@ class WordExtractorExecutor(ParallelExecutor):
             logger.warning(f"Failed to access document images: {e}")
         
         return images
+
+
+# Extractor used by process_workers processes, built once per worker process
+_worker_extractor: Optional[WordExtractorExecutor] = None
+
+
+def _init_extract_worker(executor_id: str, settings: Dict[str, Any]) -> None:
+    """Build the extractor a process_workers process extracts documents with."""
+    global _worker_extractor
+    _worker_extractor = WordExtractorExecutor(id=executor_id, settings=settings)
+
+
+def _extract_in_worker(
+    doc_bytes: Optional[bytes],
+    doc_path: Optional[str],
+    content_id: Any
+) -> Optional[Tuple[Dict[str, Any], int, int, int]]:
+    """Extract a Word document in a process_workers process."""
+    return _worker_extractor._extract_document(doc_bytes, doc_path, content_id)
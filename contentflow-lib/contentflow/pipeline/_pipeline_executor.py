@@ -8,6 +8,7 @@ This module provides the PipelineExecutor class that handles:
 - Managing pipeline lifecycle
 """
 
+import asyncio
 import logging
 import traceback
 from typing import Any, Dict, List, Optional, AsyncIterator, Union, cast
@@ -20,6 +21,7 @@ from agent_framework import Workflow, WorkflowRunResult, WorkflowEvent
 import yaml
 
 from ..models import Content
+from ..utils.process_pools import shutdown_process_pools
 from .pipeline_factory import PipelineFactory
 from ._pipeline import PipelineEvent, PipelineResult, PipelineStatus
 
@@ -245,8 +247,12 @@ class PipelineExecutor:
         This includes:
         - Cleaning up all connectors
         - Clearing cached data
+        - Shutting down the shared executor process pools
         """
         logger.info("Cleaning up PipelineExecutor")
+        
+        # Waits for submitted work, so keep it off the event loop
+        await asyncio.to_thread(shutdown_process_pools)
                 
         self._initialized = False
         logger.info("PipelineExecutor cleanup complete")
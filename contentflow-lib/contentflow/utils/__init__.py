@@ -10,6 +10,7 @@ from .ttl_cache import ttl_cache
 from .make_safe_json import make_safe_json
 from .logging import setup_logging
 from .secure_condition_evaluator import SecureConditionEvaluator, evaluate_condition
+from .process_pools import get_process_pool, shutdown_process_pools
 
 __all__ = [
     "get_azure_credential",
@@ -21,4 +22,6 @@ __all__ = [
     "setup_logging",
     "SecureConditionEvaluator",
     "evaluate_condition",
+    "get_process_pool",
+    "shutdown_process_pools",
 ]
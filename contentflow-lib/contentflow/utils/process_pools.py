@@ -0,0 +1,95 @@
+"""
+Process pools shared by executors that offload CPU-bound work.
+
+Executors are rebuilt every time a pipeline is created, so a pool owned by an
+executor instance would leak its worker processes once the instance is
+dropped. Instead, pools live in a module-level registry keyed by the worker
+initializer, its arguments and the worker count: executors built from the
+same configuration share one pool, however many times the pipeline is built.
+
+Pools are created on first use and stay alive until
+``shutdown_process_pools`` is called; ``PipelineExecutor.cleanup`` does so.
+A pool requested after shutdown is simply created again.
+"""
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger("contentflow.utils.process_pools")
+
+_pools: Dict[Tuple[Any, ...], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert initializer arguments into a hashable registry key."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return tuple(sorted(repr(item) for item in value))
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def get_process_pool(
+    max_workers: int,
+    initializer: Callable[..., None],
+    initargs: Tuple[Any, ...] = ()
+) -> ProcessPoolExecutor:
+    """
+    Get the shared process pool for an initializer and its arguments.
+
+    Args:
+        max_workers: Number of worker processes
+        initializer: Module-level function run once in each worker process
+        initargs: Arguments passed to ``initializer``; must be picklable
+
+    Returns:
+        The pool registered for these arguments, created if needed
+    """
+    key = (
+        initializer.__module__,
+        initializer.__qualname__,
+        max_workers,
+        _freeze(initargs)
+    )
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=initializer,
+                initargs=initargs
+            )
+            _pools[key] = pool
+            logger.debug(
+                f"Started {max_workers} worker processes for {initializer.__qualname__}"
+            )
+        return pool
+
+
+def shutdown_process_pools(wait: bool = True) -> None:
+    """
+    Shut down every shared process pool.
+
+    Work already submitted is finished first when ``wait`` is True. Pools
+    requested afterwards are started again, so this is safe to call between
+    pipeline runs.
+
+    Args:
+        wait: Block until the worker processes have exited
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+    if pools:
+        logger.debug(f"Shut down {len(pools)} shared process pools")
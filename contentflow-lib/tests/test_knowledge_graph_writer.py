@@ -0,0 +1,105 @@
+"""Unit tests for KnowledgeGraphWriterExecutor."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("gremlin_python")
+
+from contentflow.executors.knowledge_graph_writer import KnowledgeGraphWriterExecutor
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_executor(**overrides) -> KnowledgeGraphWriterExecutor:
+    settings = {
+        "gremlin_endpoint": "wss://fake.gremlin.cosmos.azure.com:443/",
+        "gremlin_database": "db",
+        "gremlin_collection": "graph",
+        "gremlin_password": "fake-key==",
+        "add_timestamps": False,
+    }
+    settings.update(overrides)
+    return KnowledgeGraphWriterExecutor(id="kg", settings=settings)
+
+
+class _FakeConnector:
+    """In-memory graph that rejects adding a vertex id twice, like Cosmos DB."""
+
+    def __init__(self):
+        self.vertices = {}
+        self.edges = []
+
+    async def get_vertex(self, vertex_id):
+        vertex = self.vertices.get(vertex_id)
+        await asyncio.sleep(0)  # a network round trip lets other writes interleave
+        return vertex
+
+    async def add_vertex(self, label, vertex_id, properties):
+        if vertex_id in self.vertices:
+            raise RuntimeError("conflict")
+        self.vertices[vertex_id] = {"label": label, **properties}
+
+    async def update_vertex(self, vertex_id, properties):
+        self.vertices[vertex_id].update(properties)
+
+    async def delete_vertex(self, vertex_id):
+        del self.vertices[vertex_id]
+
+    async def add_edge(self, edge_label, from_vertex_id, to_vertex_id, properties):
+        self.edges.append((edge_label, from_vertex_id, to_vertex_id))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("merge_strategy", ["merge", "overwrite", "skip"])
+async def test_duplicate_entity_ids_in_one_batch(merge_strategy):
+    connector = _FakeConnector()
+    executor = _make_executor(merge_strategy=merge_strategy)
+    entities = [
+        {"id": "a", "name": "First", "properties": {"v": "1"}},
+        {"id": "a", "name": "Second", "properties": {"v": "2"}},
+    ]
+
+    assert await executor._write_in_batches(connector, entities, executor._write_entity) == (2, 0)
+    expected_name = "First" if merge_strategy == "skip" else "Second"
+    assert connector.vertices["a"]["name"] == expected_name
+
+
+@pytest.mark.asyncio
+async def test_write_stats_sum_across_batches():
+    connector = _FakeConnector()
+    executor = _make_executor(batch_size=2)
+    entities = [{"id": f"e{i}", "name": f"E{i}"} for i in range(5)] + [{"name": "no id"}]
+    relationships = [
+        {"from_entity_id": "e0", "to_entity_id": "e1", "relationship_type": "knows"},
+        {"from_entity_id": "e1", "to_entity_id": "missing"},
+        {"from_entity_id": "e2", "to_entity_id": "e3"},
+        {"to_entity_id": "e3"},
+        {"from_entity_id": "e0", "to_entity_id": "e1", "relationship_type": "knows"},
+    ]
+
+    assert await executor._write_in_batches(connector, entities, executor._write_entity) == (5, 1)
+    assert await executor._write_in_batches(connector, relationships, executor._write_relationship) == (3, 2)
+    assert connector.edges == [
+        ("knows", "e0", "e1"), ("related_to", "e2", "e3"), ("knows", "e0", "e1")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_in_batches_returns_summed_tuple():
+    executor = _make_executor(batch_size=3)
+    seen = []
+
+    async def write_fn(connector, item):
+        seen.append(item)
+        return item % 2 == 0
+
+    assert await executor._write_in_batches(None, list(range(7)), write_fn) == (4, 3)
+    assert seen == list(range(7))
+    assert await executor._write_in_batches(None, [], write_fn) == (0, 0)
@@ -0,0 +1,116 @@
+"""Unit tests for the legacy DocumentSplitter in contentflow.executors.parallel."""
+
+import importlib
+import json
+import sys
+import types
+
+import pytest
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _Document:
+    """Stand-in for the doc-proc-lib Document model."""
+
+    def __init__(self, id, data=None, summary_data=None):
+        self.id = id
+        self.data = data if data is not None else {}
+        self.summary_data = summary_data if summary_data is not None else {}
+
+
+class _DocumentExecutor:
+    """Stand-in for the doc_proc_workflow DocumentExecutor base class."""
+
+    def __init__(self, id):
+        self.id = id
+
+
+@pytest.fixture
+def parallel(monkeypatch):
+    """Import parallel.py with its legacy doc-proc dependencies stubbed."""
+    stubs = {
+        "doc": types.ModuleType("doc"),
+        "doc.proc": types.ModuleType("doc.proc"),
+        "doc.proc.models": types.ModuleType("doc.proc.models"),
+        "doc_proc_workflow": types.ModuleType("doc_proc_workflow"),
+        "doc_proc_workflow.executors": types.ModuleType("doc_proc_workflow.executors"),
+        "doc_proc_workflow.executors.base": types.ModuleType("doc_proc_workflow.executors.base"),
+    }
+    stubs["doc.proc.models"].Document = _Document
+    stubs["doc_proc_workflow.executors.base"].DocumentExecutor = _DocumentExecutor
+    for name, module in stubs.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, "contentflow.executors.parallel", raising=False)
+    return importlib.import_module("contentflow.executors.parallel")
+
+
+async def _split(parallel, content, split_strategy, chunk_size):
+    splitter = parallel.DocumentSplitter(chunk_size=chunk_size, split_strategy=split_strategy)
+    document = await splitter.process_document(_Document("doc", data={"content": content}), ctx=None)
+    # Chunks are public output and must stay plain, serialisable data
+    json.dumps(document.data)
+    return document
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_split_by_pages(parallel):
+    document = await _split(parallel, "p1\fp2\fp3", "pages", 2)
+
+    assert document.data["chunks"] == [
+        {"chunk_id": "doc_chunk_0", "content": "p1\fp2", "start_page": 1, "end_page": 2,
+         "total_pages": 2, "chunk_index": 0},
+        {"chunk_id": "doc_chunk_1", "content": "p3", "start_page": 3, "end_page": 3,
+         "total_pages": 1, "chunk_index": 1},
+    ]
+    assert document.data["total_chunks"] == 2
+    assert document.summary_data["split_strategy"] == "pages"
+
+
+@pytest.mark.asyncio
+async def test_split_by_lines(parallel):
+    document = await _split(parallel, "a\nb\nc\nd\ne", "lines", 2)
+
+    assert document.data["chunks"] == [
+        {"chunk_id": "doc_chunk_0", "content": "a\nb", "start_line": 1, "end_line": 2,
+         "line_count": 2, "chunk_index": 0},
+        {"chunk_id": "doc_chunk_1", "content": "c\nd", "start_line": 3, "end_line": 4,
+         "line_count": 2, "chunk_index": 1},
+        {"chunk_id": "doc_chunk_2", "content": "e", "start_line": 5, "end_line": 5,
+         "line_count": 1, "chunk_index": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_split_by_words_keeps_inner_whitespace(parallel):
+    document = await _split(parallel, "  one two\tthree  four five ", "words", 2)
+
+    assert document.data["chunks"] == [
+        {"chunk_id": "doc_chunk_0", "content": "one two", "start_word": 0, "end_word": 2,
+         "word_count": 2, "chunk_index": 0},
+        {"chunk_id": "doc_chunk_1", "content": "three  four", "start_word": 2, "end_word": 4,
+         "word_count": 2, "chunk_index": 1},
+        {"chunk_id": "doc_chunk_2", "content": "five", "start_word": 4, "end_word": 5,
+         "word_count": 1, "chunk_index": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_split_by_characters(parallel):
+    document = await _split(parallel, "abcdefg", "characters", 3)
+
+    assert [(c["content"], c["start_char"], c["end_char"], c["char_count"]) for c in document.data["chunks"]] == [
+        ("abc", 0, 3, 3), ("def", 3, 6, 3), ("g", 6, 7, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unknown_strategy_raises(parallel):
+    with pytest.raises(ValueError):
+        await _split(parallel, "text", "sentences", 2)
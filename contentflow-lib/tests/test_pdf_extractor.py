@@ -0,0 +1,250 @@
+"""Unit tests for PDFExtractorExecutor."""
+
+import base64
+import io
+
+import pymupdf
+import pytest
+
+from contentflow.models import Content, ContentIdentifier
+from contentflow.executors.pdf_extractor import PDFExtractorExecutor
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_content(data: dict, canonical_id: str = "test-pdf") -> Content:
+    return Content(
+        id=ContentIdentifier(canonical_id=canonical_id, unique_id=canonical_id),
+        data=data,
+    )
+
+
+def _make_pdf(page_texts: list) -> bytes:
+    doc = pymupdf.open()
+    for text in page_texts:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
+
+PAGE_TEXTS = [f"Page {i} text" for i in range(1, 8)]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_basic_pdf_extraction():
+    executor = PDFExtractorExecutor(id="t", settings={"content_field": "content"})
+    content = _make_content({"content": _make_pdf(PAGE_TEXTS[:2])})
+    result = await executor.process_content_item(content)
+
+    out = result.data["pdf_output"]
+    assert [p["page_number"] for p in out["pages"]] == [1, 2]
+    assert out["pages"][0]["text"].strip() == "Page 1 text"
+    assert out["pages"][0]["char_count"] == len(out["pages"][0]["text"])
+    assert out["text"] == executor.page_separator.join(p["text"] for p in out["pages"])
+    assert result.summary_data["pages_processed"] == 2
+    assert result.summary_data["extraction_status"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_page_workers_match_sequential():
+    pdf_bytes = _make_pdf(PAGE_TEXTS)
+    sequential = PDFExtractorExecutor(id="seq", settings={"content_field": "content"})
+    threaded = PDFExtractorExecutor(id="thr", settings={"content_field": "content", "page_workers": 3})
+
+    expected = await sequential.process_content_item(_make_content({"content": pdf_bytes}))
+    result = await threaded.process_content_item(_make_content({"content": pdf_bytes}))
+
+    assert result.data["pdf_output"] == expected.data["pdf_output"]
+
+
+@pytest.mark.asyncio
+async def test_missing_content_raises():
+    executor = PDFExtractorExecutor(id="t", settings={"content_field": "content"})
+    with pytest.raises(ValueError):
+        await executor.process_content_item(_make_content({"other": 1}))
+
+
+@pytest.mark.asyncio
+async def test_image_extraction_and_size_filter():
+    doc = pymupdf.open()
+    page = doc.new_page()
+    for size, x in ((150, 0), (20, 300)):
+        pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, size, size), False)
+        pix.clear_with(200)
+        page.insert_image(pymupdf.Rect(x, 0, x + size, size), pixmap=pix)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    executor = PDFExtractorExecutor(
+        id="t",
+        settings={"content_field": "content", "extract_images": True, "image_format": "jpeg"},
+    )
+    result = await executor.process_content_item(_make_content({"content": pdf_bytes}))
+
+    images = result.data["pdf_output"]["images"]
+    assert [(img["width"], img["height"]) for img in images] == [(150, 150)]
+    assert images[0]["encoding"] == "base64"
+    assert base64.b64decode(images[0]["data"])[:2] == b"\xff\xd8"  # JPEG SOI marker
+    assert result.summary_data["images_extracted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_buffer_inputs_match_bytes():
+    pdf_bytes = _make_pdf(PAGE_TEXTS[:3])
+    executor = PDFExtractorExecutor(id="t", settings={"content_field": "content", "page_workers": 2})
+
+    expected = await executor.process_content_item(_make_content({"content": pdf_bytes}))
+    for payload in (bytearray(pdf_bytes), memoryview(pdf_bytes), io.BytesIO(pdf_bytes)):
+        result = await executor.process_content_item(_make_content({"content": payload}))
+        assert result.data["pdf_output"] == expected.data["pdf_output"]
+
+
+@pytest.mark.asyncio
+async def test_temp_file_batch(tmp_path):
+    executor = PDFExtractorExecutor(id="t", settings={"content_field": "content", "max_concurrent": 3})
+    items = []
+    for i in range(4):
+        path = tmp_path / f"doc{i}.pdf"
+        path.write_bytes(_make_pdf([f"Document {i}"]))
+        items.append(_make_content({"temp_file_path": str(path)}, canonical_id=f"doc{i}"))
+
+    results = await executor.process_input(items, ctx=None)
+
+    assert [r.data["pdf_output"]["pages"][0]["text"].strip() for r in results] == [
+        f"Document {i}" for i in range(4)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_columns_pages_layout():
+    pdf_bytes = _make_pdf(PAGE_TEXTS[:3])
+    records = PDFExtractorExecutor(id="r", settings={"content_field": "content"})
+    columns = PDFExtractorExecutor(id="c", settings={"content_field": "content", "pages_layout": "columns"})
+
+    expected_content = await records.process_content_item(_make_content({"content": pdf_bytes}))
+    result_content = await columns.process_content_item(_make_content({"content": pdf_bytes}))
+    expected = expected_content.data["pdf_output"]
+    result = result_content.data["pdf_output"]
+
+    assert result["text"] == expected["text"]
+    assert result["pages"] == {key: [p[key] for p in expected["pages"]] for key in expected["pages"][0]}
+    assert result_content.summary_data == expected_content.summary_data
+    assert result_content.summary_data["total_chars"] == sum(p["char_count"] for p in expected["pages"])
+    assert result_content.summary_data["avg_page_width"] == expected["pages"][0]["width"]
+
+
+def test_columns_layout_without_pages_has_no_page_stats():
+    executor = PDFExtractorExecutor(id="c", settings={"pages_layout": "columns"})
+    content = _make_content({})
+    empty_pages = {"page_number": [], "width": [], "height": [], "text": [], "char_count": []}
+
+    executor._store_result(content, {"text": "", "pages": empty_pages}, 0, 0)
+
+    assert content.summary_data["pages_processed"] == 0
+    assert "avg_page_width" not in content.summary_data
+
+
+def test_invalid_pages_layout():
+    with pytest.raises(ValueError):
+        PDFExtractorExecutor(id="t", settings={"pages_layout": "soa"})
+
+
+@pytest.mark.asyncio
+async def test_text_only_extraction():
+    pdf_bytes = _make_pdf(PAGE_TEXTS[:3])
+    full = PDFExtractorExecutor(id="f", settings={"content_field": "content"})
+    text_only = PDFExtractorExecutor(id="t", settings={"content_field": "content", "extract_pages": False})
+
+    expected = (await full.process_content_item(_make_content({"content": pdf_bytes}))).data["pdf_output"]
+    result = (await text_only.process_content_item(_make_content({"content": pdf_bytes}))).data["pdf_output"]
+
+    assert result == {"text": expected["text"]}
+
+
+@pytest.mark.asyncio
+async def test_jpeg_quality_setting():
+    doc = pymupdf.open()
+    page = doc.new_page()
+    pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 200, 200), False)
+    for x in range(0, 200, 10):
+        for y in range(200):
+            pix.set_pixel(x, y, (x, y, (x * y) % 256))
+    page.insert_image(pymupdf.Rect(0, 0, 200, 200), pixmap=pix)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    sizes = []
+    for quality in (95, 20):
+        executor = PDFExtractorExecutor(
+            id="t",
+            settings={
+                "content_field": "content",
+                "extract_images": True,
+                "image_format": "jpeg",
+                "image_output_mode": "bytes",
+                "jpeg_quality": quality,
+            },
+        )
+        result = await executor.process_content_item(_make_content({"content": pdf_bytes}))
+        sizes.append(len(result.data["pdf_output"]["images"][0]["data"]))
+
+    assert sizes[1] < sizes[0]
+
+
+@pytest.mark.asyncio
+async def test_extraction_cache(monkeypatch):
+    pdf_bytes = _make_pdf(PAGE_TEXTS[:2])
+    executor = PDFExtractorExecutor(id="t", settings={"content_field": "content", "cache_size": 1})
+
+    first = await executor.process_content_item(_make_content({"content": pdf_bytes}))
+    first.data["pdf_output"]["pages"].clear()
+
+    def fail_open(*args):
+        raise AssertionError("cached extraction should not reopen the PDF")
+
+    monkeypatch.setattr(executor, "_open_document", fail_open)
+    second = await executor.process_content_item(_make_content({"content": pdf_bytes}))
+
+    assert [p["page_number"] for p in second.data["pdf_output"]["pages"]] == [1, 2]
+    assert second.summary_data["pages_processed"] == 2
+
+    # A different content id is a cache miss
+    with pytest.raises(AssertionError):
+        await executor.process_content_item(_make_content({"content": pdf_bytes}, canonical_id="other"))
+
+
+@pytest.mark.asyncio
+async def test_extraction_cache_is_per_instance():
+    pdf_bytes = _make_pdf(PAGE_TEXTS[:2])
+    large = PDFExtractorExecutor(id="large", settings={"content_field": "content", "cache_size": 4})
+    small = PDFExtractorExecutor(id="small", settings={"content_field": "content", "cache_size": 1})
+
+    for canonical_id in ("a", "b"):
+        await large.process_content_item(_make_content({"content": pdf_bytes}, canonical_id=canonical_id))
+    for canonical_id in ("c", "d"):
+        await small.process_content_item(_make_content({"content": pdf_bytes}, canonical_id=canonical_id))
+
+    # A smaller cache elsewhere never evicts this executor's entries
+    assert len(large._extraction_cache) == 2
+    assert len(small._extraction_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_temp_file_matches_bytes(tmp_path):
+    pdf_bytes = _make_pdf(PAGE_TEXTS)
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(pdf_bytes)
+    executor = PDFExtractorExecutor(id="t", settings={"content_field": "content", "page_workers": 2})
+
+    expected = await executor.process_content_item(_make_content({"content": pdf_bytes}))
+    result = await executor.process_content_item(_make_content({"temp_file_path": str(path)}))
+
+    assert result.data["pdf_output"] == expected.data["pdf_output"]
@@ -0,0 +1,104 @@
+"""Unit tests for PIIDetectorExecutor input screening."""
+
+import asyncio
+
+import pytest
+
+from contentflow.models import Content, ContentIdentifier
+from contentflow.executors.pii_detector_executor import PIIDetectorExecutor
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_content(text) -> Content:
+    return Content(
+        id=ContentIdentifier(canonical_id="test-pii", unique_id="test-pii"),
+        data={"text": text},
+    )
+
+
+def _make_executor(**settings) -> PIIDetectorExecutor:
+    executor = PIIDetectorExecutor(id="pii", settings=settings)
+
+    async def fail_run_agent(query):
+        raise AssertionError("model should not be called")
+
+    executor._run_agent = fail_run_agent
+    return executor
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_blank_text_skips_model():
+    executor = _make_executor()
+    result = await executor.process_content_item(_make_content("   \n"))
+
+    assert result.data["pii_detected"] == {"pii_found": [], "count": 0}
+    assert result.summary_data["pii_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_min_text_length():
+    executor = _make_executor(min_text_length=8)
+    result = await executor.process_content_item(_make_content("Hi Bob"))
+
+    assert result.data["pii_detected"]["count"] == 0
+    with pytest.raises(AssertionError):
+        await executor.process_content_item(_make_content("Hi Bob Smith"))
+
+
+@pytest.mark.asyncio
+async def test_signal_screen_for_pattern_types():
+    executor = _make_executor(pii_types=["email", "phone"], action="redact")
+    result = await executor.process_content_item(_make_content("no contact details here"))
+
+    assert result.data["pii_detected"]["redacted_text"] == "no contact details here"
+    assert result.data["text_redacted"] == "no contact details here"
+
+    with pytest.raises(AssertionError):
+        await executor.process_content_item(_make_content("call 555 0100"))
+
+
+@pytest.mark.asyncio
+async def test_signal_screen_keeps_digit_free_ipv6():
+    executor = _make_executor(pii_types=["ip_address"])
+    result = await executor.process_content_item(_make_content("no addresses here"))
+    assert result.data["pii_detected"]["count"] == 0
+
+    with pytest.raises(AssertionError):
+        await executor.process_content_item(_make_content("link-local fe80::abcd:ef"))
+
+
+@pytest.mark.asyncio
+async def test_name_detection_is_not_screened():
+    executor = _make_executor(pii_types=["name", "email"])
+    with pytest.raises(AssertionError):
+        await executor.process_content_item(_make_content("no contact details here"))
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_model_calls_concurrently():
+    executor = PIIDetectorExecutor(id="pii", settings={})
+    assert executor.max_concurrent == 16
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_run_agent(query):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return '{"pii_found": [], "count": 0}', None
+
+    executor._run_agent = fake_run_agent
+    results = await executor.process_input([_make_content(f"text {i}") for i in range(20)], ctx=None)
+
+    assert peak == 16
+    assert all(r.summary_data["pii_count"] == 0 for r in results)
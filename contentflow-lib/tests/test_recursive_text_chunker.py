@@ -0,0 +1,268 @@
+"""Unit tests for RecursiveTextChunkerExecutor."""
+
+import pytest
+
+from contentflow.models import Content, ContentIdentifier
+from contentflow.executors.recursive_text_chunker_executor import RecursiveTextChunkerExecutor
+from contentflow.utils.process_pools import shutdown_process_pools
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_content(data: dict, canonical_id: str = "test-doc") -> Content:
+    return Content(
+        id=ContentIdentifier(canonical_id=canonical_id, unique_id=canonical_id),
+        data=data,
+    )
+
+
+def _make_pdf_output(page_texts: list, separator: str = "\n\n---\n\n") -> dict:
+    return {
+        "pdf_output": {
+            "text": separator.join(page_texts),
+            "pages": [
+                {"page_number": i + 1, "text": text}
+                for i, text in enumerate(page_texts)
+            ],
+        }
+    }
+
+
+PARAGRAPHS = [
+    " ".join(f"p{p}w{w}" for w in range(12))
+    for p in range(10)
+]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_chunks_respect_chunk_size():
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={"chunk_size": 120, "chunk_overlap": 0, "min_chunk_size": 0},
+    )
+    text = "\n\n".join(PARAGRAPHS)
+    result = await executor.process_content_item(_make_content({"text": text}))
+
+    chunks = result.data["chunks"]
+    assert [c["chunk_index"] for c in chunks] == list(range(len(chunks)))
+    assert all(len(c["text"]) <= 120 for c in chunks)
+    assert " ".join(c["text"] for c in chunks).split() == text.split()
+    assert result.summary_data["chunks_created"] == len(chunks)
+    assert result.summary_data["chunking_method"] == "recursive"
+
+
+@pytest.mark.asyncio
+async def test_page_numbers_follow_chunk_position():
+    # Identical page texts: each chunk must map to the page it came from,
+    # not to the first page containing the same text
+    page_text = "\n\n".join(PARAGRAPHS[:3])
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={
+            "input_field": "pdf_output.text",
+            "chunk_size": 120,
+            "chunk_overlap": 0,
+            "min_chunk_size": 0,
+        },
+    )
+    result = await executor.process_content_item(_make_content(_make_pdf_output([page_text] * 3)))
+
+    chunks = result.data["chunks"]
+    per_page = len(chunks) // 3
+    assert [c["page_number"] for c in chunks] == [1] * per_page + [2] * per_page + [3] * per_page
+
+
+@pytest.mark.asyncio
+async def test_chunk_spanning_pages_lists_both():
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={
+            "input_field": "pdf_output.text",
+            "chunk_size": 1000,
+            "chunk_overlap": 0,
+            "min_chunk_size": 0,
+        },
+    )
+    result = await executor.process_content_item(_make_content(_make_pdf_output(PARAGRAPHS[:2])))
+
+    chunks = result.data["chunks"]
+    assert len(chunks) == 1
+    assert chunks[0]["metadata"]["page_numbers"] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_page_numbers_for_many_short_pages():
+    page_texts = [" ".join(f"w{n}x{w}" for w in range(30)) for n in range(1, 61)]
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={
+            "input_field": "pdf_output.text",
+            "chunk_size": 100,
+            "chunk_overlap": 0,
+            "min_chunk_size": 0,
+        },
+    )
+    result = await executor.process_content_item(_make_content(_make_pdf_output(page_texts, separator="\n\n")))
+
+    chunks = result.data["chunks"]
+    for chunk in chunks:
+        expected = sorted({int(word[1:].split("x")[0]) for word in chunk["text"].split()})
+        assert chunk["metadata"]["page_numbers"] == expected
+    assert chunks[-1]["page_number"] == 60
+
+
+@pytest.mark.asyncio
+async def test_page_located_by_fingerprint_when_text_differs():
+    # Page text differing after the first 100 chars still locates its page
+    page_texts = ["\n\n".join(PARAGRAPHS[p:p + 3]) for p in (0, 3, 6)]
+    data = _make_pdf_output(page_texts)
+    data["pdf_output"]["pages"][1]["text"] += " end"
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={
+            "input_field": "pdf_output.text",
+            "chunk_size": 120,
+            "chunk_overlap": 0,
+            "min_chunk_size": 0,
+        },
+    )
+    result = await executor.process_content_item(_make_content(data))
+
+    pages = {c["text"].split()[0]: c["page_number"] for c in result.data["chunks"]}
+    assert [pages[f"p{p}w0"] for p in range(9)] == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+
+
+@pytest.mark.asyncio
+async def test_small_chunks_merge_with_next():
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={"chunk_size": 64, "chunk_overlap": 0, "min_chunk_size": 30},
+    )
+    text = "\n\n".join([PARAGRAPHS[0], "tiny", PARAGRAPHS[1]])
+    result = await executor.process_content_item(_make_content({"text": text}))
+
+    chunks = result.data["chunks"]
+    assert [c["chunk_index"] for c in chunks] == list(range(len(chunks)))
+    merged = next(c for c in chunks if c["text"].startswith("tiny"))
+    assert merged["text"] == "tiny" + PARAGRAPHS[1]
+    assert merged["metadata"]["start_offset"] == text.index("tiny")
+    assert merged["metadata"]["end_offset"] == len(text)
+
+
+@pytest.mark.asyncio
+async def test_overlap_prefixes_previous_chunk_tail():
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={"chunk_size": 120, "chunk_overlap": 20, "min_chunk_size": 0},
+    )
+    result = await executor.process_content_item(_make_content({"text": "\n\n".join(PARAGRAPHS)}))
+
+    chunks = result.data["chunks"]
+    assert len(chunks) > 1
+    for previous, chunk in zip(chunks, chunks[1:]):
+        overlap = chunk["text"].split(" ", 1)[0]
+        assert overlap in previous["text"].split()[-3:]
+
+
+@pytest.mark.asyncio
+async def test_word_overlap_repeats_last_words():
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={"length_function": "words", "chunk_size": 20, "chunk_overlap": 3, "min_chunk_size": 0},
+    )
+    result = await executor.process_content_item(_make_content({"text": "\n\n".join(PARAGRAPHS)}))
+
+    chunks = result.data["chunks"]
+    assert len(chunks) > 1
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk["text"].split()[:3] == previous["text"].split()[-3:]
+
+
+@pytest.mark.asyncio
+async def test_metadata_offsets_locate_chunk_text():
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={"chunk_size": 120, "chunk_overlap": 20, "min_chunk_size": 0},
+    )
+    text = "\n\n".join(PARAGRAPHS)
+    result = await executor.process_content_item(_make_content({"text": text}))
+
+    for chunk in result.data["chunks"]:
+        metadata = chunk["metadata"]
+        own_text = text[metadata["start_offset"]:metadata["end_offset"]]
+        assert own_text and chunk["text"].endswith(own_text)
+
+
+@pytest.mark.asyncio
+async def test_unbreakable_text_is_cut_into_windows():
+    executor = RecursiveTextChunkerExecutor(
+        id="t",
+        settings={"length_function": "tokens", "chunk_size": 50, "chunk_overlap": 0, "min_chunk_size": 0},
+    )
+    text = "x" * 1000
+    result = await executor.process_content_item(_make_content({"text": text}))
+
+    chunks = result.data["chunks"]
+    assert all(len(c["text"]) // 4 <= 50 for c in chunks)
+    assert "".join(c["text"] for c in chunks) == text
+    assert chunks[0]["metadata"]["separator_used"] == ""
+
+
+@pytest.mark.asyncio
+async def test_short_text_is_single_chunk():
+    executor = RecursiveTextChunkerExecutor(id="t", settings={"min_chunk_size": 0})
+    result = await executor.process_content_item(_make_content({"text": "  Short note.\n"}))
+
+    chunks = result.data["chunks"]
+    assert [c["text"] for c in chunks] == ["Short note."]
+    assert chunks[0]["metadata"]["start_offset"] == 2
+    assert chunks[0]["metadata"]["split_level"] == 0
+
+
+@pytest.mark.asyncio
+async def test_split_workers_match_in_process():
+    settings = {"chunk_size": 120, "chunk_overlap": 20, "min_chunk_size": 0}
+    in_process = RecursiveTextChunkerExecutor(id="t", settings=settings)
+    pooled = RecursiveTextChunkerExecutor(id="t", settings={**settings, "split_workers": 2})
+    texts = ["\n\n".join(PARAGRAPHS[i:]) for i in range(4)]
+
+    expected = await in_process.process_input(
+        [_make_content({"text": t}, canonical_id=f"doc{i}") for i, t in enumerate(texts)], ctx=None
+    )
+    try:
+        result = await pooled.process_input(
+            [_make_content({"text": t}, canonical_id=f"doc{i}") for i, t in enumerate(texts)], ctx=None
+        )
+    finally:
+        shutdown_process_pools()
+
+    assert [r.data["chunks"] for r in result] == [e.data["chunks"] for e in expected]
+
+
+@pytest.mark.asyncio
+async def test_split_workers_share_one_pool_until_shutdown():
+    from contentflow.utils import process_pools
+
+    settings = {"chunk_size": 120, "chunk_overlap": 20, "min_chunk_size": 0, "split_workers": 1}
+    content = lambda: [_make_content({"text": "\n\n".join(PARAGRAPHS)}, canonical_id="doc")]
+    try:
+        # A rebuilt pipeline gets new executor instances with the same settings
+        await RecursiveTextChunkerExecutor(id="t", settings=settings).process_input(content(), ctx=None)
+        await RecursiveTextChunkerExecutor(id="t", settings=settings).process_input(content(), ctx=None)
+        assert len(process_pools._pools) == 1
+    finally:
+        shutdown_process_pools()
+    assert not process_pools._pools
+
+
+@pytest.mark.asyncio
+async def test_missing_text_raises():
+    executor = RecursiveTextChunkerExecutor(id="t", settings={})
+    with pytest.raises(ValueError):
+        await executor.process_content_item(_make_content({"other": "value"}))
@@ -0,0 +1,336 @@
+"""Unit tests for SentimentAnalysisExecutor."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from contentflow.executors import azure_openai_agent_executor as agent_executor
+from contentflow.models import Content, ContentIdentifier
+from contentflow.executors.sentiment_analysis_executor import SentimentAnalysisExecutor
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_content(text) -> Content:
+    return Content(
+        id=ContentIdentifier(canonical_id="test-sentiment", unique_id="test-sentiment"),
+        data={"text": text},
+    )
+
+
+def _make_executor(response_text: str, **settings) -> SentimentAnalysisExecutor:
+    executor = SentimentAnalysisExecutor(id="sentiment", settings=settings)
+
+    async def run_agent(query, options=None):
+        return response_text, None
+
+    executor._run_agent = run_agent
+    return executor
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_nested_json_response_is_parsed():
+    response = (
+        'Here is the analysis:\n'
+        '{"aspects": {"price": {"sentiment": "negative", "confidence": 0.8}}, '
+        '"overall": {"sentiment": "neutral", "confidence": 0.6}}'
+    )
+    executor = _make_executor(response, granularity="aspect", aspects=["price"])
+    result = await executor.process_content_item(_make_content("Too expensive, but it works."))
+
+    assert result.data["sentiment"]["aspects"]["price"]["sentiment"] == "negative"
+    assert result.data["sentiment"]["overall"]["confidence"] == 0.6
+    assert result.summary_data["agent_execution_status"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_braces_after_json_object_are_ignored():
+    response = (
+        '{"sentiment": "positive", "confidence": 0.9, "explanation": "upbeat"}\n'
+        'Note: the {customer} placeholder was left as-is.'
+    )
+    executor = _make_executor(response)
+    result = await executor.process_content_item(_make_content("Love it"))
+
+    assert result.data["sentiment"] == {"sentiment": "positive", "confidence": 0.9, "explanation": "upbeat"}
+
+
+@pytest.mark.asyncio
+async def test_malformed_json_keeps_raw_response(monkeypatch):
+    monkeypatch.setattr(agent_executor, "repair_json", None)
+    response = '{"sentiment": "positive", "confidence": }'
+    executor = _make_executor(response)
+    result = await executor.process_content_item(_make_content("Great!"))
+
+    assert result.data["sentiment"] == response
+
+
+@pytest.mark.asyncio
+async def test_truncated_json_is_repaired(monkeypatch):
+    monkeypatch.setattr(agent_executor, "repair_json", None)
+    response = 'Result: {"overall": {"sentiment": "positive", "confidence": 0.9}, "emotions": ["joy", "tr'
+    executor = _make_executor(response)
+    result = await executor.process_content_item(_make_content("Great!"))
+
+    assert result.data["sentiment"] == {
+        "overall": {"sentiment": "positive", "confidence": 0.9},
+        "emotions": ["joy", "tr"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_prompt_cache_key_follows_instructions():
+    first = SentimentAnalysisExecutor(id="a", settings={})
+    second = SentimentAnalysisExecutor(id="b", settings={})
+    other = SentimentAnalysisExecutor(id="c", settings={"granularity": "sentence"})
+    assert first.prompt_cache_key == second.prompt_cache_key != other.prompt_cache_key
+
+    class Agent:
+        async def run(self, messages, options):
+            self.options = options
+            return "{}"
+
+    first.agent = Agent()
+    await first._run_agent("text")
+    assert first.agent.options["store"] is False
+    assert first.agent.options["prompt_cache_key"] == first.prompt_cache_key
+
+
+@pytest.mark.asyncio
+async def test_structured_output_schema_follows_settings():
+    executor = SentimentAnalysisExecutor(
+        id="sentiment",
+        settings={
+            "granularity": "aspect", "aspects": ["price"], "scale": "5-point",
+            "include_emotions": True, "structured_output": True,
+        },
+    )
+
+    class Agent:
+        options = []
+
+        async def run(self, messages, options):
+            self.options.append(options)
+            if "### Item" in messages:
+                return '{"results": [{"overall": {"sentiment": "neutral"}}, {"overall": {"sentiment": "positive"}}]}'
+            return '{"overall": {"sentiment": "neutral"}}'
+
+    executor.agent = Agent()
+    await executor.process_content_item(_make_content("text"))
+    schema = Agent.options[0]["response_format"]["json_schema"]["schema"]
+    assert set(schema["required"]) == {"aspects", "overall", "emotions"}
+    assert schema["properties"]["aspects"]["required"] == ["price"]
+    assert "very negative" in schema["properties"]["overall"]["properties"]["sentiment"]["enum"]
+
+    executor.request_batch_size = 2
+    results = await executor.process_input([_make_content("a"), _make_content("b")], ctx=None)
+    batch_schema = Agent.options[1]["response_format"]["json_schema"]["schema"]
+    assert batch_schema["properties"]["results"]["items"] == schema
+    assert [r.data["sentiment"]["overall"]["sentiment"] for r in results] == ["neutral", "positive"]
+
+    # Opt-in, since deployments without structured output support reject it
+    plain = SentimentAnalysisExecutor(id="plain", settings={})
+    assert plain.response_format is None
+
+
+@pytest.mark.parametrize("granularity", ["aspect", "unknown"])
+def test_fallback_granularity_instructions_match_schema(granularity):
+    executor = SentimentAnalysisExecutor(
+        id="sentiment", settings={"granularity": granularity, "structured_output": True}
+    )
+
+    schema = executor.response_format["json_schema"]["schema"]
+    assert set(schema["required"]) == {"sentiment", "confidence", "explanation"}
+    assert "overall sentiment of the entire text" in executor.instructions
+    assert '"explanation"' in executor.instructions
+    assert '"aspects"' not in executor.instructions
+
+
+@pytest.mark.asyncio
+async def test_request_batch_scatters_array_response():
+    queries = []
+    executor = SentimentAnalysisExecutor(id="sentiment", settings={"request_batch_size": 3})
+
+    async def run_agent(query, options=None):
+        queries.append(query)
+        count = query.count("### Item")
+        return json.dumps([{"overall": {"sentiment": "positive", "index": i}} for i in range(count)]), None
+
+    executor._run_agent = run_agent
+    contents = [_make_content(f"text {i}") for i in range(5)]
+    results = await executor.process_input(contents, ctx=None)
+
+    assert len(queries) == 2
+    assert queries[0].endswith("### Item 3\ntext 2")
+    assert [r.data["sentiment"]["overall"]["index"] for r in results] == [0, 1, 2, 0, 1]
+    assert all(r.executor_logs[-1].status == "completed" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_request_batch_mismatch_falls_back_to_single_items():
+    queries = []
+    executor = SentimentAnalysisExecutor(id="sentiment", settings={"request_batch_size": 4})
+
+    async def run_agent(query, options=None):
+        queries.append(query)
+        if "### Item" in query:
+            return '[{"overall": {"sentiment": "positive"}}]', None
+        return '{"overall": {"sentiment": "negative"}}', None
+
+    executor._run_agent = run_agent
+    results = await executor.process_input([_make_content(f"text {i}") for i in range(3)], ctx=None)
+
+    assert len(queries) == 4
+    assert [r.data["sentiment"]["overall"]["sentiment"] for r in results] == ["negative"] * 3
+
+
+class _FakeBatchClient:
+    """Minimal stand-in for the files and batches APIs of AsyncAzureOpenAI."""
+
+    def __init__(self, statuses=("completed",)):
+        self.files = self
+        self.batches = self
+        self.uploaded = None
+        self.submitted = 0
+        self.polls = 0
+        self.statuses = list(statuses)
+
+    async def create(self, **kwargs):
+        if "purpose" in kwargs:
+            self.uploaded = kwargs["file"][1].decode("utf-8")
+            return SimpleNamespace(id="file-in")
+        self.submitted += 1
+        return SimpleNamespace(id="batch-1", status="validating")
+
+    async def retrieve(self, batch_id):
+        self.polls += 1
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return SimpleNamespace(id=batch_id, status=status, output_file_id="file-out", error_file_id="file-err")
+
+    async def content(self, file_id):
+        rows = [json.loads(line) for line in self.uploaded.splitlines()]
+        if file_id == "file-err":
+            row = rows[-1]
+            return SimpleNamespace(text=json.dumps({
+                "custom_id": row["custom_id"],
+                "response": {"status_code": 400, "body": {"error": "bad request"}},
+            }))
+        lines = []
+        for row in rows[:-1]:
+            text = row["body"]["messages"][1]["content"]
+            answer = json.dumps({"overall": {"sentiment": "positive", "text": text}})
+            lines.append(json.dumps({
+                "custom_id": row["custom_id"],
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": answer}}]}},
+            }))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+@pytest.mark.asyncio
+async def test_batch_execution_mode_collects_job_results():
+    executor = SentimentAnalysisExecutor(
+        id="sentiment", settings={"execution_mode": "batch", "batch_poll_seconds": 0}
+    )
+    client = _FakeBatchClient()
+    executor._chat_client = SimpleNamespace(client=client)
+    contents = [_make_content(f"text {i}") for i in range(3)]
+
+    results = await executor.process_input(contents, ctx=None)
+
+    assert client.polls == 1
+    assert [r.data.get("sentiment", {}).get("overall", {}).get("text") for r in results] == ["text 0", "text 1", None]
+    assert [r.executor_logs[-1].status for r in results] == ["completed", "completed", "failed"]
+    assert "bad request" in results[2].executor_logs[-1].errors[0]
+
+
+@pytest.mark.asyncio
+async def test_batch_execution_mode_leaves_running_jobs_pending_until_flushed():
+    executor = SentimentAnalysisExecutor(id="sentiment", settings={"execution_mode": "batch"})
+    client = _FakeBatchClient(statuses=["in_progress", "completed"])
+    executor._chat_client = SimpleNamespace(client=client)
+    contents = [_make_content(f"text {i}") for i in range(3)]
+
+    results = await executor.process_input(contents, ctx=None)
+
+    assert [r.data["sentiment_batch"] for r in results] == [
+        {"batch_id": "batch-1", "custom_id": f"item-{i}"} for i in range(3)
+    ]
+    assert [r.get_status() for r in results] == ["pending"] * 3
+
+    # A later run picks the job up from the stored reference instead of resubmitting
+    restarted = SentimentAnalysisExecutor(id="sentiment", settings={"execution_mode": "batch"})
+    restarted._chat_client = SimpleNamespace(client=client)
+    reloaded = [Content.model_validate(r.model_dump()) for r in results]
+    await restarted.process_input(reloaded, ctx=None)
+
+    assert client.submitted == 1
+    assert all("sentiment_batch" not in r.data for r in reloaded)
+    assert [r.data.get("sentiment", {}).get("overall", {}).get("text") for r in reloaded] == ["text 0", "text 1", None]
+    assert [[log.status for log in r.executor_logs] for r in reloaded] == [["completed"], ["completed"], ["failed"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_flush_waits_at_most_batch_wait_seconds():
+    executor = SentimentAnalysisExecutor(
+        id="sentiment",
+        settings={"execution_mode": "batch", "batch_poll_seconds": 0.01, "batch_wait_seconds": 0.05},
+    )
+    client = _FakeBatchClient(statuses=["in_progress"])
+    executor._chat_client = SimpleNamespace(client=client)
+
+    results = await executor.process_input([_make_content("text")], ctx=None)
+
+    assert client.polls > 1
+    assert results[0].data["sentiment_batch"]["batch_id"] == "batch-1"
+    assert results[0].get_status() == "pending"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_reuses_duplicate_inputs():
+    SentimentAnalysisExecutor._response_cache.clear()
+    executor = SentimentAnalysisExecutor(id="sentiment", settings={"response_cache_size": 8})
+
+    class Agent:
+        calls = []
+
+        async def run(self, messages, options):
+            self.calls.append(messages)
+            await asyncio.sleep(0)
+            return f'{{"overall": {{"sentiment": "positive", "text": "{messages}"}}}}'
+
+    executor.agent = Agent()
+    contents = [_make_content(text) for text in ["same", "same", "other", "same"]]
+    results = await executor.process_input(contents, ctx=None)
+
+    assert sorted(Agent.calls) == ["other", "same"]
+    assert [r.data["sentiment"]["overall"]["text"] for r in results] == ["same", "same", "other", "same"]
+
+    # Different instructions never share entries
+    other = SentimentAnalysisExecutor(id="s2", settings={"response_cache_size": 8, "granularity": "sentence"})
+    other.agent = executor.agent
+    await other.process_content_item(_make_content("same"))
+    assert Agent.calls.count("same") == 2
+    SentimentAnalysisExecutor._response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_batched_request_scales_max_tokens():
+    executor = SentimentAnalysisExecutor(id="sentiment", settings={"request_batch_size": 3, "max_tokens": 100})
+    seen = []
+
+    async def run_agent(query, options=None):
+        seen.append(options)
+        return json.dumps([{"overall": {}}] * query.count("### Item")), None
+
+    executor._run_agent = run_agent
+    await executor.process_input([_make_content(f"text {i}") for i in range(3)], ctx=None)
+
+    assert seen[0]["max_tokens"] == 300
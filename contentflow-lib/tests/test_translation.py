@@ -0,0 +1,176 @@
+"""Unit tests for TranslationExecutor."""
+
+import json
+
+import pytest
+
+from contentflow.models import Content, ContentIdentifier
+from contentflow.executors.translation_executor import TranslationExecutor
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_content(data: dict, canonical_id: str = "test-translation") -> Content:
+    return Content(
+        id=ContentIdentifier(canonical_id=canonical_id, unique_id=canonical_id),
+        data=data,
+    )
+
+
+def _make_executor(**settings) -> TranslationExecutor:
+    executor = TranslationExecutor(id="translator", settings={"target_language": "French", **settings})
+    executor.queries = []
+
+    async def run_agent(query, options=None):
+        executor.queries.append(query)
+        return f"fr:{query}", None
+
+    executor._run_agent = run_agent
+    return executor
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_text_is_translated():
+    executor = _make_executor(include_source=True)
+    result = await executor.process_content_item(_make_content({"text": "Hello"}))
+
+    assert result.data["translated_text"] == "fr:Hello"
+    assert result.data["translated_text_source"] == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_blank_text_skips_agent():
+    executor = _make_executor()
+    result = await executor.process_content_item(_make_content({"text": "  \n"}))
+
+    assert result.data["translated_text"] == "  \n"
+    assert executor.queries == []
+
+
+@pytest.mark.asyncio
+async def test_same_language_skips_agent():
+    executor = _make_executor(source_language="french")
+    result = await executor.process_content_item(_make_content({"text": "Bonjour"}))
+
+    assert result.data["translated_text"] == "Bonjour"
+    assert executor.queries == []
+
+
+@pytest.mark.asyncio
+async def test_detected_language_field_overrides_source_language():
+    executor = _make_executor(
+        source_language="English",
+        source_language_field="language.language",
+        request_batch_size=4,
+    )
+    contents = [
+        _make_content({"text": "Bonjour", "language": {"language": "French"}}, canonical_id="fr"),
+        _make_content({"text": "Hello", "language": {"language": "English"}}, canonical_id="en"),
+        _make_content({"text": "Hi"}, canonical_id="default"),
+    ]
+
+    async def run_agent(query, options=None):
+        executor.queries.append(query)
+        return '["fr:Hello", "fr:Hi"]', None
+
+    executor._run_agent = run_agent
+    results = await executor.process_input(contents, ctx=None)
+
+    assert [r.data["translated_text"] for r in results] == ["Bonjour", "fr:Hello", "fr:Hi"]
+    assert len(executor.queries) == 1 and "Bonjour" not in executor.queries[0]
+
+
+def test_glossary_order_does_not_change_instructions():
+    first = TranslationExecutor(id="a", settings={"target_language": "French", "glossary": {"cloud": "nuage", "app": "appli"}})
+    second = TranslationExecutor(id="b", settings={"target_language": "French", "glossary": {"app": "appli", "cloud": "nuage"}})
+
+    assert first.instructions is second.instructions
+    assert first.prompt_cache_key == second.prompt_cache_key
+    assert first.instructions.index("'app'") < first.instructions.index("'cloud'")
+
+
+@pytest.mark.asyncio
+async def test_preserved_terms_are_masked_and_restored():
+    executor = _make_executor(preserve_terminology=["ACME", "ACME Cloud"])
+    result = await executor.process_content_item(_make_content({"text": "ACME Cloud by ACME, not ACMEs"}))
+
+    assert "ACME" not in executor.queries[0].replace("ACMEs", "")
+    assert result.data["translated_text"] == "fr:ACME Cloud by ACME, not ACMEs"
+    assert "ACME" not in executor.instructions
+
+
+@pytest.mark.asyncio
+async def test_formatting_is_kept_out_of_the_request():
+    executor = _make_executor()
+
+    async def run_agent(query, options=None):
+        executor.queries.append(query)
+        return json.dumps([f"fr:{segment}" for segment in json.loads(query)]), None
+
+    executor._run_agent = run_agent
+    text = "# Title\n\nIntro line.\n- first\n- second\n\n```\ncode = 1\n```\nEnd"
+    result = await executor.process_content_item(_make_content({"text": text}))
+
+    assert json.loads(executor.queries[0]) == ["Title", "Intro line.", "first", "second", "End"]
+    assert result.data["translated_text"] == (
+        "# fr:Title\n\nfr:Intro line.\n- fr:first\n- fr:second\n\n```\ncode = 1\n```\nfr:End"
+    )
+
+
+@pytest.mark.asyncio
+async def test_formatted_text_in_target_language_is_unchanged():
+    executor = _make_executor(source_language="French")
+    text = "# Titre\n\n- un\n- deux"
+    result = await executor.process_content_item(_make_content({"text": text}))
+
+    assert result.data["translated_text"] == text
+    assert executor.queries == []
+
+
+@pytest.mark.asyncio
+async def test_segment_count_mismatch_retries_unsegmented():
+    executor = _make_executor(preserve_terminology=["ACME"])
+
+    async def run_agent(query, options=None):
+        executor.queries.append(query)
+        if query.startswith("["):
+            # One segment short
+            return json.dumps([f"fr:{segment}" for segment in json.loads(query)[:-1]]), None
+        return f"fr:{query}", None
+
+    executor._run_agent = run_agent
+    content = _make_content({"text": "Hello ACME.\n\nWorld."})
+    result = await executor.process_content_item(content)
+
+    assert len(executor.queries) == 2
+    assert "ACME" not in executor.queries[1]
+    assert result.data["translated_text"] == "fr:Hello ACME.\n\nWorld."
+
+
+@pytest.mark.asyncio
+async def test_segment_count_mismatch_in_batch_is_retried_alone():
+    executor = _make_executor(request_batch_size=2)
+
+    async def run_agent(query, options=None):
+        executor.queries.append(query)
+        if options is not None:
+            # One item's translation comes back a segment short
+            return json.dumps([json.dumps(["fr:Hello."]), json.dumps(["fr:Bye"])]), None
+        return json.dumps([f"fr:{segment}" for segment in json.loads(query)]), None
+
+    executor._run_agent = run_agent
+    contents = [
+        _make_content({"text": "Hello.\n\nWorld."}, canonical_id="a"),
+        _make_content({"text": "Bye\n\n"}, canonical_id="b"),
+    ]
+    await executor.process_input(contents, ctx=None)
+
+    assert contents[0].data["translated_text"] == "fr:Hello.\n\nfr:World."
+    assert contents[1].data["translated_text"] == "fr:Bye\n\n"
+    assert len(executor.queries) == 2
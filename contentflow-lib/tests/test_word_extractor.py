@@ -0,0 +1,256 @@
+"""Unit tests for WordExtractorExecutor."""
+
+import base64
+import io
+
+import pymupdf
+import pytest
+from docx import Document
+
+from contentflow.models import Content, ContentIdentifier
+from contentflow.executors import word_extractor
+from contentflow.executors.word_extractor import WordExtractorExecutor
+from contentflow.utils.process_pools import shutdown_process_pools
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_content(data: dict, canonical_id: str = "test-docx") -> Content:
+    return Content(
+        id=ContentIdentifier(canonical_id=canonical_id, unique_id=canonical_id),
+        data=data,
+    )
+
+
+def _make_docx() -> bytes:
+    doc = Document()
+    doc.core_properties.title = "Report"
+    doc.add_heading("Introduction", level=1)
+    doc.add_paragraph("First paragraph.")
+    doc.add_paragraph("")
+    table = doc.add_table(rows=2, cols=2)
+    for r in range(2):
+        for c in range(2):
+            table.cell(r, c).text = f"r{r}c{c}"
+    paragraph = doc.add_paragraph("Tab")
+    run = paragraph.add_run("\tand break")
+    run.add_break()
+    paragraph.add_run("after")
+    doc.add_paragraph("Quoted.", style="Quote")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_basic_word_extraction():
+    executor = WordExtractorExecutor(
+        id="t", settings={"content_field": "content", "extract_properties": True}
+    )
+    result = await executor.process_content_item(_make_content({"content": _make_docx()}))
+
+    out = result.data["word_output"]
+    assert out["text"] == "Introduction\nFirst paragraph.\nTab\tand break\nafter\nQuoted."
+    assert [p["paragraph_number"] for p in out["paragraphs"]] == [1, 2, 4, 5]
+    assert [p["style"] for p in out["paragraphs"]] == ["Heading 1", "Normal", "Normal", "Quote"]
+    assert out["tables"][0]["data"] == [["r0c0", "r0c1"], ["r1c0", "r1c1"]]
+    assert out["properties"]["title"] == "Report"
+    assert result.summary_data["paragraphs_processed"] == 4
+    assert result.summary_data["tables_extracted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_streamed_paragraphs_match_document_model(monkeypatch):
+    settings = {
+        "content_field": "content",
+        "extract_tables": False,
+        "include_empty_paragraphs": True,
+    }
+    executor = WordExtractorExecutor(id="t", settings=settings)
+    streamed = await executor.process_content_item(_make_content({"content": _make_docx()}))
+
+    def fail_stream(*args):
+        raise AssertionError("stream unavailable")
+
+    monkeypatch.setattr(word_extractor, "_fast_iter_paragraphs", fail_stream)
+    expected = await executor.process_content_item(_make_content({"content": _make_docx()}))
+
+    assert streamed.data["word_output"] == expected.data["word_output"]
+    assert streamed.summary_data == expected.summary_data
+
+
+@pytest.mark.asyncio
+async def test_temp_file_path(tmp_path):
+    path = tmp_path / "doc.docx"
+    path.write_bytes(_make_docx())
+    executor = WordExtractorExecutor(id="t", settings={"extract_tables": False})
+    result = await executor.process_content_item(_make_content({"temp_file_path": str(path)}))
+
+    assert result.data["word_output"]["text"].startswith("Introduction\nFirst paragraph.")
+
+
+@pytest.mark.asyncio
+async def test_invalid_document_is_flagged():
+    executor = WordExtractorExecutor(id="t", settings={"content_field": "content", "extract_tables": False})
+    result = await executor.process_content_item(_make_content({"content": b"not a docx"}))
+
+    assert "word_output" not in result.data
+    assert result.summary_data["word_extraction_status"] == "invalid_file"
+
+
+@pytest.mark.asyncio
+async def test_missing_content_raises():
+    executor = WordExtractorExecutor(id="t", settings={"content_field": "content"})
+    with pytest.raises(ValueError):
+        await executor.process_content_item(_make_content({"other": 1}))
+
+
+@pytest.mark.asyncio
+async def test_process_workers_match_in_process():
+    settings = {"content_field": "content", "extract_properties": True}
+    in_process = WordExtractorExecutor(id="t", settings=settings)
+    pooled = WordExtractorExecutor(id="t", settings={**settings, "process_workers": 2})
+    payloads = [_make_docx(), bytearray(_make_docx()), b"not a docx"]
+
+    expected = await in_process.process_input(
+        [_make_content({"content": p}, canonical_id=f"doc{i}") for i, p in enumerate(payloads)], ctx=None
+    )
+    try:
+        result = await pooled.process_input(
+            [_make_content({"content": p}, canonical_id=f"doc{i}") for i, p in enumerate(payloads)], ctx=None
+        )
+    finally:
+        shutdown_process_pools()
+
+    assert [r.data.get("word_output") for r in result] == [e.data.get("word_output") for e in expected]
+    assert [r.summary_data for r in result] == [e.summary_data for e in expected]
+
+
+@pytest.mark.asyncio
+async def test_columns_paragraphs_layout():
+    records = WordExtractorExecutor(id="r", settings={"content_field": "content"})
+    columns = WordExtractorExecutor(id="c", settings={"content_field": "content", "paragraphs_layout": "columns"})
+
+    expected = await records.process_content_item(_make_content({"content": _make_docx()}))
+    result = await columns.process_content_item(_make_content({"content": _make_docx()}))
+    paragraphs = expected.data["word_output"]["paragraphs"]
+
+    assert result.data["word_output"]["paragraphs"] == {key: [p[key] for p in paragraphs] for key in paragraphs[0]}
+    assert result.data["word_output"]["text"] == expected.data["word_output"]["text"]
+    assert result.summary_data == expected.summary_data
+
+
+def test_invalid_paragraphs_layout():
+    with pytest.raises(ValueError):
+        WordExtractorExecutor(id="t", settings={"paragraphs_layout": "soa"})
+
+
+@pytest.mark.asyncio
+async def test_merged_table_cells_repeat_like_python_docx():
+    doc = Document()
+    table = doc.add_table(rows=3, cols=3)
+    for r in range(3):
+        for c in range(3):
+            table.cell(r, c).text = f"r{r}c{c}"
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    table.cell(1, 0).add_table(rows=1, cols=1).cell(0, 0).text = "nested"
+    buffer = io.BytesIO()
+    doc.save(buffer)
+
+    executor = WordExtractorExecutor(id="t", settings={"content_field": "content"})
+    result = await executor.process_content_item(_make_content({"content": buffer.getvalue()}))
+
+    expected = [[cell.text for cell in row.cells] for row in Document(io.BytesIO(buffer.getvalue())).tables[0].rows]
+    tables = result.data["word_output"]["tables"]
+    assert len(tables) == 1
+    assert tables[0]["data"] == expected
+    assert tables[0]["data"][0][:2] == ["r0c0\nr0c1"] * 2
+    assert tables[0]["data"][2][2] == tables[0]["data"][1][2]
+    assert (tables[0]["rows"], tables[0]["columns"]) == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_image_extraction(tmp_path):
+    pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 20, 20), False)
+    pix.clear_with(120)
+    image_path = tmp_path / "pixel.png"
+    pix.save(str(image_path))
+
+    doc = Document()
+    doc.add_picture(str(image_path))
+    doc.add_picture(str(image_path))
+    buffer = io.BytesIO()
+    doc.save(buffer)
+
+    for mode in ("base64", "bytes"):
+        executor = WordExtractorExecutor(
+            id="t",
+            settings={"content_field": "content", "extract_images": True, "image_output_mode": mode},
+        )
+        result = await executor.process_content_item(_make_content({"content": buffer.getvalue()}))
+
+        images = result.data["word_output"]["images"]
+        assert len(images) == 1
+        data = base64.b64decode(images[0]["data"]) if mode == "base64" else images[0]["data"]
+        assert data == image_path.read_bytes()
+        assert images[0]["format"] == "png"
+        assert images[0]["size_bytes"] == len(data)
+
+
+@pytest.mark.asyncio
+async def test_text_only_extraction():
+    full = WordExtractorExecutor(id="f", settings={"content_field": "content"})
+    text_only = WordExtractorExecutor(
+        id="t", settings={"content_field": "content", "extract_paragraphs": False, "extract_tables": False}
+    )
+
+    expected = await full.process_content_item(_make_content({"content": _make_docx()}))
+    result = await text_only.process_content_item(_make_content({"content": _make_docx()}))
+
+    assert result.data["word_output"] == {"text": expected.data["word_output"]["text"]}
+    assert result.summary_data["paragraphs_processed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_temp_file_is_flagged(tmp_path):
+    executor = WordExtractorExecutor(id="t", settings={})
+    result = await executor.process_content_item(
+        _make_content({"temp_file_path": str(tmp_path / "missing.docx")})
+    )
+
+    assert "word_output" not in result.data
+    assert result.summary_data["word_extraction_status"] == "invalid_file"
+
+
+@pytest.mark.asyncio
+async def test_nothing_to_extract_skips_document():
+    flags = ("extract_text", "extract_paragraphs", "extract_tables", "extract_properties", "extract_images")
+    executor = WordExtractorExecutor(id="t", settings={"content_field": "content", **dict.fromkeys(flags, False)})
+    result = await executor.process_content_item(_make_content({"content": b"never parsed"}))
+
+    assert result.data["word_output"] == {}
+    assert result.summary_data["extraction_status"] == "success"
+    assert result.summary_data["paragraphs_processed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tables_only_skips_paragraphs(monkeypatch):
+    def fail_paragraphs(*args):
+        raise AssertionError("paragraphs should not be read")
+
+    monkeypatch.setattr(word_extractor, "_iter_document_paragraphs", fail_paragraphs)
+    monkeypatch.setattr(word_extractor, "_fast_iter_paragraphs", fail_paragraphs)
+    executor = WordExtractorExecutor(
+        id="t", settings={"content_field": "content", "extract_text": False, "extract_paragraphs": False}
+    )
+    result = await executor.process_content_item(_make_content({"content": _make_docx()}))
+
+    assert list(result.data["word_output"]) == ["tables"]
+    assert result.summary_data["tables_extracted"] == 1